@@ -0,0 +1,149 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures the memory the cache needs for the rendered pages of PDF documents.
+
+Usage: python benchmark/compact.py [-w width] file.pdf ...
+
+Renders every page at the given width in pixels (default 1200), with the
+render options of the cache, and reports the bytes per page of the image as
+rendered by Poppler and in a compact 8-bit format (see compact() below), and
+how many pages fit in a 100 MB cache.
+
+It also reports the milliseconds per page needed to convert the image to the
+compact format, and to paint the image as rendered and in the compact format
+on a 32-bit image, like a View paints the cached images on the screen.
+
+The cache does not use the compact format; this measures whether it should.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+import sip
+sip.setapi("QString", 2)
+sip.setapi("QVariant", 2)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import popplerqt4
+from PyQt4.QtGui import QApplication, QImage, QPainter, qRgb
+
+from qpopplerview import cache
+
+
+def compact(image):
+    """Returns the image in a more compact format if that does not change it.
+    
+    Images with only gray pixels, like the (antialiased) black and white pages
+    of most scores, are converted to 8-bit indexed images with a grayscale
+    color table, that take a quarter of the memory. Other images, e.g. with
+    color pictures or on a colored paper, are returned unchanged.
+    
+    The image is assumed to be opaque, like the images Poppler renders. Only
+    QImage.allGray() scans the pixels, it stops at the first colored pixel.
+    
+    """
+    if image.isNull() or image.depth() != 32 or not image.allGray():
+        return image
+    width, height = image.width(), image.height()
+    data = image.constBits().asstring(image.bytesPerLine() * height)
+    # in a gray pixel the three color bytes are equal, the second one is a
+    # color byte on little and big endian machines
+    indexed = QImage(data[1::4], width, height, width, QImage.Format_Indexed8).copy()
+    indexed.setColorTable(_grays)
+    return indexed
+
+
+_grays = [qRgb(i, i, i) for i in range(256)]
+
+
+def measure(filename, width):
+    """Yields the sizes and times for the pages of the PDF file.
+    
+    Every item is a tuple (full, compact, convert, paintfull, paintcompact),
+    the byte counts of the image and of the compact image, the time needed to
+    convert it and the times needed to paint both images.
+    
+    """
+    document = popplerqt4.Poppler.Document.load(filename)
+    cache.options().write(document)
+    for num in range(document.numPages()):
+        page = document.page(num)
+        dpi = 72.0 * width / page.pageSize().width()
+        image = page.renderToImage(dpi, dpi)
+        start = time.time()
+        small = compact(image)
+        convert = time.time() - start
+        yield (image.byteCount(), small.byteCount(), convert,
+               paint(image), paint(small))
+
+
+def paint(image, count=10):
+    """Returns the time in seconds needed to paint the image, on average."""
+    target = QImage(image.size(), QImage.Format_ARGB32_Premultiplied)
+    painter = QPainter(target)
+    start = time.time()
+    for i in range(count):
+        painter.drawImage(0, 0, image)
+    painter.end()
+    return (time.time() - start) / count
+
+
+def main():
+    args = sys.argv[1:]
+    width = 1200
+    if args[:1] == ['-w']:
+        width = int(args[1])
+        del args[:2]
+    if not args:
+        sys.exit(__doc__)
+    a = QApplication([])
+    print("{0:30} {1:>6} {2:>10} {3:>10} {4:>6} {5:>8} {6:>8} {7:>8}".format(
+        "document", "pages", "bytes/page", "compact", "ratio",
+        "convert", "paint", "paintcmp"))
+    totals = [0] * 5
+    pages = 0
+    for filename in args:
+        results = list(measure(filename, width))
+        if not results:
+            continue
+        sums = [sum(column) for column in zip(*results)]
+        n = len(results)
+        print("{0:30} {1:6} {2:10} {3:10} {4:6.2f} {5:8.2f} {6:8.2f} {7:8.2f}".format(
+            os.path.basename(filename)[-30:], n, sums[0] // n, sums[1] // n,
+            float(sums[0]) / sums[1], sums[2] * 1000 / n, sums[3] * 1000 / n,
+            sums[4] * 1000 / n))
+        pages += n
+        totals = [t + s for t, s in zip(totals, sums)]
+    if pages:
+        print("pages in 100 MB: {0} rendered, {1} compact".format(
+            104857600 * pages // totals[0], 104857600 * pages // totals[1]))
+        print("ms per page: convert {0:.2f}, paint {1:.2f}, paint compact {2:.2f}".format(
+            totals[2] * 1000 / pages, totals[3] * 1000 / pages, totals[4] * 1000 / pages))
+
+if __name__ == '__main__':
+    main()
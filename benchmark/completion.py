@@ -0,0 +1,108 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures finding completions in a PrefixIndex.
+
+Usage: python benchmark/completion.py [count]
+
+Builds an index with the words of ly.words and ly.data, and one with count
+(default 20000) generated document words with random weights. Then searches
+both with every prefix of one, two and three characters of all words, and
+with abbreviations of the words (their first character and capitals), and
+reports the mean and the slowest times.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import ly.data
+import ly.words
+
+from autocomplete import prefixindex
+
+
+def static_words():
+    """Returns the set of words from ly.words and ly.data."""
+    words = set()
+    for name in dir(ly.words):
+        value = getattr(ly.words, name)
+        if isinstance(value, (tuple, list, set, frozenset)):
+            words.update(w for w in value if isinstance(w, type('')))
+    words.update(ly.data.grobs())
+    words.update(ly.data.all_grob_properties())
+    words.update(ly.data.context_properties())
+    words.update(ly.data.engravers())
+    return words
+
+
+def document_words(count):
+    """Returns a dict with count random words and weights."""
+    random.seed(0)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = {}
+    while len(words) < count:
+        word = ''.join(random.choice(letters) for i in range(random.randint(3, 12)))
+        words[word] = random.randint(1, 20)
+    return words
+
+
+def measure(indexes, queries, limit=32):
+    """Searches all queries, returns the sorted list of times in milliseconds.
+    
+    Every search returns at most limit words, like the Completer does.
+    
+    """
+    times = []
+    for q in queries:
+        start = time.time()
+        prefixindex.search(q, indexes, limit)
+        times.append((time.time() - start) * 1000)
+    times.sort()
+    return times
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    words = static_words()
+    indexes = [prefixindex.PrefixIndex(words),
+               prefixindex.PrefixIndex(document_words(count))]
+    prefixes = sorted(set(w[:n] for w in words for n in (1, 2, 3)))
+    abbreviations = sorted(set(w[0] + ''.join(re.findall('[A-Z]', w)) for w in words))
+    print("{0} + {1} words".format(*map(len, indexes)))
+    print("{0:14} {1:>8} {2:>10} {3:>10} {4:>10}".format(
+        "queries", "count", "mean ms", "p99 ms", "max ms"))
+    for name, queries in (("prefixes", prefixes), ("abbreviations", abbreviations)):
+        times = measure(indexes, queries)
+        print("{0:14} {1:8} {2:10.3f} {3:10.3f} {4:10.3f}".format(name, len(times),
+            sum(times) / len(times), times[len(times) * 99 // 100], times[-1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Helpers to get the texts used by the benchmarks.
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+import ly.lex
+
+
+def generate(lines=50000):
+    """Returns a LilyPond document with the given number of lines."""
+    chunk = [
+        r'\version "2.16.0"',
+        r"music = \relative c'' {",
+        r"  c4\p d8( e) f4-. g | a2\< b4 c\! |",
+        r'  \markup { \bold { \italic { \column { "a" \line { "b" #(+ 1 2) } } } } }',
+        r"  #(define (f x) (if (> x 0) (list x #{ c'4 d #}) '()))",
+        r"  \override Staff.TimeSignature #'stencil = ##f",
+        r"  <c e g>2 r4 s4 % a comment",
+        r"}",
+        r"\new Lyrics \lyricmode { la -- la __ _ lu }",
+        r"",
+    ]
+    result = []
+    while len(result) < lines:
+        result.extend(chunk)
+    return '\n'.join(result[:lines])
+
+
+# the directory with the sample texts
+samples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'samples')
+
+
+def read(filename):
+    """Returns the text of the file, decoded from UTF-8."""
+    with open(filename, 'rb') as f:
+        return f.read().decode('utf-8', 'replace')
+
+
+def sample(mode, lines=2000):
+    """Returns a text in the given mode with (approximately) the number of lines.
+    
+    The text consists of the sample text of the mode, repeated. The sample
+    texts are in the samples directory, named after the mode.
+    
+    """
+    text = read(os.path.join(samples_dir, mode + ly.lex.extensions[mode]))
+    count = text.count('\n')
+    return text * max(1, lines // count)
+
+
+def nested_scheme(depth=200, lines=2000):
+    """Returns a Scheme text with expressions nested depth levels deep."""
+    result = []
+    while len(result) < lines:
+        block = ["  " * i + "(list {0} 'sym \"str\"".format(i) for i in range(depth)]
+        block[-1] += ")" * depth
+        result.extend(block)
+    return '\n'.join(result) + '\n'
+
+
+def bundle():
+    """Returns a list of (name, mode, text) tuples: the corpus of the benchmarks.
+    
+    The corpus has small and huge LilyPond texts, deeply nested Scheme, and
+    texts in all other modes.
+    
+    """
+    return [
+        ('lilypond-small', 'lilypond', sample('lilypond', 1)),
+        ('lilypond-huge', 'lilypond', generate(50000)),
+        ('scheme-nested', 'scheme', nested_scheme()),
+        ('scheme', 'scheme', sample('scheme')),
+        ('html', 'html', sample('html')),
+        ('latex', 'latex', sample('latex')),
+        ('texinfo', 'texinfo', sample('texinfo')),
+        ('docbook', 'docbook', sample('docbook')),
+    ]
+
+
+def files(paths):
+    """Yields the file names for the given files and directories.
+    
+    Directories are searched for .ly, .ily and .lytex files.
+    
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith(('.ly', '.ily', '.lytex')):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def texts(paths, lines=50000):
+    """Yields the texts of the given files and directories.
+    
+    If paths is empty, a generated LilyPond document is yielded with the
+    given number of lines.
+    
+    """
+    if not paths:
+        yield generate(lines)
+    for filename in files(paths):
+        yield read(filename)
+
+
+def project(directory, count=2000, lines=300):
+    """Writes a tree of LilyPond files to directory and returns their names.
+    
+    Of every ten files, one is a .ly file including the nine .ily files
+    written before it. All files start with a \\version command and have
+    approximately the number of lines.
+    
+    """
+    names = []
+    body = sample('lilypond', lines).split('\n', 1)[1]
+    for i in range(count):
+        subdir = os.path.join(directory, 'part{0:03}'.format(i // 100))
+        if not os.path.isdir(subdir):
+            os.makedirs(subdir)
+        if i % 10 == 9:
+            name = os.path.join(subdir, 'score{0:04}.ly'.format(i))
+            includes = ''.join('\\include "{0}"\n'.format(os.path.basename(n))
+                               for n in names[-9:])
+        else:
+            name = os.path.join(subdir, 'part{0:04}.ily'.format(i))
+            includes = ''
+        with open(name, 'wb') as f:
+            f.write(('\\version "2.16.0"\n' + includes + body).encode('utf-8'))
+        names.append(name)
+    return names
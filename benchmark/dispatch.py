@@ -0,0 +1,119 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Compares the tokenizer with and without first-character dispatch.
+
+Usage: python benchmark/dispatch.py [lines]
+
+For every mode a sample text is tokenized line by line: first with the
+Parsers as they are (with their own dispatch setting), then with dispatch
+disabled and enabled for all Parsers (see slexer.enableDispatch()). The token
+streams (class, position and text of every token) are compared, and the
+throughput of the three configurations is reported.
+
+Does not need Qt.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import slexer
+import ly.lex
+
+import corpus
+
+
+def tokenize(mode, lines, repeat=3):
+    """Returns the tokens of all lines as (class, pos, text) tuples, and the time.
+    
+    The lines are tokenized once to compile the patterns, the best time of
+    repeat runs is returned. The garbage collector is disabled meanwhile.
+    
+    """
+    best = None
+    gc.disable()
+    try:
+        for i in range(repeat + 1):
+            state = ly.lex.state(mode)
+            start = time.time()
+            result = [[(type(t), t.pos, t) for t in state.tokens(line)] for line in lines]
+            duration = time.time() - start
+            if i and (best is None or duration < best):
+                best = duration
+    finally:
+        gc.enable()
+    return result, best
+
+
+def parsers():
+    """Returns all Parser classes."""
+    result = []
+    todo = [slexer.Parser]
+    while todo:
+        cls = todo.pop()
+        if cls not in result:
+            result.append(cls)
+            todo.extend(cls.__subclasses__())
+    return result
+
+
+def enableDispatch(enable):
+    """Enables or disables dispatch for all Parsers."""
+    for cls in parsers():
+        slexer.enableDispatch(cls, enable)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    samples = [(mode, corpus.sample(mode, count).splitlines())
+               for mode in sorted(ly.lex.modes)]
+    results = []
+    for mode, lines in samples:
+        results.append(tokenize(mode, lines))
+    enableDispatch(False)
+    for i, (mode, lines) in enumerate(samples):
+        results[i] += tokenize(mode, lines)
+    enableDispatch(True)
+    for i, (mode, lines) in enumerate(samples):
+        results[i] += tokenize(mode, lines)
+    failed = False
+    print("{0:10} {1:>8} {2:>12} {3:>12} {4:>12}  {5}".format(
+        "mode", "tokens", "default/s", "pattern/s", "dispatch/s", "result"))
+    for (mode, lines), (default, t1, pattern, t2, dispatch, t3) in zip(samples, results):
+        tokens = sum(map(len, default))
+        same = default == pattern == dispatch
+        failed = failed or not same
+        print("{0:10} {1:8} {2:12.0f} {3:12.0f} {4:12.0f}  {5}".format(
+            mode, tokens, tokens / t1, tokens / t2, tokens / t3,
+            "ok" if same else "DIFFERENT"))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
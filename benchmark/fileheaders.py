@@ -0,0 +1,98 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures reading the mode and version of many files.
+
+Usage: python benchmark/fileheaders.py [directory ...]
+
+Reads the mode and the LilyPond version of all .ly, .ily and .lytex files in
+the given directories, using fileinfo.scanmode() and fileinfo.scanversion(),
+once reading the whole file and once only the start of it. The results of
+both ways are compared. For reference, also the time is reported of decoding
+every file and tokenizing it completely, which is what fileinfo used to do.
+
+Without arguments, a tree of 2000 files is generated in a temporary
+directory.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import fileinfo
+import ly.lex
+import util
+
+import corpus
+
+
+def scan(filenames, prefix):
+    """Returns the list of (mode, version) of the files, and the time."""
+    start = time.time()
+    result = [(fileinfo.scanmode(f, prefix), fileinfo.scanversion(f, prefix))
+              for f in filenames]
+    return result, time.time() - start
+
+
+def tokenize(filenames):
+    """Decodes and tokenizes every file completely, returns the time."""
+    start = time.time()
+    for filename in filenames:
+        with open(filename, 'rb') as f:
+            text = util.decode(f.read())
+        list(ly.lex.state(fileinfo.textmode(text)).tokens(text))
+    return time.time() - start
+
+
+def main():
+    tempdir = None
+    if len(sys.argv) > 1:
+        filenames = list(corpus.files(sys.argv[1:]))
+    else:
+        tempdir = tempfile.mkdtemp()
+        filenames = corpus.project(tempdir, lines=1000)
+    try:
+        t0 = tokenize(filenames)
+        full, t1 = scan(filenames, False)
+        prefix, t2 = scan(filenames, True)
+    finally:
+        if tempdir:
+            shutil.rmtree(tempdir)
+    different = sum(a != b for a, b in zip(full, prefix))
+    print("{0} files".format(len(filenames)))
+    print("{0:8} {1:>10} {2:>12}".format("read", "seconds", "files/s"))
+    print("{0:8} {1:10.3f} {2:12.0f}".format("tokenize", t0, len(filenames) / t0))
+    print("{0:8} {1:10.3f} {2:12.0f}".format("full", t1, len(filenames) / t1))
+    print("{0:8} {1:10.3f} {2:12.0f}".format("prefix", t2, len(filenames) / t2))
+    print("speedup: {0:.1f}x, differences: {1}".format(t1 / t2, different))
+    sys.exit(1 if different else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Benchmarks a full rehighlight of a large LilyPond document.
+
+Usage: python benchmark/highlight.py [file.ly]
+
+If no file is given, a LilyPond document of 50000 lines is generated, with
+many nested markup and scheme constructs, so that the highlighter has to deal
+with a lot of different parser states.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+import sip
+sip.setapi("QString", 2)
+sip.setapi("QVariant", 2)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import app
+import document
+import highlighter
+import util
+
+import corpus
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            text = util.decode(f.read())
+    else:
+        text = corpus.generate()
+    doc = document.Document()
+    doc.setPlainText(text)
+    h = highlighter.highlighter(doc)
+    
+    # full synchronous rehighlight
+    h.lazy = False
+    start = time.time()
+    h.rehighlight()
+    duration = time.time() - start
+    print("blocks:          {0}".format(doc.blockCount()))
+    print("frozen states:   {0}".format(h._fridge.count()))
+    print("rehighlight:     {0:.3f} s".format(duration))
+    
+    # lazy rehighlight: time until control returns and until finished
+    h.lazy = True
+    start = time.time()
+    h.rehighlight()
+    first = time.time() - start
+    while h.busy():
+        app.qApp.processEvents()
+    duration = time.time() - start
+    print("lazy, first:     {0:.3f} s".format(first))
+    print("lazy, finished:  {0:.3f} s".format(duration))
+
+
+if __name__ == '__main__':
+    main()
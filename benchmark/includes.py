@@ -0,0 +1,109 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures resolving the include files of a large project.
+
+Usage: python benchmark/includes.py [files]
+
+Generates a project with the given number of files (default 1000) and a
+master file including all scores, and resolves the set of included files
+with empty caches: serially in this process, and with 2, 4 and as many
+worker processes as there are processor cores (see fileinfo.scanincludes()).
+The times include starting the workers. Finally the files are resolved
+again with only the disk cache filled, as after a restart of the application
+(see fileinfo.diskcache()).
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import filecache
+import fileinfo
+import scanpool
+
+import corpus
+
+
+def resolve(master, cold):
+    """Returns the included files of master and the time.
+    
+    The in-memory caches are always cleared, the disk cache only if cold is
+    True.
+    
+    """
+    fileinfo.includeargs.cache.clear()
+    if cold:
+        fileinfo.diskcache().clear()
+    fileinfo._graph = None
+    start = time.time()
+    files = fileinfo.includefiles(master)
+    return files, time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cores = multiprocessing.cpu_count()
+    tempdir = tempfile.mkdtemp()
+    try:
+        fileinfo._diskcache = filecache.DiskCache(
+            os.path.join(tempdir, 'fileinfo.db'), 'benchmark')
+        directory = os.path.join(tempdir, 'project')
+        names = corpus.project(directory, count)
+        master = os.path.join(directory, 'main.ly')
+        with open(master, 'w') as f:
+            for name in names:
+                if name.endswith('.ly'):
+                    f.write('\\include "{0}"\n'.format(os.path.relpath(name, directory)))
+        results = []
+        for size in [0] + sorted(set([2, 4, cores])):
+            scanpool.setsize(size)
+            files, seconds = resolve(master, True)
+            results.append((size, scanpool.size(), files, seconds))
+        scanpool.close()
+        fileinfo.diskcache().flush()
+        warm, cached = resolve(master, False)
+    finally:
+        shutil.rmtree(tempdir)
+    serial, serialtime = results[0][2:]
+    ok = all(files == serial for size, used, files, seconds in results) and warm == serial
+    print("{0} files, {1} cores".format(len(serial), cores))
+    for size, used, files, seconds in results:
+        name = "{0} processes".format(size) if size else "serial"
+        if size and not used:
+            name += " (pool not available)"
+        print("{0:35} {1:8.3f} s {2:6.1f}x".format(name, seconds, serialtime / seconds))
+    print("{0:35} {1:8.3f} s {2:6.1f}x".format("disk cache", cached, serialtime / cached))
+    print("results: {0}".format("ok" if ok else "DIFFERENT"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
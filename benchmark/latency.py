@@ -0,0 +1,110 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures the latency of finding completions while typing.
+
+Usage: python benchmark/latency.py [-n count] [file_or_directory ...]
+
+Loads every LilyPond file in a Document, shown in a QPlainTextEdit with the
+autocomplete Completer, and puts the text cursor at the end of count (default
+2000) tokens, chosen at random. At every position completionCursor() of the
+Completer is called, like when a character is typed there: the analyzer finds
+the model with the completions and these are ranked. Profiling of the
+autocomplete package is enabled, and the p50, p95 and p99 latencies are
+reported for the completer, the analyzer and every test function and model it
+used.
+
+Without arguments, the sample LilyPond file and a generated document of 5000
+lines are used.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import random
+import sys
+
+import sip
+sip.setapi("QString", 2)
+sip.setapi("QVariant", 2)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import app
+import document
+import highlighter
+import tokeniter
+from PyQt4.QtGui import QPlainTextEdit, QTextCursor
+
+from autocomplete import completer, util
+
+import corpus
+
+
+def positions(doc, count):
+    """Returns a list of at most count random positions at the end of a token."""
+    result = []
+    block = doc.firstBlock()
+    while block.isValid():
+        result.extend(block.position() + t.end for t in tokeniter.tokens(block))
+        block = block.next()
+    random.seed(0)
+    return sorted(random.sample(result, min(count, len(result))))
+
+
+def replay(text, count):
+    """Loads the text in a Document and gets completions at count positions."""
+    doc = document.Document()
+    doc.setPlainText(text)
+    highlighter.highlighter(doc).ensureLexed(doc.lastBlock())
+    edit = QPlainTextEdit()
+    edit.setDocument(doc)
+    c = completer.Completer()
+    c.setWidget(edit)
+    for pos in positions(doc, count):
+        cursor = QTextCursor(doc)
+        cursor.setPosition(pos)
+        edit.setTextCursor(cursor)
+        c.completionCursor()
+
+
+def main():
+    args = sys.argv[1:]
+    count = 2000
+    if args[:1] == ['-n']:
+        count = int(args[1])
+        del args[:2]
+    if args:
+        texts = list(corpus.texts(args))
+    else:
+        texts = [corpus.sample('lilypond', 1), corpus.generate(5000)]
+    profile = util.enableProfiling()
+    for text in texts:
+        replay(text, count)
+    util.disableProfiling()
+    print("{0} documents".format(len(texts)))
+    print(profile.report(['completer', 'analyzer', 'test', 'model']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures the performance of the ly.lex tokenizer for all modes.
+
+Usage: python benchmark/lexer.py [options] [file ...]
+
+The texts of the bundled corpus (see corpus.bundle()) and the given files are
+tokenized line by line, as the highlighter does. For every text the number
+of tokens per second, the memory needed to keep the tokens of all lines and
+the Parser classes that took the most time are reported.
+
+The memory is measured with the tracemalloc module if available (the peak of
+the memory allocated while tokenizing). Otherwise (Python 2) the sizes of the
+kept token tuples and tokens are added up using sys.getsizeof(), which does not
+count the memory that is freed again while tokenizing.
+
+Use --json to also write the results to a file, to compare them between
+releases.
+
+Does not need Qt.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+
+import json
+import optparse
+import os
+import platform
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None # Python 2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import slexer
+import ly.lex
+
+import corpus
+
+
+def tokenize(mode, lines):
+    """Tokenizes the lines, returns the number of tokens."""
+    state = ly.lex.state(mode)
+    return sum(len(tuple(state.tokens(line))) for line in lines)
+
+
+def timing(mode, lines, repeat):
+    """Returns the number of tokens and the best time of repeat runs."""
+    tokenize(mode, lines) # compile the patterns of all parsers involved
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        count = tokenize(mode, lines)
+        duration = time.time() - start
+        if best is None or duration < best:
+            best = duration
+    return count, best
+
+
+def allocations(mode, lines):
+    """Returns the number of bytes allocated while keeping all tokens.
+    
+    Uses tracemalloc if available, otherwise the size of the kept tuples and
+    tokens as reported by sys.getsizeof().
+    
+    """
+    state = ly.lex.state(mode)
+    if tracemalloc:
+        tracemalloc.start()
+        try:
+            tokens = [tuple(state.tokens(line)) for line in lines]
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    size = 0
+    for line in lines:
+        tokens = tuple(state.tokens(line))
+        size += sys.getsizeof(tokens) + sum(sys.getsizeof(t) for t in tokens)
+    return size
+
+
+def parser_times(mode, lines):
+    """Returns a dictionary mapping Parser class names to the time spent in parse()."""
+    profile = slexer.enableProfiling()
+    try:
+        tokenize(mode, lines)
+    finally:
+        slexer.disableProfiling()
+    return dict((cls.__name__, seconds)
+        for cls, (calls, seconds) in profile.entries.get('parse', {}).items())
+
+
+def benchmark(name, mode, text, repeat):
+    """Runs the benchmarks for one text and returns a dictionary with the results."""
+    lines = text.splitlines()
+    count, duration = timing(mode, lines, repeat)
+    times = parser_times(mode, lines)
+    slowest = sorted(times, key=times.get, reverse=True)[:5]
+    return {
+        'name': name,
+        'mode': mode,
+        'lines': len(lines),
+        'tokens': count,
+        'seconds': duration,
+        'tokens_per_second': count / duration if duration else None,
+        'allocated_bytes': allocations(mode, lines),
+        'slowest_parsers': [(p, times[p]) for p in slowest],
+    }
+
+
+def report(result):
+    """Prints a result to stdout."""
+    print("{name:16} {mode:9} {lines:7} {tokens:9} {tokens_per_second:12.0f} "
+          "{0:10.1f}".format(result['allocated_bytes'] / 1048576, **result))
+    for parser, seconds in result['slowest_parsers']:
+        print("    {0:40} {1:8.3f} s".format(parser, seconds))
+
+
+def main():
+    parser = optparse.OptionParser(usage="%prog [options] [file ...]")
+    parser.add_option('-r', '--repeat', type='int', default=3,
+        help="number of timed runs per text, the best is reported (default 3)")
+    parser.add_option('-j', '--json', metavar="FILE",
+        help="write the results in JSON format to FILE")
+    options, args = parser.parse_args()
+    
+    texts = corpus.bundle()
+    for filename in corpus.files(args):
+        text = corpus.read(filename)
+        texts.append((os.path.basename(filename), ly.lex.guessMode(text), text))
+    
+    print("{0:16} {1:9} {2:>7} {3:>9} {4:>12} {5:>10}".format(
+        "text", "mode", "lines", "tokens", "tokens/s", "alloc (MB)"))
+    results = []
+    for name, mode, text in texts:
+        result = benchmark(name, mode, text, options.repeat)
+        report(result)
+        results.append(result)
+    
+    if options.json:
+        with open(options.json, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures the time to render all visible pages of a PDF document.
+
+Usage: python benchmark/render.py [-j processes] [-n pages] [-w width] file.pdf
+
+Renders the first pages (default 4) of the document at the given width in
+pixels (default 1200), like a View does when a document is shown, and reports
+the time until all tiles are in the cache. This is done in the background
+thread and with 1 up to the given number of worker processes (default the
+number of CPUs) in the render pool.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import multiprocessing
+import os
+import sys
+import time
+
+import sip
+sip.setapi("QString", 2)
+sip.setapi("QVariant", 2)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import popplerqt4
+from PyQt4.QtCore import QByteArray, QRect
+from PyQt4.QtGui import QApplication
+
+import qpopplerview
+from qpopplerview import cache, renderpool
+
+
+def render(document, count, width):
+    """Renders the first count pages at width, returns the time in seconds."""
+    cache.clear()
+    pages = []
+    for num in range(min(count, document.numPages())):
+        page = qpopplerview.Page(document, num)
+        page.setScale(page.scaleForWidth(width))
+        rect = QRect(0, 0, page.width(), page.height())
+        pages.extend((page, tile) for tile in cache.tiles(page, rect))
+    start = time.time()
+    for page, tile in pages:
+        cache.generate(page, tile)
+    while any(cache.image(page, tile) is None for page, tile in pages):
+        QApplication.processEvents()
+        time.sleep(0.001)
+    return time.time() - start
+
+
+def main():
+    args = sys.argv[1:]
+    processes, count, width = multiprocessing.cpu_count(), 4, 1200
+    while args[:1] in (['-j'], ['-n'], ['-w']):
+        value = int(args[1])
+        if args[0] == '-j':
+            processes = value
+        elif args[0] == '-n':
+            count = value
+        else:
+            width = value
+        del args[:2]
+    if not args:
+        sys.exit(__doc__)
+    a = QApplication([])
+    with open(args[0], 'rb') as f:
+        data = f.read()
+    document = popplerqt4.Poppler.Document.loadFromData(QByteArray(data))
+    renderpool.setsource(document, data)
+    print("{0} pages at {1} pixels".format(min(count, document.numPages()), width))
+    print("{0:10} {1:>10}".format("processes", "seconds"))
+    renderpool.setsize(0)
+    print("{0:10} {1:10.3f}".format("thread", render(document, count, width)))
+    for size in range(1, processes + 1):
+        renderpool.setsize(size)
+        render(document, 1, width) # start the workers and load the document
+        print("{0:10} {1:10.3f}".format(size, render(document, count, width)))
+    renderpool.setsize(0)
+
+
+if __name__ == '__main__':
+    main()
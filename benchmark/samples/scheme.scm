@@ -0,0 +1,5 @@
+(define (fold f init lst)
+  (if (null? lst) init (fold f (f init (car lst)) (cdr lst))))
+(define-public (nested x) (list (list (list (cons x 'a) "str") #t) 1.5 #\c))
+; a comment
+(let ((a 1) (b #{ c'4 d e #})) (display (+ a (* 2 (- 3 (/ 4 5))))))
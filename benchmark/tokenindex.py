@@ -0,0 +1,114 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Measures the cost of editing a document that has a TokenIndex.
+
+Usage: python benchmark/tokenindex.py
+
+For generated LilyPond documents of increasing size, the mean time of typing
+a character and of inserting a newline in the middle of the document is
+measured, without and with a TokenIndex (see the tokenindex module). The time
+of looking up the blocks with a Name token right after inserting a newline is
+reported as well.
+
+The cost of an edit with the index should not grow with the document size.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+import sip
+sip.setapi("QString", 2)
+sip.setapi("QVariant", 2)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import app
+import document
+import highlighter
+import tokenindex
+import ly.lex.lilypond
+
+from PyQt4.QtGui import QTextCursor
+
+import corpus
+
+
+def load(lines, index):
+    """Returns a highlighted Document with the number of lines.
+    
+    If index is True, the document gets a TokenIndex.
+    
+    """
+    doc = document.Document()
+    doc.setPlainText(corpus.generate(lines))
+    h = highlighter.highlighter(doc)
+    h.lazy = False
+    h.rehighlight()
+    if index:
+        tokenindex.index(doc)
+    return doc
+
+
+def edit(doc, text, count=50):
+    """Inserts text count times in the middle of the document.
+    
+    Returns the mean time of an edit in milliseconds.
+    
+    """
+    cursor = QTextCursor(doc.findBlockByNumber(doc.blockCount() // 2))
+    start = time.time()
+    for i in range(count):
+        cursor.insertText(text)
+    return (time.time() - start) / count * 1000
+
+
+def lookup(doc):
+    """Inserts a newline, returns the time of a lookup in milliseconds."""
+    QTextCursor(doc.findBlockByNumber(doc.blockCount() // 2)).insertText('\n')
+    start = time.time()
+    tokenindex.blocks(doc, ly.lex.lilypond.Name)
+    return (time.time() - start) * 1000
+
+
+def main():
+    print("{0:>7} {1:>10} {2:>10} {3:>10} {4:>10} {5:>10}".format(
+        "lines", "char", "+index", "newline", "+index", "lookup"))
+    print("{0:>7} {1:>10} {1:>10} {1:>10} {1:>10} {1:>10}".format("", "(ms)"))
+    for lines in (1000, 10000, 50000, 100000):
+        plain = load(lines, False)
+        indexed = load(lines, True)
+        print("{0:7} {1:10.3f} {2:10.3f} {3:10.3f} {4:10.3f} {5:10.3f}".format(
+            lines,
+            edit(plain, 'x'), edit(indexed, 'x'),
+            edit(plain, '\n'), edit(indexed, '\n'),
+            lookup(indexed)))
+        plain.close()
+        indexed.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Compares the memory used by stored tokens as tuples and as TokenArrays.
+
+Usage: python benchmark/tokenmemory.py [file or directory ...]
+
+Every line of the given files (directories are searched for .ly, .ily and
+.lytex files) is tokenized like the highlighter does, and the memory needed
+to keep the tokens of all lines is reported for both storage methods.
+If no files are given, a generated document of 100000 lines is used.
+
+Does not need Qt.
+
+"""
+
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import frescobaldi_app.toplevel
+import slexer
+import ly.lex
+
+import corpus
+
+
+def tuple_size(tokens):
+    """Returns the size in bytes of a tuple of tokens."""
+    return sys.getsizeof(tokens) + sum(sys.getsizeof(t) for t in tokens)
+
+
+def array_size(tokens):
+    """Returns the size in bytes of a TokenArray."""
+    return sys.getsizeof(tokens) + sys.getsizeof(tokens._data)
+
+
+def main():
+    lines = count = before = after = 0
+    for text in corpus.texts(sys.argv[1:], 100000):
+        state = ly.lex.guessState(text)
+        for line in text.splitlines():
+            tokens = tuple(state.tokens(line))
+            lines += 1
+            count += len(tokens)
+            before += tuple_size(tokens)
+            after += array_size(slexer.TokenArray(tokens))
+    print("lines:           {0}".format(lines))
+    print("tokens:          {0}".format(count))
+    print("tuple of tokens: {0:.1f} MB".format(before / 1048576.0))
+    print("TokenArray:      {0:.1f} MB".format(after / 1048576.0))
+    print("saved:           {0:.0%}".format(1 - after / float(before or 1)))
+
+
+if __name__ == '__main__':
+    main()
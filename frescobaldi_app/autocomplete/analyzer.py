@@ -30,15 +30,19 @@ import ly.lex as lx
 import ly.lex.lilypond as lp
 import ly.lex.scheme as scm
 import ly.words
+import profiling
 import tokeniter
 
 from . import completiondata
 from . import documentdata
+from . import prefixindex
+from . import util
 
 
 __all__ = ['completions']
 
 
+@util.timed('analyzer')
 def completions(cursor):
     """Analyzes text at cursor and returns a tuple (position, model).
     
@@ -91,8 +95,15 @@ class Analyzer(object):
         except KeyError:
             return
         else:
+            profile = util.profile()
             for function in tests:
-                model = function(self)
+                if profile:
+                    start = profiling.timer()
+                    model = function(self)
+                    profile.record('test', function.__name__,
+                                   profiling.timer() - start)
+                else:
+                    model = function(self)
                 if model:
                     self.model = model
                     return
@@ -108,6 +119,20 @@ class Analyzer(object):
                 break
             self.column = t.pos
 
+    def prefix(self):
+        """Returns the text from self.column to the cursor, that is completed."""
+        return self.text[self.column:]
+
+    def rank(self, limit=None):
+        """Returns the rows of the model with the completions for the prefix.
+        
+        The best completions come first, see prefixindex.rank().
+        
+        """
+        if not self.model:
+            return []
+        return prefixindex.rank(self.model, self.prefix(), limit)
+
 
 # Test functions that return a model or None
 # self is the Analyzer instance.
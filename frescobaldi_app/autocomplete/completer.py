@@ -25,16 +25,34 @@ from __future__ import unicode_literals
 
 import re
 
-from PyQt4.QtGui import QTextCursor
+from PyQt4.QtCore import QAbstractListModel, Qt
+from PyQt4.QtGui import QCompleter, QTextCursor
 
 import app
 import textformats
 import widgets.completer
 
+from . import prefixindex
+from . import util
+
 
 class Completer(widgets.completer.Completer):
+    """Shows the completions found by the analyzer, ranked by prefixindex.
+    
+    The model found by the analyzer is not filtered by QCompleter, but the
+    rows with the best completions for the entered text are shown, see
+    prefixindex.rank(). These may also be fuzzy matches, that do not start
+    with the entered text.
+    
+    """
+    # the maximum number of completions shown
+    maxCompletions = 32
+    
     def __init__(self):
         super(Completer, self).__init__()
+        self._ranked = RankedModel()
+        self.setModel(self._ranked)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
         self.setMaxVisibleItems(16)
         self.popup().setMinimumWidth(100)
         app.settingsChanged.connect(self.readSettings)
@@ -44,6 +62,7 @@ class Completer(widgets.completer.Completer):
         self.popup().setFont(textformats.formatData('editor').font)
         self.popup().setPalette(textformats.formatData('editor').palette())
     
+    @util.timed('completer')
     def completionCursor(self):
         cursor = self.textCursor()
         # trick: if we are still visible we don't have to analyze the text again
@@ -53,9 +72,42 @@ class Completer(widgets.completer.Completer):
             if not model:
                 return
             self._pos = cursor.block().position() + pos
-            if self.model() != model:
-                self.setModel(model)
+            self._model = model
         cursor.setPosition(self._pos, QTextCursor.KeepAnchor)
+        self._ranked.setRows(self._model, prefixindex.rank(
+            self._model, cursor.selectedText(), self.maxCompletions))
         return cursor
+    
+    def insertCompletion(self, index):
+        """Replaces the entered text with the completion at the given index."""
+        text = self.completionModel().data(index, Qt.EditRole)
+        cursor = self.textCursor()
+        cursor.setPosition(self._pos, QTextCursor.KeepAnchor)
+        cursor.insertText(text)
+
+
+class RankedModel(QAbstractListModel):
+    """Shows the rows of another list model in the order they are given."""
+    def __init__(self, parent=None):
+        super(RankedModel, self).__init__(parent)
+        self._model = None
+        self._rows = []
+    
+    def setRows(self, model, rows):
+        """Shows the list of rows of the model."""
+        self.beginResetModel()
+        self._model = model
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role):
+        try:
+            row = self._rows[index.row()]
+        except IndexError:
+            return
+        return self._model.data(self._model.index(row), role)
 
 
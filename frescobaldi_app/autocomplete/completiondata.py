@@ -204,6 +204,7 @@ lilypond_score = listmodel.ListModel(sorted(
 
 lilypond_engravers = listmodel.ListModel(ly.data.engravers())
     
+@util.timed('model')
 def lilypond_grob_properties(grob):
     return listmodel.ListModel(ly.data.grob_properties(grob),
         display = lambda item: "#'" + item)
@@ -231,6 +232,7 @@ midi_instruments = listmodel.ListModel(ly.words.midi_instruments)
 
 language_names = listmodel.ListModel(sorted(ly.pitch.pitchInfo))
 
+@util.timed('model')
 def font_names():
     model = listmodel.ListModel(sorted(QFontDatabase().families()))
     model.setRoleFunction(Qt.FontRole, QFont)
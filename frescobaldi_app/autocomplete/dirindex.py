@@ -0,0 +1,121 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2011 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Keeps the names of LilyPond files in directories, to complete \\include.
+
+The names are read once per directory and kept until the directory changes
+on disk.
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+from PyQt4.QtCore import QFileSystemWatcher
+
+
+# the extensions of files that can be included
+extensions = ('.ly', '.lyi', '.ily')
+
+
+_index = None
+
+def index():
+    """Returns the global DirectoryIndex."""
+    global _index
+    if _index is None:
+        _index = DirectoryIndex()
+    return _index
+
+
+def filenames(path, directories=False):
+    """Returns a sorted list of the LilyPond files in the directory path.
+    
+    See DirectoryIndex.filenames().
+    
+    """
+    return index().filenames(path, directories)
+
+
+class DirectoryIndex(object):
+    """Caches the names of the LilyPond files and subdirectories per directory.
+    
+    A directory is read the first time it is asked for, and watched using a
+    QFileSystemWatcher. When it changes, its names are read again on the next
+    request. Directories that can not be watched are not cached.
+    
+    """
+    def __init__(self):
+        self._entries = {} # path -> (files, files and subdirectories)
+        self._watcher = QFileSystemWatcher()
+        self._watcher.directoryChanged.connect(self._directoryChanged)
+    
+    def filenames(self, path, directories=False):
+        """Returns a sorted list of the LilyPond files in the directory path.
+        
+        If directories is True, the names of the subdirectories, with a
+        trailing os.sep, are also in the list. Hidden files and backups are
+        skipped. Do not alter the returned list.
+        
+        """
+        try:
+            files, names = self._entries[path]
+        except KeyError:
+            files, names = self._read(path)
+            if os.path.isdir(path):
+                self._watcher.addPath(path)
+                if path in self._watcher.directories():
+                    self._entries[path] = files, names
+        return names if directories else files
+    
+    def _read(self, path):
+        """(Internal) Reads the directory.
+        
+        Returns a sorted list of the files and one of the files and
+        subdirectories.
+        
+        """
+        files, dirs = [], []
+        try:
+            for root, dirnames, filenames in os.walk(path):
+                files.extend(f for f in filenames
+                    if f[:1] not in ('', '.', '~')
+                    and os.path.splitext(f)[1].lower() in extensions)
+                dirs.extend(d + os.sep for d in dirnames
+                    if d and not d.startswith('.'))
+                break
+        except UnicodeDecodeError:
+            # this only happens when there are filenames in the wrong encoding,
+            # but never ever bug the user about this while typing :)
+            pass
+        return sorted(files), sorted(files + dirs)
+    
+    def _directoryChanged(self, path):
+        """Called when a directory changes, forgets its names."""
+        self._entries.pop(path, None)
+        self._watcher.removePath(path)
+    
+    def clear(self):
+        """Forgets all directories."""
+        self._entries.clear()
+        directories = self._watcher.directories()
+        if directories:
+            self._watcher.removePaths(directories)
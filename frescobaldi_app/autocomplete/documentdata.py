@@ -30,8 +30,12 @@ import listmodel
 import plugin
 import ly.words
 
+from . import completiondata
+from . import dirindex
 from . import harvest
+from . import prefixindex
 from . import util
+from . import wordindex
 
 
 def doc(document):
@@ -40,12 +44,39 @@ def doc(document):
 
 
 class DocumentDataSource(plugin.DocumentPlugin):
-    @util.keep
+    """Creates the models with completions for a Document.
+    
+    The last model of every kind is kept, and returned again as long as its
+    contents do not change, so that the PrefixIndex used to rank its
+    completions (see prefixindex.indexes() and rank()) is not built anew
+    every time.
+    
+    """
+    def __init__(self, document):
+        self._models = {}
+    
+    def _model(self, name, data, display=listmodel.display, indexes=None):
+        """(Internal) Returns a ListModel with the data, kept under the name.
+        
+        If the model kept under the name has the same data, it is returned.
+        Otherwise a new model is created and kept, with the list of PrefixIndex
+        instances to search if indexes is given.
+        
+        """
+        model = self._models.get(name)
+        if model is None or model._data != data:
+            model = self._models[name] = listmodel.ListModel(data, display=display)
+            if indexes is not None:
+                prefixindex.setIndexes(model, indexes)
+        return model
+    
+    @util.timed('model')
     def words(self):
         """Returns the list of words in comments, markup etc."""
-        return listmodel.ListModel(
-            sorted(set(harvest.words(self.document()))))
+        index = wordindex.index(self.document()).prefixIndex()
+        return self._model('words', list(index.words()), indexes=[index])
 
+    @util.timed('model')
     @util.keep
     def schemewords(self):
         """Scheme names, including those harvested from document."""
@@ -56,18 +87,21 @@ class DocumentDataSource(plugin.DocumentPlugin):
                 for t in harvest.schemewords(self.document())
                 if len(t) > 2),
             ))
-        return listmodel.ListModel(sorted(schemewords))
+        return self._model('schemewords', sorted(schemewords))
 
-    @util.keep
+    @util.timed('model')
     def markup(self):
         """Completes markup commands and normal text from the document."""
-        return listmodel.ListModel(
-            ['\\' + w for w in sorted(ly.words.markupcommands)]
-            + sorted(set(harvest.words(self.document()))))
+        index = wordindex.index(self.document()).prefixIndex()
+        commands = completiondata.lilypond_markup_commands
+        return self._model('markup',
+            ['\\' + w for w in sorted(ly.words.markupcommands)] + index.words(),
+            indexes=prefixindex.indexes(commands) + [index])
 
+    @util.timed('model')
     @util.keep
     def musiccommands(self, cursor):
-        return listmodel.ListModel(sorted(set(itertools.chain(
+        return self._model('musiccommands', sorted(set(itertools.chain(
             ly.words.lilypond_keywords,
             ly.words.lilypond_music_commands,
             ly.words.articulations,
@@ -77,12 +111,14 @@ class DocumentDataSource(plugin.DocumentPlugin):
             ly.words.repeat_scripts,
             harvest.names(cursor)))), display = util.command)
 
+    @util.timed('model')
     @util.keep
     def lyriccommands(self, cursor):
-        return listmodel.ListModel(sorted(set(itertools.chain(
+        return self._model('lyriccommands', sorted(set(itertools.chain(
             ('set stanza = ', 'set', 'override', 'markup', 'notemode'),
             harvest.names(cursor)))), display = util.command)
 
+    @util.timed('model')
     def includenames(self, cursor, directory=None):
         """Finds files relative to the directory of the cursor's document.
         
@@ -100,15 +136,15 @@ class DocumentDataSource(plugin.DocumentPlugin):
             basedir = os.path.dirname(path)
             if directory:
                 basedir = os.path.join(basedir, directory)
-                names.extend(sorted(os.path.join(directory, f)
-                    for f in get_filenames(basedir, True)))
+                names.extend(os.path.join(directory, f)
+                    for f in dirindex.filenames(basedir, True))
             else:
-                names.extend(sorted(get_filenames(basedir, True)))
+                names.extend(dirindex.filenames(basedir, True))
         
         # names in specified include paths
         import documentinfo
         for basedir in documentinfo.info(self.document()).includepath():
-            names.extend(sorted(get_filenames(basedir)))
+            names.extend(dirindex.filenames(basedir))
         
         # names from LilyPond itself
         import engrave.command
@@ -116,29 +152,8 @@ class DocumentDataSource(plugin.DocumentPlugin):
         if datadir:
             basedir = os.path.join(datadir, 'ly')
             # get the filenames but avoid the -init files here
-            names.extend(sorted(f for f in get_filenames(basedir)
+            names.extend(f for f in dirindex.filenames(basedir)
                 if not f.endswith('init.ly')
-                and f.islower()))
+                and f.islower())
         
-        return listmodel.ListModel(names)
-
-
-def get_filenames(path, directories = False):
-    try:
-        for root, dirs, files in os.walk(path):
-            for f in files:
-                if f and f[0] not in '.~':
-                    name, ext = os.path.splitext(f)
-                    if ext.lower() in ('.ly', '.lyi', '.ily'):
-                        yield f
-            if directories:
-                for f in dirs:
-                    if f and not f.startswith('.'):
-                        yield f + os.sep
-            return
-    except UnicodeDecodeError:
-        # this only happens when there are filenames in the wrong encoding,
-        # but never ever bug the user about this while typing :)
-        pass
-
-
+        return self._model('includenames', names)
@@ -26,27 +26,28 @@ from __future__ import unicode_literals
 import re
 
 import tokeniter
+import tokenindex
 import ly.lex.lilypond
 import ly.lex.scheme
 
 
 def names(cursor):
     """Harvests names from assignments until the cursor."""
-    end = cursor.block()
-    block = cursor.document().firstBlock()
-    while block.isValid() and block != end:
+    blocks = tokenindex.blocks(cursor.document(), ly.lex.lilypond.Name,
+                               end=cursor.block())
+    for block in blocks:
         for t in tokeniter.tokens(block)[:2]:
             if type(t) is ly.lex.lilypond.Name:
                 yield t
                 break
-        block = block.next()
 
 
 def schemewords(document):
     """Harvests all schemewords from the document."""
-    for t in tokeniter.allTokens(document):
-        if type(t) is ly.lex.scheme.Word:
-            yield t
+    for block in tokenindex.blocks(document, ly.lex.scheme.Word):
+        for t in tokeniter.tokens(block):
+            if type(t) is ly.lex.scheme.Word:
+                yield t
 
 
 _words = re.compile(r'\w{5,}|\w{2,}(?:[:-]\w+)+').finditer
@@ -56,7 +57,12 @@ _word_types = (
 
 def words(document):
     """Harvests words from strings, lyrics, markup and comments."""
-    for t in tokeniter.allTokens(document):
+    return tokenwords(tokeniter.allTokens(document))
+
+
+def tokenwords(tokens):
+    """Harvests words from the strings, lyrics, markup and comments in tokens."""
+    for t in tokens:
         if isinstance(t, _word_types):
             for m in _words(t):
                 yield m.group()
@@ -0,0 +1,273 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2011 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Finds completions for a prefix, ranked by frequency.
+
+A PrefixIndex keeps words with a weight (e.g. the number of times a word
+occurs). complete() returns the words starting with a prefix, fuzzy() the
+words containing the characters of a text in the same order, and search()
+does both, also over more than one index.
+
+indexes() returns the indexes to search for the completions of a model, and
+rank() the rows of a model with the completions for a text, best first.
+
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import heapq
+import re
+import weakref
+
+from PyQt4.QtCore import Qt
+
+
+_indexes = weakref.WeakKeyDictionary()
+_rows = weakref.WeakKeyDictionary()
+
+
+def texts(model):
+    """Yields the texts of the model (its EditRole data)."""
+    for row in range(model.rowCount(model.index(-1))):
+        yield model.data(model.index(row), Qt.EditRole)
+
+
+def indexes(model):
+    """Returns the list of PrefixIndex instances with the completions of model.
+    
+    Unless set with setIndexes(), a PrefixIndex is created with the texts of
+    the model (its EditRole data), which is kept as long as the model exists.
+    
+    """
+    try:
+        return _indexes[model]
+    except KeyError:
+        result = _indexes[model] = [PrefixIndex(texts(model))]
+        return result
+
+
+def setIndexes(model, indexes):
+    """Sets the list of PrefixIndex instances to search for completions of model.
+    
+    This can be used to rank the completions by the weights of the words in
+    another index, e.g. with their number of occurrences in the document.
+    
+    """
+    _indexes[model] = list(indexes)
+
+
+def rank(model, text, limit=None):
+    """Returns the list of rows of the model with the completions for text.
+    
+    The rows are ordered as the words returned by search() for the indexes of
+    the model. Words in the indexes that the model does not contain are
+    skipped, so there may be fewer than limit rows.
+    
+    """
+    try:
+        rows = _rows[model]
+    except KeyError:
+        rows = _rows[model] = {}
+        for row, word in enumerate(texts(model)):
+            rows.setdefault(word, row)
+    return [rows[word] for word in search(text, indexes(model), limit)
+            if word in rows]
+
+
+class PrefixIndex(object):
+    """Stores words with their weights and finds them by prefix.
+    
+    The words are kept in a sorted list, so all words starting with a prefix
+    are in a contiguous range that is found by bisection, just like the words
+    below a node of a trie. The words are also kept in order of their weight,
+    so that for prefixes matching many words the heaviest ones are found
+    without looking at all of them.
+    
+    """
+    def __init__(self, words=()):
+        self._words = []
+        self._weights = {}
+        self._ranked = []   # (-weight, word) tuples, sorted
+        self._buckets = {}
+        self.update(words)
+    
+    def __len__(self):
+        return len(self._words)
+    
+    def __contains__(self, word):
+        return word in self._weights
+    
+    def __iter__(self):
+        return iter(self._words)
+    
+    def words(self):
+        """Returns the sorted list of words. Do not alter it."""
+        return self._words
+    
+    def weight(self, word):
+        """Returns the weight of the word, 0 if it is not in the index."""
+        return self._weights.get(word, 0)
+    
+    def add(self, word, weight=1):
+        """Adds the word, or increases its weight if it is already there."""
+        old = self._weights.get(word, 0)
+        if old:
+            self._unrank(word, old)
+        else:
+            bisect.insort(self._words, word)
+        self._weights[word] = old + weight
+        bisect.insort(self._ranked, (-old - weight, word))
+        self._buckets.pop(word[:1], None)
+    
+    def remove(self, word, weight=1):
+        """Decreases the weight of the word, removes it when that drops to 0."""
+        old = self._weights[word]
+        self._unrank(word, old)
+        if old > weight:
+            self._weights[word] = old - weight
+            bisect.insort(self._ranked, (weight - old, word))
+        else:
+            del self._weights[word]
+            del self._words[bisect.bisect_left(self._words, word)]
+        self._buckets.pop(word[:1], None)
+    
+    def _unrank(self, word, weight):
+        """(Internal) Removes the word with the weight from the ranked list."""
+        del self._ranked[bisect.bisect_left(self._ranked, (-weight, word))]
+    
+    def update(self, words):
+        """Adds the words, which may also be a dict mapping words to weights."""
+        weights = self._weights
+        if isinstance(words, dict):
+            for word, weight in words.items():
+                weights[word] = weights.get(word, 0) + weight
+        else:
+            for word in words:
+                weights[word] = weights.get(word, 0) + 1
+        self._words = sorted(weights)
+        self._ranked = sorted((-weight, word) for word, weight in weights.items())
+        self._buckets = {}
+    
+    def range(self, prefix):
+        """Returns the range (start, end) of the words starting with prefix."""
+        start = bisect.bisect_left(self._words, prefix)
+        end = bisect.bisect_left(self._words, prefix + '\uffff', start)
+        return start, end
+    
+    def complete(self, prefix, limit=None):
+        """Returns a list of (word, weight) tuples for the words starting with prefix.
+        
+        The list is ordered by descending weight, and then alphabetically.
+        If limit is given, returns at most that number of tuples.
+        
+        """
+        start, end = self.range(prefix)
+        count = end - start
+        weights = self._weights
+        if limit is None or limit >= count:
+            result = [(weights[w], w) for w in self._words[start:end]]
+            result.sort(key=lambda item: -item[0])
+        elif count * count <= limit * len(self._words):
+            # few words: rank the range
+            result = heapq.nsmallest(limit,
+                ((-weights[w], w) for w in self._words[start:end]))
+        else:
+            # many words: take the heaviest words from the ranked list
+            result = []
+            for item in self._ranked:
+                if item[1].startswith(prefix):
+                    result.append(item)
+                    if len(result) == limit:
+                        break
+        return [(word, abs(weight)) for weight, word in result]
+    
+    def fuzzy(self, text, limit=None):
+        """Returns a list of (word, weight) tuples for the words matching text.
+        
+        A word matches if it starts with the first character of the text and
+        contains the other characters in the same order, e.g. "sSP" matches
+        "setStaffProperty". The list is ordered by descending weight, then by
+        how close together the characters are, and then alphabetically.
+        
+        If limit is given, returns at most that number of tuples. The words are
+        examined in order of their weight, and the search stops if there are
+        enough matches and the weight of the next match is lower.
+        
+        """
+        if not text:
+            return self.complete(text, limit)
+        bucket = self._bucket(text[0])
+        pattern = '\n' + re.escape(text[0]) + ''.join(
+            '([^\n{0}]*){0}'.format(re.escape(c)) for c in text[1:]) + '[^\n]*'
+        weights = self._weights
+        result = []
+        for m in re.finditer(pattern, bucket):
+            word = m.group()[1:]
+            weight = weights[word]
+            if limit is not None and len(result) >= limit and -weight > result[-1][0]:
+                break
+            result.append((-weight, sum(map(len, m.groups())), word))
+        result.sort()
+        return [(word, -weight) for weight, gaps, word in result[:limit]]
+    
+    def _bucket(self, char):
+        """(Internal) Returns the words starting with char, in order of weight.
+        
+        Every word is preceded by a newline.
+        
+        """
+        try:
+            return self._buckets[char]
+        except KeyError:
+            start, end = self.range(char)
+            words = sorted(self._words[start:end],
+                           key=self._weights.__getitem__, reverse=True)
+            bucket = self._buckets[char] = ''.join('\n' + w for w in words)
+            return bucket
+
+
+def search(text, indexes, limit=None):
+    """Returns a ranked list of completions for text from one or more indexes.
+    
+    The words starting with text come first, then the words matching it fuzzily
+    (see PrefixIndex.fuzzy()). The weight of a word found in more than one index
+    is the sum of its weights. If limit is given, returns at most that number of
+    words.
+    
+    """
+    result = _merge(index.complete(text, limit) for index in indexes)
+    if limit is None or len(result) < limit:
+        found = set(result)
+        more = _merge(index.fuzzy(text, limit) for index in indexes)
+        result.extend(word for word in more if word not in found)
+    return result[:limit]
+
+
+def _merge(results):
+    """(Internal) Merges lists of (word, weight) tuples to a ranked list of words."""
+    results = list(results)
+    if len(results) == 1:
+        return [word for word, weight in results[0]]
+    weights = {}
+    for result in results:
+        for word, weight in result:
+            weights[word] = weights.get(word, 0) + weight
+    return sorted(weights, key=lambda word: (-weights[word], word))
@@ -0,0 +1,146 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+An incremental index of the words in strings, lyrics, markup and comments.
+"""
+
+from __future__ import unicode_literals
+
+import itertools
+
+from PyQt4.QtGui import QTextCursor
+
+import cursortools
+import highlighter
+import plugin
+
+from . import harvest
+from . import prefixindex
+
+
+def index(document):
+    """Returns the WordIndex for the document."""
+    return WordIndex.instance(document)
+
+
+class WordIndex(plugin.DocumentPlugin):
+    """Keeps the words of a Document (see harvest.words()) with their counts.
+    
+    The words are kept in a PrefixIndex, with the number of times they occur
+    as weight.
+    
+    The words of every block are stored in the block's userData when the
+    highlighter tokenizes it. A list with the words of every block is kept in
+    document order, so that when blocks are removed their words can be
+    subtracted from the counts.
+    
+    The highlighter may tokenize blocks before the contentsChange signal
+    reaches us. If the number of blocks changed, those blocks are remembered
+    and handled after the list has been updated.
+    
+    """
+    def __init__(self, document):
+        self._index = prefixindex.PrefixIndex()
+        self._pending = []
+        h = highlighter.highlighter(document)
+        h.ensureLexed(document.lastBlock())
+        self._blocks = []
+        for block in cursortools.allBlocks(document):
+            self._blocks.append(self._store(block, highlighter.blockTokens(block)))
+        self._index.update(itertools.chain.from_iterable(self._blocks))
+        h.blockLexed.connect(self._blockLexed)
+        document.contentsChange.connect(self._contentsChange)
+    
+    def words(self):
+        """Returns the sorted list of words in the document."""
+        self._ensureLexed()
+        return self._index.words()
+    
+    def count(self, word):
+        """Returns how many times the word occurs in the document."""
+        self._ensureLexed()
+        return self._index.weight(word)
+    
+    def prefixIndex(self):
+        """Returns the PrefixIndex with the words and their counts."""
+        self._ensureLexed()
+        return self._index
+    
+    def _ensureLexed(self):
+        """(Internal) Makes sure all blocks are tokenized and thus counted."""
+        doc = self.document()
+        highlighter.highlighter(doc).ensureLexed(doc.lastBlock())
+    
+    def _store(self, block, tokens):
+        """(Internal) Stores and returns the words of the block."""
+        words = tuple(harvest.tokenwords(tokens))
+        highlighter.userData(block).words = words
+        return words
+    
+    def _add(self, words):
+        """(Internal) Adds the words to the counts."""
+        for w in words:
+            self._index.add(w)
+    
+    def _remove(self, words):
+        """(Internal) Removes the words from the counts."""
+        for w in words:
+            self._index.remove(w)
+    
+    def _blockLexed(self, block, tokens):
+        """Called when the highlighter has tokenized a block."""
+        self._store(block, tokens)
+        if len(self._blocks) == self.document().blockCount():
+            self._update(block)
+        else:
+            self._pending.append(QTextCursor(block))
+    
+    def _contentsChange(self, position, removed, added):
+        """Called when the document changes, updates the list of blocks."""
+        doc = self.document()
+        first = doc.findBlock(position)
+        last = doc.findBlock(position + added)
+        if not last.isValid():
+            last = doc.lastBlock()
+        count = last.blockNumber() - first.blockNumber() + 1
+        old = count - (doc.blockCount() - len(self._blocks))
+        start = first.blockNumber()
+        for words in self._blocks[start:start+old]:
+            self._remove(words)
+        new = []
+        block = first
+        for i in range(count):
+            words = getattr(block.userData(), 'words', ())
+            new.append(words)
+            self._add(words)
+            block = block.next()
+        self._blocks[start:start+old] = new
+        pending, self._pending = self._pending, []
+        for cursor in pending:
+            self._update(cursor.block())
+    
+    def _update(self, block):
+        """(Internal) Updates the counts with the stored words of the block."""
+        num = block.blockNumber()
+        words = getattr(block.userData(), 'words', ())
+        if words != self._blocks[num]:
+            self._remove(self._blocks[num])
+            self._add(words)
+            self._blocks[num] = words
@@ -30,14 +30,15 @@ import re
 import weakref
 
 from PyQt4.QtCore import QSettings, QUrl
+from PyQt4.QtGui import QTextCursor
 
 import ly.lex.lilypond
 import ly.parse
 import ly.pitch
 import app
 import fileinfo
-import cursortools
 import tokeniter
+import tokenindex
 import plugin
 import variables
 
@@ -80,6 +81,10 @@ def resetoncontentschanged(func):
 
 class DocumentInfo(plugin.DocumentPlugin):
     """Computes and caches various information about a Document."""
+    def __init__(self, document):
+        self._guess = None  # (head, mode, cursor) of the last guessed mode
+        document.contentsChange.connect(self._contentsChange)
+        
     def mode(self, guess=True):
         """Returns the type of document ('lilypond, 'html', etc.).
         
@@ -96,7 +101,58 @@ class DocumentInfo(plugin.DocumentPlugin):
         if mode in ly.lex.modes:
             return mode
         if guess:
-            return ly.lex.guessMode(self.document().toPlainText())
+            return self._guessMode()
+    
+    def _guessMode(self):
+        """Returns the mode guessed from the contents of the document.
+        
+        The guessed mode is cached until the first non-blank line changes, or
+        a marker string (see ly.lex.markers) that could change it is added or
+        removed.
+        
+        """
+        head = self._head()
+        if self._guess:
+            cachedhead, mode, cursor = self._guess
+            if head == cachedhead and (not cursor or
+                    cursor.selectedText() in ly.lex.markers[mode]):
+                return mode
+        text = self.document().toPlainText()
+        mode = ly.lex.guessMode(text)
+        cursor = None
+        # remember where the marker that decided the mode is
+        for marker in ly.lex.markers.get(mode, ()):
+            pos = text.find(marker)
+            if pos != -1:
+                cursor = QTextCursor(self.document())
+                cursor.setPosition(pos)
+                cursor.setPosition(pos + len(marker), QTextCursor.KeepAnchor)
+                break
+        self._guess = (head, mode, cursor)
+        return mode
+    
+    def _head(self):
+        """Returns the first non-blank line of the document, stripped."""
+        block = self.document().firstBlock()
+        while block.isValid():
+            text = block.text().strip()
+            if text:
+                return text
+            block = block.next()
+        return ''
+    
+    def _contentsChange(self, position, removed, added):
+        """Forgets the guessed mode if a marker string appears in the change."""
+        if self._guess and not self._guess[2]:
+            block = self.document().findBlock(position)
+            end = self.document().findBlock(position + added).blockNumber()
+            while block.isValid() and block.blockNumber() <= end:
+                text = block.text()
+                for markers in ly.lex.markers.values():
+                    if any(marker in text for marker in markers):
+                        self._guess = None
+                        return
+                block = block.next()
     
     @resetoncontentschanged
     def version(self):
@@ -112,7 +168,7 @@ class DocumentInfo(plugin.DocumentPlugin):
         """
         mkver = lambda strings: tuple(map(int, strings))
         
-        version = ly.parse.version(tokeniter.allTokens(self.document()))
+        version = ly.parse.version(tokenindex.tokens(self.document(), '\\version'))
         if version:
             return mkver(re.findall(r"\d+", version))
         # look at document variables
@@ -133,7 +189,8 @@ class DocumentInfo(plugin.DocumentPlugin):
     def pitchLanguage(self):
         """Returns the pitchname language used in the document, if defined."""
         languages = ly.pitch.pitchInfo.keys()
-        for block in cursortools.allBlocks(self.document()):
+        keys = ('\\language', '\\include')
+        for block in tokenindex.blocks(self.document(), keys):
             tokens = tokeniter.tokens(block)
             try:
                 i = tokens.index('\\language')
@@ -155,7 +212,7 @@ class DocumentInfo(plugin.DocumentPlugin):
     @resetoncontentschanged
     def globalStaffSize(self, default=20):
         """Returns the global staff size, if set, else the default value."""
-        for block in cursortools.allBlocks(self.document()):
+        for block in tokenindex.blocks(self.document(), 'set-global-staff-size'):
             tokens = tokeniter.tokens(block)
             try:
                 i = tokens.index('set-global-staff-size')
@@ -226,7 +283,8 @@ class DocumentInfo(plugin.DocumentPlugin):
         See ly.parse.includeargs().
         
         """
-        return list(ly.parse.includeargs(tokeniter.allTokens(self.document())))
+        tokens = tokenindex.tokens(self.document(), '\\include')
+        return list(ly.parse.includeargs(tokens))
 
     def includefiles(self):
         """Returns a set of filenames that are included by the given document.
@@ -257,7 +315,9 @@ class DocumentInfo(plugin.DocumentPlugin):
         See ly.parse.outputargs().
         
         """
-        return list(ly.parse.outputargs(tokeniter.allTokens(self.document())))
+        keys = ('\\bookOutputName', '\\bookOutputSuffix', 'output-suffix')
+        tokens = tokenindex.tokens(self.document(), keys)
+        return list(ly.parse.outputargs(tokens))
         
     def basenames(self):
         """Returns a list of basenames that our document is expected to create.
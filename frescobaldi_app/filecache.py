@@ -19,11 +19,24 @@
 
 """
 Caches information about files, and checks the mtime upon request.
+
+FileCache keeps the information in memory, DiskCache stores it in a database
+so that it survives a restart of the application.
 """
 
 from __future__ import unicode_literals
 
 import os
+import sqlite3
+import threading
+import time
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import lrustore
 
 
 class FileCache(object):
@@ -31,26 +44,91 @@ class FileCache(object):
     
     Has __setitem__, __getitem__, __delitem__, clear etc. methods like a dict.
     
+    By default the mtime of a file is checked on every lookup. If ttl is
+    given, an entry is trusted without checking for ttl seconds after the
+    mtime was last checked. Call expire() when a file is known to have
+    changed (e.g. when a QFileSystemWatcher reports it), so that the next
+    lookup checks the mtime again. The ttl limits how long a change can go
+    unnoticed otherwise.
+    
+    Use validate() to check many files in one go before looking them up, e.g.
+    with the mtimes() of a set of files that several caches share.
+    
+    The hits, misses and stats attributes count the lookups that returned a
+    value, the lookups that failed and the mtime checks that were done; saved
+    counts the lookups that did not need to check the mtime.
+    
     """
-    def __init__(self):
+    def __init__(self, ttl=None):
         self._cache = {}
+        self.ttl = ttl
+        self.hits = self.misses = self.stats = self.saved = 0
         
     def __getitem__(self, filename):
-        mtime, value = self._cache[filename]
         try:
-            if mtime == os.path.getmtime(filename):
-                return value
+            entry = self._cache[filename]
+        except KeyError:
+            self.misses += 1
+            raise
+        if self.ttl is not None and time.time() - entry[2] < self.ttl:
+            self.hits += 1
+            self.saved += 1
+            return entry[1]
+        if self._check(filename, entry):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        raise KeyError(filename)
+    
+    def _check(self, filename, entry):
+        """(Internal) Checks the mtime of the entry, deleting it if changed.
+        
+        Returns True if the entry is still valid.
+        
+        """
+        self.stats += 1
+        try:
+            if entry[0] == os.path.getmtime(filename):
+                entry[2] = time.time()
+                return True
         except (IOError, OSError):
             pass
         del self._cache[filename]
-        raise KeyError
+        return False
     
     def __setitem__(self, filename, value):
         try:
-            self._cache[filename] = (os.path.getmtime(filename), value)
+            self.store(filename, value, os.path.getmtime(filename))
         except (IOError, OSError):
             pass
     
+    def store(self, filename, value, mtime):
+        """Stores the value, valid as long as the file has the given mtime."""
+        self._cache[filename] = [mtime, value, time.time()]
+    
+    def validate(self, mtimes):
+        """Checks the cached files against the dictionary of mtimes.
+        
+        mtimes maps filenames to their current mtime, or to None if the file
+        does not exist (see mtimes()). Files that have changed are removed from
+        the cache, the others are trusted again for ttl seconds.
+        
+        """
+        now = time.time()
+        for filename, mtime in mtimes.items():
+            entry = self._cache.get(filename)
+            if entry:
+                if entry[0] == mtime:
+                    entry[2] = now
+                else:
+                    del self._cache[filename]
+    
+    def expire(self, filename):
+        """Makes the next lookup of the filename check its mtime."""
+        entry = self._cache.get(filename)
+        if entry:
+            entry[2] = 0
+    
     def __delitem__(self, filename):
         del self._cache[filename]
         
@@ -72,5 +150,148 @@ class FileCache(object):
                 
     def clear(self):
         self._cache.clear()
+    
+    def statistics(self):
+        """Returns a dictionary with the hits, misses, stats and saved counts."""
+        return dict(hits=self.hits, misses=self.misses,
+                    stats=self.stats, saved=self.saved)
+
+
+def mtimes(filenames):
+    """Returns a dictionary mapping the filenames to their mtime.
+    
+    The mtime is None for files that can't be accessed.
+    
+    """
+    d = {}
+    for filename in filenames:
+        try:
+            d[filename] = os.path.getmtime(filename)
+        except (IOError, OSError):
+            d[filename] = None
+    return d
 
 
+class DiskCache(object):
+    """Stores information about files persistently in a SQLite database.
+    
+    Values are stored per name (e.g. the name of the function that computed
+    them) and filename, together with the mtime and size of the file and a
+    stamp. A value is only returned if the file's mtime and size and the stamp
+    are unchanged. The stamp should change when the way the values are
+    computed changes.
+    
+    Stored values are written to the database in a background thread, delay
+    seconds after the first of them was stored, all in one transaction. Call
+    flush() to write them at once. When the application exits, it waits for
+    the thread to write them.
+    
+    The database holds at most maxsize entries; when it grows larger, the
+    least recently used entries are removed (see lrustore.Store).
+    
+    The hits and misses attributes count the successful and failed lookups.
+    
+    If the database can't be opened or used, the cache silently stores
+    nothing. Damaged entries are removed and count as misses.
+    
+    """
+    
+    # seconds to wait before writing stored values
+    delay = 1.0
+    
+    def __init__(self, path, stamp, maxsize=20000):
+        self._store = lrustore.Store(path, 'entries', maxsize)
+        self._stamp = stamp
+        self._lock = threading.Lock()
+        self._unwritten = {}
+        self._timer = None
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, name, filename):
+        """Returns the stored value for the name and filename.
+        
+        Raises KeyError if there is no valid value.
+        
+        """
+        try:
+            st = os.stat(filename)
+        except (IOError, OSError):
+            data = None
+        else:
+            data = self._load(name, filename)
+        if data is not None:
+            try:
+                mtime, size, stamp, value = pickle.loads(data)
+            except Exception:
+                # the entry is damaged
+                self._delete(name, filename)
+            else:
+                if (mtime, size, stamp) == (st.st_mtime, st.st_size, self._stamp):
+                    self.hits += 1
+                    return value
+        self.misses += 1
+        raise KeyError(filename)
+    
+    def _load(self, name, filename):
+        """(Internal) Returns the pickled entry for the name and filename, or None."""
+        with self._lock:
+            data = self._unwritten.get((name, filename))
+            if data is None and self._store.open():
+                try:
+                    data = self._store.get(name, filename)
+                except sqlite3.Error:
+                    pass
+        return data
+    
+    def _delete(self, name, filename):
+        """(Internal) Removes the entry for the name and filename."""
+        with self._lock:
+            self._unwritten.pop((name, filename), None)
+            if self._store.open():
+                try:
+                    self._store.delete(name, filename)
+                except sqlite3.Error:
+                    pass
+    
+    def set(self, name, filename, value):
+        """Stores the value for the name and filename.
+        
+        The value is written to the database later, in a background thread.
+        
+        """
+        try:
+            st = os.stat(filename)
+            data = pickle.dumps((st.st_mtime, st.st_size, self._stamp, value), 2)
+        except (IOError, OSError, pickle.PicklingError):
+            return
+        with self._lock:
+            self._unwritten[(name, filename)] = data
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.start()
+    
+    def flush(self):
+        """Writes the stored values to the database in one transaction."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            items, self._unwritten = self._unwritten, {}
+            if items and self._store.open():
+                try:
+                    self._store.setmany((name, filename, data, 1)
+                        for (name, filename), data in items.items())
+                except sqlite3.Error:
+                    pass
+    
+    def clear(self):
+        """Removes all entries and resets the hit and miss counters."""
+        with self._lock:
+            self._unwritten.clear()
+            if self._store.open():
+                try:
+                    self._store.clear()
+                except sqlite3.Error:
+                    pass
+        self.hits = self.misses = 0
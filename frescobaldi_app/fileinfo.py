@@ -24,29 +24,120 @@ Computes and caches various information about files.
 from __future__ import unicode_literals
 
 import functools
+import hashlib
 import itertools
+import mmap
 import os
+import re
 
 import ly.parse
 import ly.lex
 import filecache
+import info
+import slexer
 import util
 import variables
 
 
+# seconds that cached information is used without checking the file's mtime,
+# unless expire() is called for the file, see filecache.FileCache
+ttl = 5
+
+# the functions that use _cache
+_cached = []
+
+
 def _cache(func):
-    """Wraps a function to make it use a FileCache."""
-    cache = filecache.FileCache()
+    """Wraps a function to make it use a FileCache and the DiskCache."""
+    cache = filecache.FileCache(ttl)
     @functools.wraps(func)
     def wrapper(filename):
         try:
             return cache[filename]
         except KeyError:
-            result = cache[filename] = func(filename)
-            return result
+            pass
+        try:
+            result = diskcache().get(func.__name__, filename)
+        except KeyError:
+            result = func(filename)
+            diskcache().set(func.__name__, filename, result)
+        cache[filename] = result
+        return result
+    wrapper.cache = cache
+    _cached.append(wrapper)
     return wrapper
 
 
+def expire(filename):
+    """Makes the cached functions check the mtime of the file on the next call.
+    
+    Call this when the file is known to have changed.
+    
+    """
+    for func in _cached:
+        func.cache.expire(filename)
+
+
+def validate(filenames):
+    """Checks the mtimes of the files in one go for all cached functions.
+    
+    Information about files that changed is removed, the rest is used again
+    without checking for ttl seconds. Call this before looking up many files,
+    so that every file is checked only once.
+    
+    """
+    mtimes = filecache.mtimes(filenames)
+    for func in _cached:
+        func.cache.validate(mtimes)
+
+
+def statistics():
+    """Returns a dictionary with statistics about the caches.
+    
+    For every cached function a dictionary is given, see
+    filecache.FileCache.statistics(). The 'disk' entry contains the hits and
+    misses of the DiskCache.
+    
+    """
+    d = dict((func.__name__, func.cache.statistics()) for func in _cached)
+    d['disk'] = dict(hits=diskcache().hits, misses=diskcache().misses)
+    return d
+
+
+_diskcache = None
+
+def diskcache():
+    """Returns the filecache.DiskCache that stores our information on disk.
+    
+    The database is in the user's data directory. Its stamp depends on the
+    application version and the source of the lexer and parser, so that
+    stored information is discarded when the way it is computed changes.
+    
+    """
+    global _diskcache
+    if _diskcache is None:
+        from PyQt4.QtGui import QDesktopServices
+        path = QDesktopServices.storageLocation(QDesktopServices.DataLocation)
+        _diskcache = filecache.DiskCache(os.path.join(path, 'fileinfo.db'), _stamp())
+    return _diskcache
+
+
+def _stamp():
+    """Returns a string that changes when the lexer or parser changes."""
+    h = hashlib.md5(info.version.encode('utf-8'))
+    directory = os.path.dirname(ly.lex.__file__)
+    sources = [os.path.join(directory, name)
+               for name in sorted(os.listdir(directory)) if name.endswith('.py')]
+    sources.extend(os.path.splitext(m.__file__)[0] + '.py' for m in (slexer, ly.parse))
+    for source in sources:
+        try:
+            with open(source, 'rb') as f:
+                h.update(f.read())
+        except (IOError, OSError):
+            pass
+    return h.hexdigest()
+
+
 def textmode(text, guess=True):
     """Returns the type of the given text ('lilypond, 'html', etc.).
     
@@ -63,9 +154,21 @@ def textmode(text, guess=True):
 @_cache
 def mode(filename):
     """Returns the type of the text in the given filename."""
-    with open(filename) as f:
-        text = util.decode(f.read())
-    return textmode(text)
+    return scanmode(filename)
+
+
+def scanmode(filename, prefix=True):
+    """Reads the file and returns the type of its text.
+    
+    If prefix is True (the default), only the start and the end of the file
+    are read and decoded; the file is searched for the mode markers without
+    decoding it. Otherwise the whole file is read and decoded.
+    
+    """
+    with Contents(filename) as contents:
+        if prefix:
+            return contents.mode()
+        return textmode(contents.text())
 
 
 def tokens(filename):
@@ -81,10 +184,56 @@ def includeargs(filename):
     
     The return value is cached until the mtime of the file changes.
     
+    """
+    return scanincludeargs(filename)
+
+
+def scanincludeargs(filename):
+    """Reads the file and returns the list of its \\include arguments.
+    
+    The result is not cached, see includeargs().
+    
     """
     return list(ly.parse.includeargs(tokens(filename)))
 
 
+# the minimum number of files scanincludes() scans in the scanpool
+minscan = 8
+
+def scanincludes(filenames):
+    """Computes includeargs() for many files at once.
+    
+    The files that are not cached in memory or on disk are read and tokenized
+    in the worker processes of the scanpool, using all processor cores, and
+    the results are stored in the caches of includeargs(). Nothing is done if
+    the pool is not available, or if there are less than minscan files to
+    scan; includeargs() then scans the files when they are requested.
+    
+    """
+    todo = []
+    for filename in filenames:
+        if filename not in includeargs.cache:
+            try:
+                includeargs.cache[filename] = diskcache().get('includeargs', filename)
+            except KeyError:
+                todo.append(filename)
+    if len(todo) < minscan:
+        return
+    import scanpool
+    if not scanpool.available():
+        return
+    for filename, mtime, args in scanpool.scan(todo):
+        if mtime is not None:
+            includeargs.cache.store(filename, args, mtime)
+            diskcache().set('includeargs', filename, args)
+
+
+def _prepare(filenames):
+    """(Internal) Called by the graph() before it scans the filenames."""
+    validate(filenames)
+    scanincludes(filenames)
+
+
 def includefiles(filename, include_path=[], initial_args=None):
     """Returns a set of filenames that are included by the given pathname.
         
@@ -96,33 +245,22 @@ def includefiles(filename, include_path=[], initial_args=None):
     
     If initial_args is given, the filename itself is not scanned for include_args.
     
+    The include relations are kept in the graph(), so only the files that
+    changed are scanned again.
+    
     """
-    files = set()
-    
-    def tryarg(directory, arg):
-        path = os.path.join(directory, arg)
-        if os.path.exists(path) and path not in files:
-            files.add(path)
-            args = includeargs(path)
-            find(args, os.path.dirname(path))
-            return True
-            
-    def find(incl_args, directory):
-        for arg in incl_args:
-            # new, recursive, relative include
-            if not (directory and tryarg(directory, arg)):
-                # old include (relative to master file)
-                if not (basedir and tryarg(basedir, arg)):
-                    # if path is given, also search there:
-                    for p in include_path:
-                        if tryarg(p, arg):
-                            break
-    
-    if initial_args is None:
-        initial_args = includeargs(filename)
-    basedir = os.path.dirname(filename)
-    find(initial_args, basedir)
-    return files
+    return graph().includefiles(filename, include_path, initial_args)
+
+
+_graph = None
+
+def graph():
+    """Returns the includegraph.IncludeGraph that is used by includefiles()."""
+    global _graph
+    if _graph is None:
+        import includegraph
+        _graph = includegraph.IncludeGraph(includeargs, expire, _prepare)
+    return _graph
 
 
 @_cache
@@ -155,6 +293,8 @@ def basenames(filename, includefiles = None, initial_outputargs = None):
     if initial_outputargs is None:
         initial_outputargs = outputargs(filename)
     
+    validate(includes)
+    
     def args():
         yield initial_outputargs
         for filename in includes:
@@ -179,23 +319,133 @@ def version(filename):
     
     The version is cached until the file changes.
     
+    """
+    return scanversion(filename)
+
+
+def scanversion(filename, prefix=True):
+    """Reads the file and returns the LilyPond version as a tuple of ints.
+    
+    See version(). If prefix is True (the default), first only the start of
+    the file is tokenized, as the version is almost always set there. Only if
+    no version is found there, the whole file is decoded and tokenized.
+    
     """
     mkver = lambda strings: tuple(map(int, strings))
-    with open(filename) as f:
-        text = util.decode(f.read())
-    mode = textmode(text)
-    tokens_ = list(ly.lex.state(mode).tokens(text))
-
-    version = ly.parse.version(tokens_)
-    if version:
-        return mkver(re.findall(r"\d+", version))
-    # look at document variables
-    version = variables.variables(text).get("version")
-    if version:
-        return mkver(re.findall(r"\d+", version))
-    # parse whole document for non-lilypond comments
-    if mode != "lilypond":
-        m = re.search(r'\\version\s*"(\d+\.\d+(\.\d+)*)"', text)
-        if m:
-            return mkver(m.group(1).split('.'))
+    with Contents(filename) as contents:
+        if prefix:
+            mode = contents.mode()
+            version = ly.parse.version(ly.lex.state(mode).tokens(contents.head()))
+            if version:
+                return mkver(re.findall(r"\d+", version))
+            variables_ = contents.variables()
+        else:
+            mode = textmode(contents.text())
+            variables_ = variables.variables(contents.text())
+        if not prefix or not contents.isComplete():
+            version = ly.parse.version(ly.lex.state(mode).tokens(contents.text()))
+            if version:
+                return mkver(re.findall(r"\d+", version))
+        # look at document variables
+        version = variables_.get("version")
+        if version:
+            return mkver(re.findall(r"\d+", version))
+        # parse whole document for non-lilypond comments
+        if mode != "lilypond":
+            m = re.search(r'\\version\s*"(\d+\.\d+(\.\d+)*)"', contents.text())
+            if m:
+                return mkver(m.group(1).split('.'))
+
+
+class Contents(object):
+    """Gives access to the contents of a file, reading as little as possible.
+    
+    The file is memory-mapped. head() returns the decoded first HEAD bytes,
+    text() the decoded full text. mode() and variables() only look at the
+    start and the end of the file.
+    
+    Use it as a context manager to close the file when done.
+    
+    """
+    
+    # number of bytes that head() returns
+    HEAD = 8192
+    
+    def __init__(self, filename):
+        with open(filename, 'rb') as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                # an empty file can't be mapped
+                self._data = f.read()
+        self._head = None
+        self._text = None
+        self._variables = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    def close(self):
+        """Closes the memory map."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+    
+    def isComplete(self):
+        """Returns True if head() returns the whole file."""
+        return len(self._data) <= self.HEAD
+    
+    def _lines(self, data):
+        """(Internal) Decodes the data, leaving out a possibly partial last line."""
+        if len(data) == len(self._data):
+            return util.decode(data)
+        return util.decode(data[:data.rfind(b'\n') + 1])
+    
+    def head(self):
+        """Returns the decoded start of the file, ending with a full line."""
+        if self._head is None:
+            if self._text is not None or self.isComplete():
+                self._head = self.text()
+            else:
+                self._head = self._lines(self._data[:self.HEAD])
+        return self._head
+    
+    def text(self):
+        """Returns the decoded text of the whole file."""
+        if self._text is None:
+            self._text = util.decode(self._data[:])
+        return self._text
+    
+    def contains(self, string):
+        """Returns True if the ASCII string is in the file, without decoding it."""
+        return self._data.find(string.encode('ascii')) != -1
+    
+    def variables(self):
+        """Returns the document variables, see variables.variables()."""
+        if self._variables is None:
+            if self.isComplete():
+                d = variables.variables(self.text())
+            else:
+                # the variables are ASCII, no need to decode
+                count = variables._LINES
+                head = self._data[:self.HEAD].split(b'\n', count)[:count]
+                d = variables.variables(b'\n'.join(head))
+                tail = self._data[-self.HEAD:].rsplit(b'\n', count)[-count:]
+                d.update(variables.variables(b'\n'.join(tail)))
+            self._variables = d
+        return self._variables
+    
+    def mode(self):
+        """Returns the type of the text, see textmode()."""
+        mode = self.variables().get("mode")
+        if mode in ly.lex.modes:
+            return mode
+        head = self.head()
+        if self.isComplete():
+            return ly.lex.guessMode(head)
+        # the start of the text and the presence of markers decide the mode
+        markers = [m for ms in ly.lex.markers.values() for m in ms if self.contains(m)]
+        return ly.lex.guessMode(head + '\n' + ' '.join(markers))
 
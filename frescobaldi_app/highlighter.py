@@ -24,11 +24,16 @@ about a document's contents.
 
 from __future__ import unicode_literals
 
+import collections
+import time
+import weakref
 
+from PyQt4.QtCore import QPoint, QTimer
 from PyQt4.QtGui import (
     QSyntaxHighlighter, QTextBlockUserData, QTextCursor, QTextDocument)
 
 
+import slexer
 import ly.lex
 import ly.lex.lilypond
 import ly.lex.scheme
@@ -36,9 +41,11 @@ import ly.lex.html
 import ly.lex.texinfo
 
 import app
+import cursortools
 import textformats
 import metainfo
 import plugin
+import signals
 import variables
 import documentinfo
 
@@ -162,10 +169,46 @@ class HighlightFormats(object):
 
         
 class Highlighter(QSyntaxHighlighter, plugin.Plugin):
+    """Highlights a Document and stores the tokens of every block.
+    
+    Large documents are highlighted lazily: when highlighting takes longer
+    than timeSlice seconds, the remaining blocks are postponed and handled in
+    chunks when the application is idle. Blocks that are visible in a View are
+    handled first: the blocks before them are only tokenized, and formatted
+    later.
+    
+    A block is "lexed" if its tokens and state are up-to-date. Use isLexed()
+    to check this and ensureLexed() to tokenize the document up to a block.
+    The functions in the tokeniter module do this automatically.
+    
+    When many more states are stored than there are blocks, the states that
+    are not used anymore are dropped when the application is idle (see
+    compactStates()).
+    
+    """
+    
+    # if True, highlighting is done in chunks of at most timeSlice seconds
+    lazy = True
+    
+    # maximum time (in seconds) to highlight in one go
+    timeSlice = 0.05
+    
+    # if True, the tokens are stored in a slexer.TokenArray to save memory
+    compactTokens = False
+    
+    # emitted with the block and its tokens every time a block is tokenized
+    blockLexed = signals.Signal()
+    
     def __init__(self, document):
         QSyntaxHighlighter.__init__(self, document)
         self._fridge = ly.lex.Fridge()
-        app.settingsChanged.connect(self.rehighlight)
+        self._generation = 0
+        self._pending = self._cursor(document.firstBlock()) # first block not lexed
+        self._unformatted = None    # cursor at first block that is lexed but not formatted
+        self._formatGeneration = 0
+        self._deadline = None
+        self._timer = QTimer(singleShot=True, timeout=self._continue)
+        app.settingsChanged.connect(self.reformat)
         self._highlighting = metainfo.info(document).highlighting
         document.loaded.connect(self._resetHighlighting)
         self._mode = documentinfo.mode(document, False)
@@ -183,20 +226,24 @@ class Highlighter(QSyntaxHighlighter, plugin.Plugin):
         
     def highlightBlock(self, text):
         """Called by Qt when the highlighting of the current line needs updating."""
-        # find the state of the previous line
+        block = self.currentBlock()
+        data = userData(block)
         prev = self.previousBlockState()
-        state = self._fridge.thaw(prev)
-        blank = not state and (not text or text.isspace())
-        if not state:
-            state = self.initialState()
-
-        # collect and save the tokens
-        data = userData(self.currentBlock())
-        data.tokens = tokens = tuple(state.tokens(text))
-        
-        # if blank thus far, keep the highlighter coming back
-        # because the parsing state is not yet known; else save the state
-        self.setCurrentBlockState(prev - 1 if blank else self._fridge.freeze(state))
+        if self._isCurrent(block, prev):
+            # the block was lexed before, only the formatting is needed
+            tokens = blockTokens(block)
+            self._advance(block)
+        elif self._mayLex(block):
+            tokens, num = self._lex(block, text, prev)
+            self.setCurrentBlockState(num)
+            self._advance(block)
+        else:
+            # leave the state unchanged, the block is lexed later; meanwhile
+            # keep the old formatting if the text did not change
+            self._postpone(block)
+            key = getattr(data, 'key', None)
+            tokens = blockTokens(block) if key and key[2] == block.revision() else ()
+        data.formatted = self._formatGeneration
         
         # apply highlighting if desired
         if self._highlighting:
@@ -206,13 +253,256 @@ class Highlighter(QSyntaxHighlighter, plugin.Plugin):
                 f = formats.format(token)
                 if f:
                     setFormat(f)
+    
+    def _lex(self, block, text, prev):
+        """(Internal) Tokenizes the text of the block.
+        
+        prev is the state number of the previous block. The tokens are stored
+        in the block's userData. Returns the tokens and the new state number.
+        
+        """
+        state = self._fridge.thaw(prev)
+        blank = not state and (not text or text.isspace())
+        if not state:
+            state = self.initialState()
+        
+        # collect and save the tokens
+        data = userData(block)
+        tokens = tuple(state.tokens(text))
+        if self.compactTokens:
+            data.tokens = slexer.TokenArray(tokens)
+            _keepDecoded(data, tokens)
+        else:
+            data.tokens = tokens
+        data.key = (self._generation, prev, block.revision())
+        self.blockLexed(block, tokens)
         
+        # if blank thus far, keep the highlighter coming back
+        # because the parsing state is not yet known; else save the state
+        if blank:
+            return tokens, prev - 1
+        num = self._fridge.freeze(state)
+        if num > 2 * self.document().blockCount() + 100:
+            # many states are unused, compact them when idle
+            self._timer.start()
+        return tokens, num
+    
+    def _isCurrent(self, block, prev):
+        """(Internal) Returns True if the stored tokens of the block are valid.
+        
+        prev is the state number of the previous block.
+        
+        """
+        key = getattr(userData(block), 'key', None)
+        return (key == (self._generation, prev, block.revision())
+                and self.isLexed(block.previous()))
+    
+    def _mayLex(self, block):
+        """(Internal) Returns True if the block may be lexed now."""
+        if block.previous().isValid() and not self.isLexed(block.previous()):
+            return False
+        elif not self.lazy:
+            return True
+        now = time.time()
+        if self._deadline is None:
+            self._deadline = now + self.timeSlice
+            QTimer.singleShot(0, self._resetDeadline)
+        return now < self._deadline
+    
+    def _resetDeadline(self):
+        """(Internal) Called when control returned to the event loop."""
+        self._deadline = None
+    
+    def _advance(self, block):
+        """(Internal) Called when a block has been lexed."""
+        if self._pending is not None:
+            pos = self._pending.position()
+            if block.position() <= pos < block.position() + block.length():
+                block = block.next()
+                if block.isValid():
+                    self._pending.setPosition(block.position())
+                else:
+                    self._pending = None
+    
+    def _postpone(self, block):
+        """(Internal) Marks the block as not lexed and schedules lexing it."""
+        if self._pending is None or block.position() < self._pending.position():
+            self._pending = self._cursor(block)
+        self._timer.start()
+    
+    def _cursor(self, block):
+        """(Internal) Returns a QTextCursor at the start of the block.
+        
+        The cursor keeps its position when text is inserted there.
+        
+        """
+        cursor = QTextCursor(block)
+        cursor.setKeepPositionOnInsert(True)
+        return cursor
+    
+    def isLexed(self, block):
+        """Returns True if the block's tokens and state are up-to-date."""
+        return self._pending is None or (
+            block.position() + block.length() <= self._pending.position())
+    
+    def busy(self):
+        """Returns True if there are blocks left to be highlighted."""
+        return self._pending is not None or self._unformatted is not None
+    
+    def ensureLexed(self, block):
+        """Tokenizes the document up to and including the given block.
+        
+        The blocks are not formatted, that is done later. This method
+        does nothing if the block is already lexed.
+        
+        """
+        while self._pending is not None and not self.isLexed(block):
+            cur = self.document().findBlock(self._pending.position())
+            prev = cur.previous().userState()
+            if not self._isCurrent(cur, prev):
+                tokens, num = self._lex(cur, cur.text(), prev)
+                if num != cur.userState():
+                    cur.setUserState(num)
+                data = userData(cur)
+                if getattr(data, 'formatted', None) is not None:
+                    data.formatted = None
+                    if (self._unformatted is None
+                        or cur.position() < self._unformatted.position()):
+                        self._unformatted = self._cursor(cur)
+            self._advance(cur)
+        
+    def _isFormatted(self, block):
+        """(Internal) Returns True if the block has the current formatting."""
+        return getattr(userData(block), 'formatted', None) == self._formatGeneration
+    
+    def _continue(self):
+        """(Internal) Continues highlighting when the application is idle.
+        
+        The blocks visible in a View are always handled. Besides that, all
+        Highlighters together spend at most timeSlice seconds in one iteration
+        of the event loop; if that time is used up, we continue in a later
+        iteration.
+        
+        """
+        global _idleDeadline
+        now = time.time()
+        if _idleDeadline is None:
+            _idleDeadline = now + self.timeSlice
+            QTimer.singleShot(0, _resetIdleDeadline)
+        self._deadline = deadline = _idleDeadline
+        QTimer.singleShot(0, self._resetDeadline)
+        
+        # first the blocks visible in a View
+        for first, last in self._visibleBlocks():
+            self.ensureLexed(last)
+            block = first
+            while block.isValid() and block.position() <= last.position():
+                if not self._isFormatted(block):
+                    self.rehighlightBlock(block)
+                block = block.next()
+        
+        # then the blocks that were lexed but not formatted
+        while self._unformatted is not None and time.time() < deadline:
+            block = self.document().findBlock(self._unformatted.position())
+            while block.isValid() and self.isLexed(block) and time.time() < deadline:
+                if not self._isFormatted(block):
+                    self.rehighlightBlock(block)
+                block = block.next()
+            if block.isValid() and self.isLexed(block):
+                self._unformatted.setPosition(block.position())
+            else:
+                self._unformatted = None
+        
+        # then continue with the blocks that are not yet lexed
+        while self._pending is not None and time.time() < deadline:
+            block = self.document().findBlock(self._pending.position())
+            if self._isCurrent(block, block.previous().userState()):
+                self._advance(block)
+            else:
+                self.rehighlightBlock(block)
+        
+        if self._pending is not None or self._unformatted is not None:
+            self._timer.start()
+        elif self._fridge.count() > 2 * self.document().blockCount() + 100:
+            self.compactStates()
+    
+    def _visibleBlocks(self):
+        """(Internal) Yields (first, last) block tuples visible in our Views."""
+        doc = self.document()
+        for view in list(_views):
+            try:
+                if view.document() is not doc or not view.isVisible():
+                    continue
+            except RuntimeError:
+                continue # the view is being deleted
+            first = view.firstVisibleBlock()
+            last = view.cursorForPosition(
+                QPoint(0, view.viewport().height() - 1)).block()
+            if first.isValid() and last.isValid():
+                yield first, last
+    
+    def rehighlight(self):
+        """Reimplemented to start with an empty store of frozen states.
+        
+        All blocks get a new state, so the old states are not needed anymore.
+        If lazy is True, the blocks keep their current formatting until they
+        have been highlighted again.
+        
+        """
+        self._fridge.clear()
+        self._generation += 1
+        if self.lazy:
+            self._pending = self._cursor(self.document().firstBlock())
+            self._unformatted = None
+            self._continue()
+        else:
+            self._pending = self._unformatted = None
+            super(Highlighter, self).rehighlight()
+    
+    def reformat(self):
+        """Applies the highlighting formats again, without re-tokenizing.
+        
+        This is done when the highlighting formats have changed. The stored
+        tokens of all blocks are used. If lazy is True, the visible blocks are
+        formatted immediately and the others when the application is idle.
+        
+        """
+        self._formatGeneration += 1
+        self._unformatted = self._cursor(self.document().firstBlock())
+        if self.lazy:
+            self._continue()
+        else:
+            block = self.document().firstBlock()
+            while block.isValid() and self.isLexed(block):
+                self.rehighlightBlock(block)
+                block = block.next()
+            self._unformatted = None
+    
+    def compactStates(self):
+        """Drops the frozen states that are not used by any block anymore.
+        
+        When a document is edited for a long time, the store of frozen states
+        can contain many states that are not used anymore. This method keeps
+        only the states that are used and renumbers the blocks' states.
+        
+        """
+        blocks = list(cursortools.allBlocks(self.document()))
+        mapping = self._fridge.compact(block.userState() for block in blocks)
+        for block in blocks:
+            data = block.userData()
+            key = getattr(data, 'key', None)
+            if key and key[1] >= 0:
+                data.key = (key[0], mapping.get(key[1], -1), key[2])
+            num = block.userState()
+            if num >= 0:
+                block.setUserState(mapping.get(num, -1))
+    
     def setHighlighting(self, enable):
         """Enables or disables highlighting."""
         changed = enable != self._highlighting
         self._highlighting = enable
         if changed:
-            self.rehighlight()
+            self.reformat()
             
     def isHighlighting(self):
         """Returns whether highlighting is active."""
@@ -230,8 +520,24 @@ class Highlighter(QSyntaxHighlighter, plugin.Plugin):
 
     def initialState(self):
         """Returns the initial State for this document."""
-        mode = self._mode or ly.lex.guessMode(self.document().toPlainText())
-        return ly.lex.state(mode)
+        return ly.lex.state(documentinfo.mode(self.document()))
+
+
+# time until which Highlighters may work in the current event loop iteration
+_idleDeadline = None
+
+def _resetIdleDeadline():
+    global _idleDeadline
+    _idleDeadline = None
+
+
+# Views showing a document, used to highlight visible blocks first
+_views = weakref.WeakKeyDictionary()
+
+def _viewCreated(view):
+    _views[view] = True
+
+app.viewCreated.connect(_viewCreated)
 
 
 def userData(block):
@@ -243,6 +549,34 @@ def userData(block):
     return data
 
 
+def blockTokens(block):
+    """Returns the tokens stored for the block as a (possibly empty) tuple.
+    
+    Use tokeniter.tokens() to be sure the tokens are up-to-date.
+    
+    """
+    data = block.userData()
+    tokens = getattr(data, 'tokens', ())
+    if isinstance(tokens, slexer.TokenArray):
+        decoded = getattr(data, 'decoded', None)
+        if decoded and decoded[0] is tokens:
+            return decoded[1]
+        tokens = tokens.tokens(block.text())
+        _keepDecoded(data, tokens)
+    return tokens
+
+
+# block data of the most recently decoded TokenArrays, see blockTokens()
+_decoded = collections.deque(maxlen=200)
+
+def _keepDecoded(data, tokens):
+    """Keeps the tokens decoded from data.tokens for the recently used blocks."""
+    if len(_decoded) == _decoded.maxlen:
+        _decoded[0].decoded = None
+    data.decoded = (data.tokens, tokens)
+    _decoded.append(data)
+
+
 def htmlCopy(document, type='editor'):
     """Returns a new QTextDocument with highlighting set as HTML textcharformats."""
     data = textformats.formatData(type)
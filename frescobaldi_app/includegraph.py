@@ -0,0 +1,321 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Keeps track of which files include which other files.
+
+The IncludeGraph stores the \\include relations between files, in both
+directions. It finds the files included by a master file (see
+fileinfo.includefiles()) and the master files that include a given file.
+
+The relations are checked again when they are used, and updated as soon as
+files or the directories they were searched in change on disk.
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+from PyQt4.QtCore import QFileSystemWatcher
+
+
+class IncludeGraph(object):
+    """Stores the include relations between files.
+    
+    scan is a function returning the list of \\include arguments of a file
+    (e.g. fileinfo.includeargs). If changed is given, it is called with the
+    name of a scanned file that changed on disk. If prepare is given, it is
+    called with the files of every level of includes before they are scanned,
+    so that e.g. their mtimes can be checked in one go and they can be
+    scanned in parallel (see fileinfo.scanincludes()).
+    
+    How an \\include argument is resolved to a file name depends on the
+    directory of the master file and on the include path. Together they are
+    the context of a relation; an edge is stored for every context a file is
+    scanned in.
+    
+    Edges are computed when they are needed. Every time an edge is used, the
+    file is scanned again; as the scan function caches its results and checks
+    the mtime of the file, this is cheap, and the edge is only computed again
+    if the include arguments changed. Edges are also dropped when the
+    including file or one of the directories searched for the included files
+    changes, and forgotten when no master file includes the file anymore.
+    
+    """
+    def __init__(self, scan, changed=None, prepare=None):
+        self._scan = scan
+        self._changed = changed
+        self._prepare = prepare
+        self._edges = {}    # (context, filename) -> (arguments, included files, searched directories)
+        self._reverse = {}  # filename -> set of (context, including filename) keys
+        self._contexts = {} # filename -> set of contexts it has edges in
+        self._searched = {} # directory -> set of (context, filename) keys
+        self._masters = {}  # (context, master filename) -> set of included files
+        self._given = {}    # (context, master filename) -> arguments given to includefiles()
+        self._dirty = set() # (context, filename) keys that were dropped because of a change
+        self._watcher = QFileSystemWatcher()
+        self._watcher.fileChanged.connect(self._pathChanged)
+        self._watcher.directoryChanged.connect(self._pathChanged)
+        self._watched = {}  # watched path -> set of paths it is watched for
+        self._watching = {} # path -> watched path
+    
+    def includefiles(self, filename, include_path=(), initial_args=None):
+        """Returns a set of filenames that are included by the given filename.
+        
+        See fileinfo.includefiles(). The filename is remembered as a master
+        file, see masters(). The edges of files the filename included the
+        previous time but not anymore are forgotten, unless another master
+        file in the same context includes them.
+        
+        """
+        context = (os.path.dirname(filename), tuple(include_path))
+        key = (context, filename)
+        if initial_args is None:
+            self._given.pop(key, None)
+        else:
+            self._given[key] = list(initial_args)
+        return self._update(key)
+    
+    def includers(self, filename):
+        """Returns the set of files that include the filename, also indirectly.
+        
+        Only the files that are included by master files are known.
+        
+        """
+        return set(key[1] for key in self._walk(filename))
+    
+    def masters(self, filename):
+        """Returns the set of master files that include the filename.
+        
+        Master files are the files includefiles() was called with.
+        
+        """
+        return set(key[1] for key in self._walk(filename) if key in self._masters)
+    
+    def _update(self, key):
+        """(Internal) Finds the files the master file of the key includes.
+        
+        Remembers and returns the set of files, and prunes the files it
+        included the previous time but not anymore.
+        
+        """
+        context = key[0]
+        todo = list(self._includes(key))
+        files = set()
+        while todo:
+            # handle the files level by level, preparing them in one go
+            new = set(todo) - files
+            files.update(new)
+            if self._prepare and new:
+                self._prepare(new)
+            todo = [f for path in new for f in self._includes((context, path))]
+        old = self._masters.get(key, set())
+        self._masters[key] = files
+        self._prune(context, old - files)
+        return files
+    
+    def _walk(self, filename):
+        """(Internal) Returns the set of (context, filename) keys including the filename.
+        
+        The files that include the filename directly or indirectly are found
+        by following the reverse edges, checking every edge that is used.
+        
+        """
+        self._refresh()
+        keys = set()
+        todo = [(None, filename)]
+        while todo:
+            context, path = todo.pop()
+            for key in list(self._reverse.get(path, ())):
+                if key not in keys and context in (None, key[0]):
+                    edge = self._edges[key]
+                    if path in self._includes(key):
+                        keys.add(key)
+                        todo.append(key)
+                    if self._edges.get(key) is not edge:
+                        # the master files including it must be updated
+                        self._dirty.add(key)
+        self._refresh()
+        return keys
+    
+    def _refresh(self):
+        """(Internal) Updates the master files including files whose edges changed."""
+        if self._dirty:
+            changed = {}
+            for context, filename in self._dirty:
+                changed.setdefault(context, set()).add(filename)
+            self._dirty.clear()
+            for key, files in list(self._masters.items()):
+                names = changed.get(key[0])
+                if (names and key in self._masters
+                    and (key[1] in names or not names.isdisjoint(files))):
+                    self._update(key)
+    
+    def _includes(self, key):
+        """(Internal) Returns the set of files included directly by the (context, filename) key.
+        
+        The file is scanned again, and the edges are computed again if its
+        include arguments changed.
+        
+        """
+        try:
+            args = self._given[key]
+        except KeyError:
+            try:
+                args = self._scan(key[1])
+            except (IOError, OSError):
+                args = ()
+        edge = self._edges.get(key)
+        if edge and edge[0] == args:
+            return edge[1]
+        return self._store(key, args)
+    
+    def _store(self, key, args):
+        """(Internal) Resolves and stores the edges for the include arguments.
+        
+        Returns the set of included files.
+        
+        """
+        self._drop(key)
+        context, filename = key
+        files, searched = self._resolve(context, filename, args)
+        self._edges[key] = (args, files, searched)
+        self._contexts.setdefault(filename, set()).add(context)
+        for path in files:
+            self._reverse.setdefault(path, set()).add(key)
+        for directory in searched:
+            self._searched.setdefault(directory, set()).add(key)
+            self._watch(directory)
+        self._watch(filename)
+        return files
+    
+    def _resolve(self, context, filename, args):
+        """(Internal) Resolves the include arguments of filename.
+        
+        Returns the set of found files and the set of directories searched.
+        Arguments are searched relative to the including file, then relative
+        to the master file, and then in the include path.
+        
+        """
+        basedir, include_path = context
+        directories = (os.path.dirname(filename), basedir) + include_path
+        files = set()
+        searched = set()
+        for arg in args:
+            for directory in directories:
+                if directory:
+                    path = os.path.join(directory, arg)
+                    searched.add(os.path.dirname(path))
+                    if os.path.exists(path):
+                        files.add(path)
+                        break
+        return files, searched
+    
+    def _drop(self, key):
+        """(Internal) Forgets the edges of the (context, filename) key."""
+        try:
+            args, files, searched = self._edges.pop(key)
+        except KeyError:
+            return
+        context, filename = key
+        for path in files:
+            keys = self._reverse[path]
+            keys.discard(key)
+            if not keys:
+                del self._reverse[path]
+        contexts = self._contexts[filename]
+        contexts.discard(context)
+        if not contexts:
+            del self._contexts[filename]
+            self._unwatch(filename)
+        for directory in searched:
+            keys = self._searched[directory]
+            keys.discard(key)
+            if not keys:
+                del self._searched[directory]
+                self._unwatch(directory)
+    
+    def _prune(self, context, files):
+        """(Internal) Forgets the edges of the files no master file in the context includes."""
+        if files:
+            for (c, master), included in self._masters.items():
+                if c == context:
+                    files = files - included
+                    files.discard(master)
+            for filename in files:
+                self._drop((context, filename))
+    
+    def _watch(self, path):
+        """(Internal) Starts watching the file or directory.
+        
+        If it does not exist, its nearest existing parent directory is watched,
+        so that a change is noticed when it is created.
+        
+        """
+        if path in self._watching:
+            return
+        watched = path
+        while not os.path.exists(watched):
+            parent = os.path.dirname(watched)
+            if parent == watched:
+                return
+            watched = parent
+        self._watching[path] = watched
+        paths = self._watched.setdefault(watched, set())
+        if not paths:
+            self._watcher.addPath(watched)
+        paths.add(path)
+    
+    def _unwatch(self, path):
+        """(Internal) Stops watching the file or directory."""
+        watched = self._watching.pop(path, None)
+        if watched is not None:
+            paths = self._watched[watched]
+            paths.discard(path)
+            if not paths:
+                del self._watched[watched]
+                self._watcher.removePath(watched)
+    
+    def _pathChanged(self, watched):
+        """Called when a watched file or directory changes, drops the edges that depend on it."""
+        paths = self._watched.pop(watched, ())
+        if paths:
+            self._watcher.removePath(watched)
+        for path in paths:
+            del self._watching[path]
+        for path in paths:
+            if path in self._contexts:
+                if self._changed:
+                    self._changed(path)
+                for context in list(self._contexts[path]):
+                    self._drop((context, path))
+                    self._dirty.add((context, path))
+                if not os.path.exists(path):
+                    self._removeMaster(path)
+            for key in list(self._searched.get(path, ())):
+                self._drop(key)
+                self._dirty.add(key)
+    
+    def _removeMaster(self, filename):
+        """(Internal) Forgets the removed master file and prunes the files it included."""
+        for key in [key for key in self._masters if key[1] == filename]:
+            files = self._masters.pop(key)
+            self._given.pop(key, None)
+            self._prune(key[0], files)
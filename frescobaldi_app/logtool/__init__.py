@@ -41,6 +41,8 @@ class LogTool(panel.Panel):
         ac = self.actionCollection = Actions()
         ac.log_next_error.triggered.connect(self.slotNextError)
         ac.log_previous_error.triggered.connect(self.slotPreviousError)
+        ac.log_profile_tokenizer.toggled.connect(self.slotProfileTokenizer)
+        ac.log_show_tokenizer_profile.triggered.connect(self.slotShowTokenizerProfile)
         actioncollectionmanager.manager(mainwindow).addActionCollection(ac)
         mainwindow.addDockWidget(Qt.BottomDockWidgetArea, self)
         app.jobStarted.connect(self.slotJobStarted)
@@ -76,6 +78,26 @@ class LogTool(panel.Panel):
         """Jumps to the position pointed to by the next error message."""
         self.activate()
         self.widget().gotoError(-1)
+    
+    def slotProfileTokenizer(self, enable):
+        """Starts or stops recording timing information in the tokenizer."""
+        import slexer
+        if enable:
+            slexer.enableProfiling()
+        else:
+            slexer.disableProfiling()
+        self.actionCollection.log_show_tokenizer_profile.setEnabled(enable)
+    
+    def slotShowTokenizerProfile(self):
+        """Writes the timing information of the tokenizer to the log."""
+        import job
+        import slexer
+        profile = slexer.profile()
+        if profile:
+            self.activate()
+            self.widget().write(_("Tokenizer profile:") + "\n", job.NEUTRAL)
+            self.widget().write(profile.report(), job.STDOUT)
+            profile.clear()
         
 
 class Actions(actioncollection.ActionCollection):
@@ -83,6 +105,8 @@ class Actions(actioncollection.ActionCollection):
     def createActions(self, parent=None):
         self.log_next_error = QAction(parent)
         self.log_previous_error = QAction(parent)
+        self.log_profile_tokenizer = QAction(parent, checkable=True)
+        self.log_show_tokenizer_profile = QAction(parent, enabled=False)
         
         self.log_next_error.setShortcut(QKeySequence("Ctrl+E"))
         self.log_previous_error.setShortcut(QKeySequence("Ctrl+Shift+E"))
@@ -90,6 +114,8 @@ class Actions(actioncollection.ActionCollection):
     def translateUI(self):
         self.log_next_error.setText(_("Next Error Message"))
         self.log_previous_error.setText(_("Previous Error Message"))
+        self.log_profile_tokenizer.setText(_("Profile Tokenizer"))
+        self.log_show_tokenizer_profile.setText(_("Show Tokenizer Profile"))
 
 
 # log errors by initializing Errors instance
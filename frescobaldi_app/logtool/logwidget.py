@@ -126,6 +126,16 @@ class LogWidget(log.Log):
                 message = message.encode('latin1').decode('utf-8')
             super(LogWidget, self).writeMessage(message, type)
 
+    def contextMenuEvent(self, ev):
+        """Reimplemented to add the tokenizer profiling actions."""
+        menu = self.createStandardContextMenu(ev.pos())
+        ac = self.parentWidget().actionCollection
+        menu.addSeparator()
+        menu.addAction(ac.log_profile_tokenizer)
+        menu.addAction(ac.log_show_tokenizer_profile)
+        menu.exec_(ev.globalPos())
+        menu.deleteLater()
+    
     def slotAnchorClicked(self, url):
         """Called when the user clicks a filename in the log."""
         index = int(url.toString())
@@ -0,0 +1,185 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Stores values in a SQLite database, removing the least recently used ones.
+
+This module only needs the sqlite3 module, it is used by the filecache module
+and by the qpopplerview.diskcache module.
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import sqlite3
+import time
+
+
+class Store(object):
+    """Keeps strings in a table of a SQLite database, under a group and a key.
+    
+    Every value is stored with a size. When the total size grows larger than
+    maxsize, the least recently used values are removed until 90% of maxsize
+    remains. The size can be the length of the value, or e.g. 1 to limit the
+    number of values.
+    
+    Call open() first, the other methods may only be called if it returned
+    True. They raise sqlite3.Error if the database can't be used. A Store can
+    be used from other threads than the one that opened it, but only by one
+    thread at a time.
+    
+    The database uses write-ahead logging and does not wait for the disk
+    after every change, which is safe for a cache, as at most the last
+    changes are lost if the computer crashes. Use setmany() to store many
+    values in one transaction.
+    
+    """
+    def __init__(self, path, table, maxsize):
+        self.path = path
+        self.table = table
+        self.maxsize = maxsize
+        self._db = None
+        self._size = 0
+    
+    def open(self):
+        """Opens the database if needed, returns True if it can be used."""
+        if self._db is None:
+            self._db = False
+            try:
+                directory = os.path.dirname(self.path)
+                if directory and not os.path.isdir(directory):
+                    os.makedirs(directory)
+                db = sqlite3.connect(self.path, isolation_level=None, timeout=1,
+                                     check_same_thread=False)
+                db.execute("pragma journal_mode=wal")
+                db.execute("pragma synchronous=normal")
+                db.execute(
+                    "create table if not exists {0} ("
+                    "grp text, key text, used integer, size integer, value blob, "
+                    "primary key (grp, key))".format(self.table))
+                db.execute("create index if not exists {0}_used on {0} (used)".format(self.table))
+                self._size = db.execute(
+                    "select sum(size) from {0}".format(self.table)).fetchone()[0] or 0
+            except (IOError, OSError, sqlite3.Error):
+                pass
+            else:
+                self._db = db
+        return bool(self._db)
+    
+    def close(self):
+        """Closes the database."""
+        if self._db:
+            self._db.close()
+        self._db = None
+    
+    def get(self, group, key):
+        """Returns the value stored under the group and key, None if not found."""
+        row = self._db.execute(
+            "select used, value from {0} where grp = ? and key = ?".format(self.table),
+            (group, key)).fetchone()
+        if row:
+            used, value = row
+            now = int(time.time())
+            if now - used > 3600:
+                self._db.execute(
+                    "update {0} set used = ? where grp = ? and key = ?".format(self.table),
+                    (now, group, key))
+            return bytes(value)
+    
+    def set(self, group, key, value, size=None):
+        """Stores the value under the group and key.
+        
+        If size is None, the length of the value is used.
+        
+        """
+        if size is None:
+            size = len(value)
+        row = self._db.execute(
+            "select size from {0} where grp = ? and key = ?".format(self.table),
+            (group, key)).fetchone()
+        if row:
+            self._size -= row[0]
+        self._db.execute(
+            "insert or replace into {0} (grp, key, used, size, value) "
+            "values (?, ?, ?, ?, ?)".format(self.table),
+            (group, key, int(time.time()), size, sqlite3.Binary(value)))
+        self._size += size
+        if self._size > self.maxsize:
+            self.evict()
+    
+    def setmany(self, items):
+        """Stores the (group, key, value, size) tuples in one transaction.
+        
+        See set(), size may be None.
+        
+        """
+        self._db.execute("begin")
+        try:
+            for group, key, value, size in items:
+                self.set(group, key, value, size)
+        except sqlite3.Error:
+            self._db.execute("rollback")
+            self._size = self._db.execute(
+                "select sum(size) from {0}".format(self.table)).fetchone()[0] or 0
+            raise
+        self._db.execute("commit")
+    
+    def delete(self, group, key):
+        """Removes the value stored under the group and key, if any."""
+        row = self._db.execute(
+            "select size from {0} where grp = ? and key = ?".format(self.table),
+            (group, key)).fetchone()
+        if row:
+            self._size -= row[0]
+            self._db.execute(
+                "delete from {0} where grp = ? and key = ?".format(self.table),
+                (group, key))
+    
+    def setmaxsize(self, maxsize):
+        """Sets the maximum size, removing values if the total size is larger."""
+        self.maxsize = maxsize
+        if self._size > maxsize:
+            self.evict()
+    
+    def evict(self):
+        """Removes the least recently used values until 90% of maxsize remains."""
+        excess = self._size - self.maxsize * 9 // 10
+        if excess <= 0:
+            return
+        rowids = []
+        for rowid, size in self._db.execute(
+                "select rowid, size from {0} order by used".format(self.table)):
+            rowids.append((rowid,))
+            excess -= size
+            self._size -= size
+            if excess <= 0:
+                break
+        self._db.executemany(
+            "delete from {0} where rowid = ?".format(self.table), rowids)
+    
+    def groups(self):
+        """Returns the set of groups values are stored in."""
+        return set(row[0] for row in self._db.execute(
+            "select distinct grp from {0}".format(self.table)))
+    
+    def clear(self):
+        """Removes all values."""
+        self._db.execute("delete from {0}".format(self.table))
+        self._size = 0
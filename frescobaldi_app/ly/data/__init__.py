@@ -19,22 +19,25 @@
 
 """
 Query functions to get data from the LilyPond-generated _data.py module.
+
+The functions read the tables in the _index.py module, which is generated
+from _data.py by makeindex.py (see the Makefile). They return the stored
+lists, which should not be altered.
+
 """
 
 def grob_properties(grob):
     """Returns the list of properties the named grob supports."""
-    from . import _data
-    return sorted(uniq(prop
-        for iface in _data.grobs.get(grob, [])
-        for prop in _data.interfaces[iface]))
+    from . import _index
+    return _index.grob_properties.get(grob, [])
 
 def grob_properties_with_interface(grob):
     """Returns a list of two-tuples (property, interface)."""
-    from . import _data
+    from . import _index
     return sorted(
         (prop, iface)
-        for iface in _data.grobs.get(grob, [])
-        for prop in _data.interfaces[iface])
+        for iface in _index.grob_interfaces.get(grob, [])
+        for prop in _index.interface_properties[iface])
 
 def grob_interfaces(grob, prop=None):
     """Returns the list of interfaces a grob supports.
@@ -42,17 +45,17 @@ def grob_interfaces(grob, prop=None):
     If prop is given, only returns the interfaces that define prop.
     
     """
-    from . import _data
-    ifaces = _data.grobs.get(grob, [])
+    from . import _index
+    ifaces = _index.grob_interfaces.get(grob, [])
     if prop is None:
         return ifaces
     return [iface for iface in ifaces
-            if prop in grob_interface_properties(iface)]
+            if iface in _index.property_interfaces.get(prop, ())]
 
 def grob_interface_properties(iface):
     """Returns the list of properties an interface supports."""
-    from . import _data
-    return _data.interfaces.get(iface, [])
+    from . import _index
+    return _index.interface_properties.get(iface, [])
 
 def grob_interfaces_for_property(prop):
     """Returns the list of interfaces that define the property.
@@ -60,34 +63,43 @@ def grob_interfaces_for_property(prop):
     Most times returns one, but several interface names may be returned.
     
     """
-    from . import _data
-    return [iface
-        for iface, props in _data.interfaces.items()
-        if prop in props]
+    from . import _index
+    return _index.property_interfaces.get(prop, [])
+
+def grobs_for_property(prop):
+    """Returns the list of grobs that support the property."""
+    from . import _index
+    return _index.property_grobs.get(prop, [])
 
 def grobs():
     """Returns the sorted list of all grob names."""
-    from . import _data
-    return sorted(_data.grobs.keys())
+    from . import _index
+    return _index.grobs
     
 def all_grob_properties():
     """Returns the list of all properties."""
-    from . import _data
-    return sorted(uniq(sum(_data.interfaces.values(), [])))
+    from . import _index
+    return _index.all_grob_properties
 
 def context_properties():
-    """Returns the list of context properties."""
-    from . import _data
-    return _data.contextproperties
+    """Returns the list of context properties.
+    
+    LilyPond does not tell which properties a context uses, all contexts
+    accept all properties.
+    
+    """
+    from . import _index
+    return _index.context_properties
 
 def engravers():
     """Returns the list of engravers and performers."""
-    return _data.engravers
+    from . import _index
+    return _index.engravers
 
 def music_glyphs():
     """Returns the list of glyphs in the emmentaler font."""
-    from . import _data
-    return _data.musicglyphs
+    from . import _index
+    return _index.music_glyphs
 
 def uniq(iterable):
     """Returns an iterable, removing duplicates. The items should be hashable."""
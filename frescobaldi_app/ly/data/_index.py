@@ -0,0 +1,5916 @@
+#! python
+# generated from _data.py by makeindex.py, do not edit
+
+version = "2.14.1"
+
+
+interface_properties = {
+    "accidental-interface": [
+        "alteration", "avoid-slur", "glyph-name-alist",
+        "hide-tied-accidental-after-break", "parenthesized", "restore-first",
+    ],
+    "accidental-placement-interface": [
+        "direction", "padding", "positioning-done", "right-padding",
+        "script-priority",
+    ],
+    "accidental-suggestion-interface": [],
+    "align-interface": [
+        "align-dir", "axes", "padding", "positioning-done", "stacking-dir",
+    ],
+    "ambitus-interface": [
+        "gap", "thickness",
+    ],
+    "arpeggio-interface": [
+        "arpeggio-direction", "dash-definition", "positions", "script-priority",
+    ],
+    "axis-group-interface": [
+        "axes", "default-staff-staff-spacing", "max-stretch", "no-alignment",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "staff-affinity",
+        "staff-staff-spacing", "vertical-skylines",
+    ],
+    "balloon-interface": [
+        "annotation-balloon", "annotation-line", "padding", "text",
+    ],
+    "bar-line-interface": [
+        "allow-span-bar", "gap", "glyph", "glyph-name", "hair-thickness",
+        "kern", "thick-thickness", "thin-kern",
+    ],
+    "bass-figure-alignment-interface": [],
+    "bass-figure-interface": [
+        "implicit",
+    ],
+    "beam-interface": [
+        "annotation", "auto-knee-gap", "beam-thickness", "beamed-stem-shorten",
+        "beaming", "break-overshoot", "clip-edges", "collision-interfaces",
+        "collision-voice-only", "concaveness", "damping", "details",
+        "direction", "gap", "gap-count", "grow-direction", "inspect-quants",
+        "knee", "length-fraction", "neutral-direction", "positions",
+    ],
+    "bend-after-interface": [
+        "thickness",
+    ],
+    "break-alignable-interface": [
+        "break-align-symbols", "non-break-align-symbols",
+    ],
+    "break-aligned-interface": [
+        "break-align-anchor", "break-align-anchor-alignment",
+        "break-align-symbol", "space-alist",
+    ],
+    "break-alignment-interface": [
+        "break-align-orders", "positioning-done",
+    ],
+    "breathing-sign-interface": [
+        "direction",
+    ],
+    "chord-name-interface": [],
+    "clef-interface": [
+        "full-size-change", "glyph", "glyph-name", "non-default",
+    ],
+    "cluster-beacon-interface": [
+        "positions",
+    ],
+    "cluster-interface": [
+        "padding", "style",
+    ],
+    "custos-interface": [
+        "neutral-direction", "neutral-position", "style",
+    ],
+    "dot-column-interface": [
+        "direction", "positioning-done",
+    ],
+    "dots-interface": [
+        "direction", "dot-count", "style",
+    ],
+    "dynamic-interface": [],
+    "dynamic-line-spanner-interface": [
+        "avoid-slur",
+    ],
+    "dynamic-text-interface": [
+        "right-padding",
+    ],
+    "dynamic-text-spanner-interface": [
+        "text",
+    ],
+    "enclosing-bracket-interface": [
+        "bracket-flare", "edge-height", "padding", "shorten-pair", "thickness",
+    ],
+    "episema-interface": [],
+    "figured-bass-continuation-interface": [
+        "padding", "thickness",
+    ],
+    "finger-interface": [],
+    "font-interface": [
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size",
+    ],
+    "footnote-interface": [
+        "footnote-text",
+    ],
+    "footnote-spanner-interface": [
+        "footnote-text",
+    ],
+    "fret-diagram-interface": [
+        "align-dir", "dot-placement-list", "fret-diagram-details", "size",
+        "thickness",
+    ],
+    "glissando-interface": [],
+    "grace-spacing-interface": [
+        "common-shortest-duration",
+    ],
+    "gregorian-ligature-interface": [],
+    "grid-line-interface": [
+        "thickness",
+    ],
+    "grid-point-interface": [],
+    "grob-interface": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "transparent", "whiteout",
+    ],
+    "hairpin-interface": [
+        "bound-padding", "circled-tip", "grow-direction", "height",
+    ],
+    "hara-kiri-group-spanner-interface": [
+        "remove-empty", "remove-first",
+    ],
+    "horizontal-bracket-interface": [
+        "bracket-flare", "connect-to-neighbor", "edge-height", "shorten-pair",
+    ],
+    "inline-accidental-interface": [],
+    "instrument-specific-markup-interface": [
+        "fret-diagram-details", "graphical", "harp-pedal-details", "size",
+        "thickness",
+    ],
+    "item-interface": [
+        "break-visibility", "extra-spacing-height", "extra-spacing-width",
+        "non-musical",
+    ],
+    "key-cancellation-interface": [],
+    "key-signature-interface": [
+        "alteration-alist", "c0-position", "glyph-name-alist", "padding",
+        "padding-pairs",
+    ],
+    "ledger-line-spanner-interface": [
+        "gap", "length-fraction", "minimum-length-fraction", "thickness",
+    ],
+    "ledgered-interface": [
+        "no-ledgers",
+    ],
+    "ligature-bracket-interface": [
+        "height", "thickness", "width",
+    ],
+    "ligature-interface": [],
+    "line-interface": [
+        "arrow-length", "arrow-width", "dash-fraction", "dash-period", "style",
+        "thickness", "zigzag-length", "zigzag-width",
+    ],
+    "line-spanner-interface": [
+        "bound-details", "extra-dy", "gap", "left-bound-info",
+        "right-bound-info", "thickness", "to-barline",
+    ],
+    "lyric-extender-interface": [
+        "left-padding", "next", "right-padding", "thickness",
+    ],
+    "lyric-hyphen-interface": [
+        "dash-period", "height", "length", "minimum-distance",
+        "minimum-length", "padding", "thickness",
+    ],
+    "lyric-interface": [],
+    "lyric-syllable-interface": [],
+    "mark-interface": [],
+    "measure-grouping-interface": [
+        "height", "style", "thickness",
+    ],
+    "melody-spanner-interface": [
+        "neutral-direction",
+    ],
+    "mensural-ligature-interface": [
+        "thickness",
+    ],
+    "metronome-mark-interface": [],
+    "multi-measure-interface": [
+        "bound-padding",
+    ],
+    "multi-measure-rest-interface": [
+        "bound-padding", "expand-limit", "hair-thickness", "measure-count",
+        "minimum-length", "spacing-pair", "thick-thickness",
+    ],
+    "note-collision-interface": [
+        "merge-differently-dotted", "merge-differently-headed",
+        "positioning-done", "prefer-dotted-right",
+    ],
+    "note-column-interface": [
+        "force-hshift", "horizontal-shift", "ignore-collision",
+    ],
+    "note-head-interface": [
+        "glyph-name", "note-names", "stem-attachment", "style",
+    ],
+    "note-name-interface": [],
+    "note-spacing-interface": [
+        "knee-spacing-correction", "same-direction-correction",
+        "space-to-barline", "stem-spacing-correction",
+    ],
+    "only-prebreak-interface": [],
+    "ottava-bracket-interface": [
+        "bracket-flare", "edge-height", "minimum-length", "shorten-pair",
+    ],
+    "paper-column-interface": [
+        "between-cols", "full-measure-extra-space", "labels",
+        "line-break-penalty", "line-break-permission",
+        "line-break-system-details", "page-break-penalty",
+        "page-break-permission", "page-turn-penalty", "page-turn-permission",
+        "rhythmic-location", "shortest-playing-duration",
+        "shortest-starter-duration", "used", "when",
+    ],
+    "parentheses-interface": [
+        "padding", "stencils",
+    ],
+    "percent-repeat-interface": [
+        "dot-negative-kern", "slash-negative-kern", "slope", "thickness",
+    ],
+    "percent-repeat-item-interface": [
+        "dot-negative-kern", "slash-negative-kern", "slope", "thickness",
+    ],
+    "piano-pedal-bracket-interface": [
+        "bound-padding", "bracket-flare", "edge-height", "shorten-pair",
+    ],
+    "piano-pedal-interface": [],
+    "piano-pedal-script-interface": [],
+    "pitched-trill-interface": [],
+    "rest-collision-interface": [
+        "minimum-distance", "positioning-done",
+    ],
+    "rest-interface": [
+        "direction", "minimum-distance", "style",
+    ],
+    "rhythmic-grob-interface": [],
+    "rhythmic-head-interface": [
+        "duration-log",
+    ],
+    "script-column-interface": [],
+    "script-interface": [
+        "add-stem-support", "avoid-slur", "positioning-done",
+        "script-priority", "side-relative-direction", "slur-padding",
+        "toward-stem-shift",
+    ],
+    "self-alignment-interface": [
+        "self-alignment-X", "self-alignment-Y",
+    ],
+    "semi-tie-column-interface": [
+        "head-direction", "positioning-done", "tie-configuration",
+    ],
+    "semi-tie-interface": [
+        "control-points", "details", "direction", "head-direction", "thickness",
+    ],
+    "separation-item-interface": [
+        "X-extent", "horizontal-skylines", "padding",
+        "skyline-vertical-padding",
+    ],
+    "side-position-interface": [
+        "direction", "minimum-space", "padding", "side-axis", "slur-padding",
+        "staff-padding",
+    ],
+    "slur-interface": [
+        "annotation", "avoid-slur", "control-points", "dash-definition",
+        "details", "direction", "eccentricity", "height-limit",
+        "inspect-index", "inspect-quants", "line-thickness", "positions",
+        "ratio", "thickness",
+    ],
+    "spaceable-grob-interface": [
+        "allow-loose-spacing", "keep-inside-line", "measure-length",
+    ],
+    "spacing-interface": [],
+    "spacing-options-interface": [
+        "shortest-duration-space", "spacing-increment",
+    ],
+    "spacing-spanner-interface": [
+        "average-spacing-wishes", "base-shortest-duration",
+        "common-shortest-duration", "packed-spacing",
+        "shortest-duration-space", "spacing-increment", "strict-grace-spacing",
+        "strict-note-spacing", "uniform-stretching",
+    ],
+    "span-bar-interface": [
+        "glyph-name",
+    ],
+    "spanner-interface": [
+        "minimum-length", "normalized-endpoints", "to-barline",
+    ],
+    "staff-grouper-interface": [
+        "staff-staff-spacing", "staffgroup-staff-spacing",
+    ],
+    "staff-spacing-interface": [
+        "stem-spacing-correction",
+    ],
+    "staff-symbol-interface": [
+        "ledger-line-thickness", "line-count", "line-positions", "staff-space",
+        "thickness", "width",
+    ],
+    "staff-symbol-referencer-interface": [
+        "staff-position",
+    ],
+    "stanza-number-interface": [],
+    "stem-interface": [
+        "avoid-note-head", "beaming", "beamlet-default-length",
+        "beamlet-max-length-proportion", "default-direction", "details",
+        "direction", "duration-log", "flag", "flag-style", "french-beaming",
+        "length", "length-fraction", "max-beam-connect", "neutral-direction",
+        "no-stem-extend", "positioning-done", "stem-end-position",
+        "stemlet-length", "stroke-style", "thickness",
+    ],
+    "stem-tremolo-interface": [
+        "beam-thickness", "beam-width", "flag-count", "length-fraction",
+        "slope", "style",
+    ],
+    "string-number-interface": [],
+    "stroke-finger-interface": [
+        "digit-names",
+    ],
+    "system-interface": [
+        "labels", "skyline-horizontal-padding",
+    ],
+    "system-start-delimiter-interface": [
+        "collapse-height", "style", "thickness",
+    ],
+    "system-start-text-interface": [
+        "long-text", "self-alignment-X", "self-alignment-Y", "text",
+    ],
+    "tab-note-head-interface": [
+        "details",
+    ],
+    "text-interface": [
+        "baseline-skip", "text", "text-direction", "word-space",
+    ],
+    "text-script-interface": [
+        "add-stem-support", "avoid-slur", "script-priority",
+    ],
+    "tie-column-interface": [
+        "positioning-done", "tie-configuration",
+    ],
+    "tie-interface": [
+        "annotation", "avoid-slur", "control-points", "dash-definition",
+        "details", "direction", "head-direction", "line-thickness",
+        "neutral-direction", "staff-position", "thickness",
+    ],
+    "time-signature-interface": [
+        "fraction", "style",
+    ],
+    "trill-pitch-accidental-interface": [],
+    "trill-spanner-interface": [],
+    "tuplet-bracket-interface": [
+        "bracket-flare", "bracket-visibility", "break-overshoot",
+        "connect-to-neighbor", "control-points", "direction", "edge-height",
+        "edge-text", "full-length-padding", "full-length-to-extent", "gap",
+        "padding", "positions", "shorten-pair", "staff-padding", "thickness",
+    ],
+    "tuplet-number-interface": [
+        "avoid-slur",
+    ],
+    "unbreakable-spanner-interface": [
+        "breakable",
+    ],
+    "vaticana-ligature-interface": [
+        "glyph-name", "thickness",
+    ],
+    "volta-bracket-interface": [
+        "height", "thickness",
+    ],
+    "volta-interface": [],
+}
+
+
+grob_interfaces = {
+    "Accidental": [
+        "accidental-interface", "font-interface", "grob-interface",
+        "inline-accidental-interface", "item-interface",
+    ],
+    "AccidentalCautionary": [
+        "accidental-interface", "font-interface", "grob-interface",
+        "inline-accidental-interface", "item-interface",
+    ],
+    "AccidentalPlacement": [
+        "accidental-placement-interface", "grob-interface", "item-interface",
+    ],
+    "AccidentalSuggestion": [
+        "accidental-interface", "accidental-suggestion-interface",
+        "font-interface", "grob-interface", "item-interface",
+        "script-interface", "self-alignment-interface",
+        "side-position-interface",
+    ],
+    "Ambitus": [
+        "ambitus-interface", "axis-group-interface", "break-aligned-interface",
+        "grob-interface", "item-interface",
+    ],
+    "AmbitusAccidental": [
+        "accidental-interface", "break-aligned-interface", "font-interface",
+        "grob-interface", "item-interface", "side-position-interface",
+    ],
+    "AmbitusLine": [
+        "ambitus-interface", "font-interface", "grob-interface",
+        "item-interface",
+    ],
+    "AmbitusNoteHead": [
+        "ambitus-interface", "font-interface", "grob-interface",
+        "item-interface", "ledgered-interface", "note-head-interface",
+        "rhythmic-head-interface", "staff-symbol-referencer-interface",
+    ],
+    "Arpeggio": [
+        "arpeggio-interface", "font-interface", "grob-interface",
+        "item-interface", "side-position-interface",
+        "staff-symbol-referencer-interface",
+    ],
+    "BalloonTextItem": [
+        "balloon-interface", "font-interface", "grob-interface",
+        "item-interface", "text-interface",
+    ],
+    "BarLine": [
+        "bar-line-interface", "break-aligned-interface", "font-interface",
+        "grob-interface", "item-interface",
+    ],
+    "BarNumber": [
+        "break-alignable-interface", "font-interface", "grob-interface",
+        "item-interface", "self-alignment-interface",
+        "side-position-interface", "text-interface",
+    ],
+    "BassFigure": [
+        "bass-figure-interface", "font-interface", "grob-interface",
+        "item-interface", "rhythmic-grob-interface", "text-interface",
+    ],
+    "BassFigureAlignment": [
+        "align-interface", "axis-group-interface",
+        "bass-figure-alignment-interface", "grob-interface",
+        "spanner-interface",
+    ],
+    "BassFigureAlignmentPositioning": [
+        "axis-group-interface", "grob-interface", "side-position-interface",
+        "spanner-interface",
+    ],
+    "BassFigureBracket": [
+        "enclosing-bracket-interface", "grob-interface", "item-interface",
+    ],
+    "BassFigureContinuation": [
+        "figured-bass-continuation-interface", "grob-interface",
+        "spanner-interface",
+    ],
+    "BassFigureLine": [
+        "axis-group-interface", "grob-interface", "spanner-interface",
+    ],
+    "Beam": [
+        "beam-interface", "font-interface", "grob-interface",
+        "spanner-interface", "staff-symbol-referencer-interface",
+        "unbreakable-spanner-interface",
+    ],
+    "BendAfter": [
+        "bend-after-interface", "grob-interface", "spanner-interface",
+    ],
+    "BreakAlignGroup": [
+        "axis-group-interface", "break-aligned-interface", "grob-interface",
+        "item-interface",
+    ],
+    "BreakAlignment": [
+        "axis-group-interface", "break-alignment-interface", "grob-interface",
+        "item-interface",
+    ],
+    "BreathingSign": [
+        "break-aligned-interface", "breathing-sign-interface",
+        "font-interface", "grob-interface", "item-interface", "text-interface",
+    ],
+    "ChordName": [
+        "chord-name-interface", "font-interface", "grob-interface",
+        "item-interface", "rhythmic-grob-interface", "text-interface",
+    ],
+    "Clef": [
+        "break-aligned-interface", "clef-interface", "font-interface",
+        "grob-interface", "item-interface", "staff-symbol-referencer-interface",
+    ],
+    "ClusterSpanner": [
+        "cluster-interface", "grob-interface", "spanner-interface",
+    ],
+    "ClusterSpannerBeacon": [
+        "cluster-beacon-interface", "grob-interface", "item-interface",
+        "rhythmic-grob-interface",
+    ],
+    "CombineTextScript": [
+        "font-interface", "grob-interface", "item-interface",
+        "side-position-interface", "text-interface", "text-script-interface",
+    ],
+    "CueClef": [
+        "break-aligned-interface", "clef-interface", "font-interface",
+        "grob-interface", "item-interface", "staff-symbol-referencer-interface",
+    ],
+    "CueEndClef": [
+        "break-aligned-interface", "clef-interface", "font-interface",
+        "grob-interface", "item-interface", "staff-symbol-referencer-interface",
+    ],
+    "Custos": [
+        "break-aligned-interface", "custos-interface", "font-interface",
+        "grob-interface", "item-interface", "staff-symbol-referencer-interface",
+    ],
+    "DotColumn": [
+        "axis-group-interface", "dot-column-interface", "grob-interface",
+        "item-interface",
+    ],
+    "Dots": [
+        "dots-interface", "font-interface", "grob-interface", "item-interface",
+        "staff-symbol-referencer-interface",
+    ],
+    "DoublePercentRepeat": [
+        "break-aligned-interface", "font-interface", "grob-interface",
+        "item-interface", "percent-repeat-interface",
+        "percent-repeat-item-interface",
+    ],
+    "DoublePercentRepeatCounter": [
+        "font-interface", "grob-interface", "item-interface",
+        "percent-repeat-interface", "percent-repeat-item-interface",
+        "self-alignment-interface", "side-position-interface", "text-interface",
+    ],
+    "DoubleRepeatSlash": [
+        "font-interface", "grob-interface", "item-interface",
+        "percent-repeat-interface", "percent-repeat-item-interface",
+        "rhythmic-grob-interface",
+    ],
+    "DynamicLineSpanner": [
+        "axis-group-interface", "dynamic-interface",
+        "dynamic-line-spanner-interface", "grob-interface",
+        "side-position-interface", "spanner-interface",
+    ],
+    "DynamicText": [
+        "dynamic-interface", "dynamic-text-interface", "font-interface",
+        "grob-interface", "item-interface", "script-interface",
+        "self-alignment-interface", "text-interface",
+    ],
+    "DynamicTextSpanner": [
+        "dynamic-interface", "dynamic-text-spanner-interface",
+        "font-interface", "grob-interface", "line-interface",
+        "line-spanner-interface", "spanner-interface", "text-interface",
+    ],
+    "Episema": [
+        "episema-interface", "font-interface", "grob-interface",
+        "line-interface", "line-spanner-interface", "side-position-interface",
+        "spanner-interface",
+    ],
+    "Fingering": [
+        "finger-interface", "font-interface", "grob-interface",
+        "item-interface", "self-alignment-interface",
+        "side-position-interface", "text-interface", "text-script-interface",
+    ],
+    "FootnoteItem": [
+        "balloon-interface", "font-interface", "footnote-interface",
+        "grob-interface", "item-interface", "text-interface",
+    ],
+    "FootnoteSpanner": [
+        "balloon-interface", "font-interface", "footnote-interface",
+        "footnote-spanner-interface", "grob-interface", "spanner-interface",
+        "text-interface",
+    ],
+    "FretBoard": [
+        "chord-name-interface", "font-interface", "fret-diagram-interface",
+        "grob-interface", "item-interface", "rhythmic-grob-interface",
+    ],
+    "Glissando": [
+        "glissando-interface", "grob-interface", "line-interface",
+        "line-spanner-interface", "spanner-interface",
+        "unbreakable-spanner-interface",
+    ],
+    "GraceSpacing": [
+        "grace-spacing-interface", "grob-interface",
+        "spacing-options-interface", "spanner-interface",
+    ],
+    "GridLine": [
+        "grid-line-interface", "grob-interface", "item-interface",
+        "self-alignment-interface",
+    ],
+    "GridPoint": [
+        "grid-point-interface", "grob-interface", "item-interface",
+    ],
+    "Hairpin": [
+        "dynamic-interface", "grob-interface", "hairpin-interface",
+        "line-interface", "self-alignment-interface", "spanner-interface",
+    ],
+    "HorizontalBracket": [
+        "grob-interface", "horizontal-bracket-interface", "line-interface",
+        "side-position-interface", "spanner-interface",
+    ],
+    "InstrumentName": [
+        "font-interface", "grob-interface", "self-alignment-interface",
+        "side-position-interface", "spanner-interface",
+        "system-start-text-interface",
+    ],
+    "InstrumentSwitch": [
+        "font-interface", "grob-interface", "item-interface",
+        "self-alignment-interface", "side-position-interface", "text-interface",
+    ],
+    "KeyCancellation": [
+        "break-aligned-interface", "font-interface", "grob-interface",
+        "item-interface", "key-cancellation-interface",
+        "key-signature-interface", "staff-symbol-referencer-interface",
+    ],
+    "KeySignature": [
+        "break-aligned-interface", "font-interface", "grob-interface",
+        "item-interface", "key-signature-interface",
+        "staff-symbol-referencer-interface",
+    ],
+    "LaissezVibrerTie": [
+        "grob-interface", "item-interface", "semi-tie-interface",
+    ],
+    "LaissezVibrerTieColumn": [
+        "grob-interface", "item-interface", "semi-tie-column-interface",
+    ],
+    "LedgerLineSpanner": [
+        "grob-interface", "ledger-line-spanner-interface", "spanner-interface",
+    ],
+    "LeftEdge": [
+        "break-aligned-interface", "grob-interface", "item-interface",
+    ],
+    "LigatureBracket": [
+        "grob-interface", "line-interface", "spanner-interface",
+        "tuplet-bracket-interface",
+    ],
+    "LyricExtender": [
+        "grob-interface", "lyric-extender-interface", "lyric-interface",
+        "spanner-interface",
+    ],
+    "LyricHyphen": [
+        "font-interface", "grob-interface", "lyric-hyphen-interface",
+        "lyric-interface", "spanner-interface",
+    ],
+    "LyricSpace": [
+        "grob-interface", "lyric-hyphen-interface", "spanner-interface",
+    ],
+    "LyricText": [
+        "font-interface", "grob-interface", "item-interface",
+        "lyric-syllable-interface", "rhythmic-grob-interface",
+        "self-alignment-interface", "text-interface",
+    ],
+    "MeasureGrouping": [
+        "grob-interface", "measure-grouping-interface",
+        "side-position-interface", "spanner-interface",
+    ],
+    "MelodyItem": [
+        "grob-interface", "item-interface", "melody-spanner-interface",
+    ],
+    "MensuralLigature": [
+        "font-interface", "grob-interface", "mensural-ligature-interface",
+        "spanner-interface",
+    ],
+    "MetronomeMark": [
+        "break-alignable-interface", "font-interface", "grob-interface",
+        "item-interface", "metronome-mark-interface",
+        "self-alignment-interface", "side-position-interface", "text-interface",
+    ],
+    "MultiMeasureRest": [
+        "font-interface", "grob-interface", "multi-measure-interface",
+        "multi-measure-rest-interface", "rest-interface", "spanner-interface",
+        "staff-symbol-referencer-interface",
+    ],
+    "MultiMeasureRestNumber": [
+        "font-interface", "grob-interface", "multi-measure-interface",
+        "self-alignment-interface", "side-position-interface",
+        "spanner-interface", "text-interface",
+    ],
+    "MultiMeasureRestText": [
+        "font-interface", "grob-interface", "multi-measure-interface",
+        "self-alignment-interface", "side-position-interface",
+        "spanner-interface", "text-interface",
+    ],
+    "NonMusicalPaperColumn": [
+        "axis-group-interface", "font-interface", "grob-interface",
+        "item-interface", "paper-column-interface",
+        "separation-item-interface", "spaceable-grob-interface",
+    ],
+    "NoteCollision": [
+        "axis-group-interface", "grob-interface", "item-interface",
+        "note-collision-interface",
+    ],
+    "NoteColumn": [
+        "axis-group-interface", "grob-interface", "item-interface",
+        "note-column-interface", "separation-item-interface",
+    ],
+    "NoteHead": [
+        "font-interface", "gregorian-ligature-interface", "grob-interface",
+        "item-interface", "ledgered-interface", "mensural-ligature-interface",
+        "note-head-interface", "rhythmic-grob-interface",
+        "rhythmic-head-interface", "staff-symbol-referencer-interface",
+        "vaticana-ligature-interface",
+    ],
+    "NoteName": [
+        "font-interface", "grob-interface", "item-interface",
+        "note-name-interface", "text-interface",
+    ],
+    "NoteSpacing": [
+        "grob-interface", "item-interface", "note-spacing-interface",
+        "spacing-interface",
+    ],
+    "OctavateEight": [
+        "font-interface", "grob-interface", "item-interface",
+        "self-alignment-interface", "side-position-interface", "text-interface",
+    ],
+    "OttavaBracket": [
+        "font-interface", "grob-interface", "horizontal-bracket-interface",
+        "line-interface", "ottava-bracket-interface",
+        "side-position-interface", "spanner-interface", "text-interface",
+    ],
+    "PaperColumn": [
+        "axis-group-interface", "font-interface", "grob-interface",
+        "item-interface", "paper-column-interface",
+        "separation-item-interface", "spaceable-grob-interface",
+    ],
+    "ParenthesesItem": [
+        "font-interface", "grob-interface", "item-interface",
+        "parentheses-interface",
+    ],
+    "PercentRepeat": [
+        "font-interface", "grob-interface", "multi-measure-rest-interface",
+        "percent-repeat-interface", "spanner-interface",
+    ],
+    "PercentRepeatCounter": [
+        "font-interface", "grob-interface", "percent-repeat-interface",
+        "self-alignment-interface", "side-position-interface",
+        "spanner-interface", "text-interface",
+    ],
+    "PhrasingSlur": [
+        "grob-interface", "slur-interface", "spanner-interface",
+    ],
+    "PianoPedalBracket": [
+        "grob-interface", "line-interface", "piano-pedal-bracket-interface",
+        "piano-pedal-interface", "spanner-interface",
+    ],
+    "RehearsalMark": [
+        "break-alignable-interface", "font-interface", "grob-interface",
+        "item-interface", "mark-interface", "self-alignment-interface",
+        "side-position-interface", "text-interface",
+    ],
+    "RepeatSlash": [
+        "grob-interface", "item-interface", "percent-repeat-interface",
+        "percent-repeat-item-interface", "rhythmic-grob-interface",
+    ],
+    "RepeatTie": [
+        "grob-interface", "item-interface", "semi-tie-interface",
+    ],
+    "RepeatTieColumn": [
+        "grob-interface", "item-interface", "semi-tie-column-interface",
+    ],
+    "Rest": [
+        "font-interface", "grob-interface", "item-interface", "rest-interface",
+        "rhythmic-grob-interface", "rhythmic-head-interface",
+        "staff-symbol-referencer-interface",
+    ],
+    "RestCollision": [
+        "grob-interface", "item-interface", "rest-collision-interface",
+    ],
+    "Script": [
+        "font-interface", "grob-interface", "item-interface",
+        "script-interface", "side-position-interface",
+    ],
+    "ScriptColumn": [
+        "grob-interface", "item-interface", "script-column-interface",
+    ],
+    "ScriptRow": [
+        "grob-interface", "item-interface", "script-column-interface",
+    ],
+    "Slur": [
+        "grob-interface", "slur-interface", "spanner-interface",
+    ],
+    "SostenutoPedal": [
+        "font-interface", "grob-interface", "item-interface",
+        "piano-pedal-script-interface", "self-alignment-interface",
+        "text-interface",
+    ],
+    "SostenutoPedalLineSpanner": [
+        "axis-group-interface", "grob-interface", "piano-pedal-interface",
+        "side-position-interface", "spanner-interface",
+    ],
+    "SpacingSpanner": [
+        "grob-interface", "spacing-options-interface",
+        "spacing-spanner-interface", "spanner-interface",
+    ],
+    "SpanBar": [
+        "bar-line-interface", "font-interface", "grob-interface",
+        "item-interface", "span-bar-interface",
+    ],
+    "StaffGrouper": [
+        "grob-interface", "spanner-interface", "staff-grouper-interface",
+    ],
+    "StaffSpacing": [
+        "grob-interface", "item-interface", "spacing-interface",
+        "staff-spacing-interface",
+    ],
+    "StaffSymbol": [
+        "grob-interface", "spanner-interface", "staff-symbol-interface",
+    ],
+    "StanzaNumber": [
+        "font-interface", "grob-interface", "item-interface",
+        "side-position-interface", "stanza-number-interface", "text-interface",
+    ],
+    "Stem": [
+        "font-interface", "grob-interface", "item-interface", "stem-interface",
+    ],
+    "StemTremolo": [
+        "grob-interface", "item-interface", "stem-tremolo-interface",
+    ],
+    "StringNumber": [
+        "font-interface", "grob-interface", "item-interface",
+        "self-alignment-interface", "side-position-interface",
+        "string-number-interface", "text-interface", "text-script-interface",
+    ],
+    "StrokeFinger": [
+        "font-interface", "grob-interface", "item-interface",
+        "self-alignment-interface", "side-position-interface",
+        "stroke-finger-interface", "text-interface", "text-script-interface",
+    ],
+    "SustainPedal": [
+        "font-interface", "grob-interface", "item-interface",
+        "piano-pedal-interface", "piano-pedal-script-interface",
+        "self-alignment-interface", "text-interface",
+    ],
+    "SustainPedalLineSpanner": [
+        "axis-group-interface", "grob-interface", "piano-pedal-interface",
+        "side-position-interface", "spanner-interface",
+    ],
+    "System": [
+        "axis-group-interface", "grob-interface", "spanner-interface",
+        "system-interface",
+    ],
+    "SystemStartBar": [
+        "grob-interface", "side-position-interface", "spanner-interface",
+        "system-start-delimiter-interface",
+    ],
+    "SystemStartBrace": [
+        "font-interface", "grob-interface", "side-position-interface",
+        "spanner-interface", "system-start-delimiter-interface",
+    ],
+    "SystemStartBracket": [
+        "font-interface", "grob-interface", "side-position-interface",
+        "spanner-interface", "system-start-delimiter-interface",
+    ],
+    "SystemStartSquare": [
+        "font-interface", "grob-interface", "side-position-interface",
+        "spanner-interface", "system-start-delimiter-interface",
+    ],
+    "TabNoteHead": [
+        "font-interface", "grob-interface", "item-interface",
+        "note-head-interface", "rhythmic-grob-interface",
+        "rhythmic-head-interface", "staff-symbol-referencer-interface",
+        "tab-note-head-interface", "text-interface",
+    ],
+    "TextScript": [
+        "font-interface", "grob-interface",
+        "instrument-specific-markup-interface", "item-interface",
+        "self-alignment-interface", "side-position-interface",
+        "text-interface", "text-script-interface",
+    ],
+    "TextSpanner": [
+        "font-interface", "grob-interface", "line-interface",
+        "line-spanner-interface", "side-position-interface",
+        "spanner-interface",
+    ],
+    "Tie": [
+        "grob-interface", "spanner-interface", "tie-interface",
+    ],
+    "TieColumn": [
+        "grob-interface", "spanner-interface", "tie-column-interface",
+    ],
+    "TimeSignature": [
+        "break-aligned-interface", "font-interface", "grob-interface",
+        "item-interface", "time-signature-interface",
+    ],
+    "TrillPitchAccidental": [
+        "accidental-interface", "font-interface", "grob-interface",
+        "inline-accidental-interface", "item-interface",
+        "side-position-interface", "trill-pitch-accidental-interface",
+    ],
+    "TrillPitchGroup": [
+        "axis-group-interface", "font-interface", "grob-interface",
+        "item-interface", "note-head-interface", "parentheses-interface",
+        "side-position-interface",
+    ],
+    "TrillPitchHead": [
+        "font-interface", "grob-interface", "item-interface",
+        "ledgered-interface", "pitched-trill-interface",
+        "rhythmic-head-interface", "staff-symbol-referencer-interface",
+    ],
+    "TrillSpanner": [
+        "font-interface", "grob-interface", "line-interface",
+        "line-spanner-interface", "side-position-interface",
+        "spanner-interface", "trill-spanner-interface",
+    ],
+    "TupletBracket": [
+        "grob-interface", "line-interface", "spanner-interface",
+        "tuplet-bracket-interface",
+    ],
+    "TupletNumber": [
+        "font-interface", "grob-interface", "spanner-interface",
+        "text-interface", "tuplet-number-interface",
+    ],
+    "UnaCordaPedal": [
+        "font-interface", "grob-interface", "item-interface",
+        "piano-pedal-script-interface", "self-alignment-interface",
+        "text-interface",
+    ],
+    "UnaCordaPedalLineSpanner": [
+        "axis-group-interface", "grob-interface", "piano-pedal-interface",
+        "side-position-interface", "spanner-interface",
+    ],
+    "VaticanaLigature": [
+        "font-interface", "grob-interface", "spanner-interface",
+        "vaticana-ligature-interface",
+    ],
+    "VerticalAlignment": [
+        "align-interface", "axis-group-interface", "grob-interface",
+        "spanner-interface",
+    ],
+    "VerticalAxisGroup": [
+        "axis-group-interface", "grob-interface",
+        "hara-kiri-group-spanner-interface", "spanner-interface",
+    ],
+    "VoiceFollower": [
+        "grob-interface", "line-interface", "line-spanner-interface",
+        "spanner-interface",
+    ],
+    "VoltaBracket": [
+        "font-interface", "grob-interface", "horizontal-bracket-interface",
+        "line-interface", "side-position-interface", "spanner-interface",
+        "text-interface", "volta-bracket-interface", "volta-interface",
+    ],
+    "VoltaBracketSpanner": [
+        "axis-group-interface", "grob-interface", "side-position-interface",
+        "spanner-interface", "volta-interface",
+    ],
+}
+
+
+grob_properties = {
+    "Accidental": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "alteration", "avoid-slur", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "glyph-name-alist",
+        "hide-tied-accidental-after-break", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "parenthesized",
+        "restore-first", "rotation", "springs-and-rods", "stencil",
+        "transparent", "whiteout",
+    ],
+    "AccidentalCautionary": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "alteration", "avoid-slur", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "glyph-name-alist",
+        "hide-tied-accidental-after-break", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "parenthesized",
+        "restore-first", "rotation", "springs-and-rods", "stencil",
+        "transparent", "whiteout",
+    ],
+    "AccidentalPlacement": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "positioning-done",
+        "right-padding", "rotation", "script-priority", "springs-and-rods",
+        "stencil", "transparent", "whiteout",
+    ],
+    "AccidentalSuggestion": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "alteration", "avoid-slur",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name-alist", "hide-tied-accidental-after-break", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "parenthesized",
+        "positioning-done", "restore-first", "rotation", "script-priority",
+        "self-alignment-X", "self-alignment-Y", "side-axis",
+        "side-relative-direction", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "toward-stem-shift", "transparent",
+        "whiteout",
+    ],
+    "Ambitus": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width", "gap",
+        "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent",
+        "no-alignment", "non-musical", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "space-alist",
+        "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil",
+        "thickness", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "AmbitusAccidental": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "alteration", "avoid-slur", "before-line-breaking",
+        "break-align-anchor", "break-align-anchor-alignment",
+        "break-align-symbol", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name-alist", "hide-tied-accidental-after-break", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "parenthesized", "restore-first",
+        "rotation", "side-axis", "slur-padding", "space-alist",
+        "springs-and-rods", "staff-padding", "stencil", "transparent",
+        "whiteout",
+    ],
+    "AmbitusLine": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "gap", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "thickness", "transparent", "whiteout",
+    ],
+    "AmbitusNoteHead": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "duration-log", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "gap", "glyph-name", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "no-ledgers", "non-musical",
+        "note-names", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "staff-position", "stem-attachment", "stencil",
+        "style", "thickness", "transparent", "whiteout",
+    ],
+    "Arpeggio": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arpeggio-direction", "avoid-slur", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "dash-definition",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "positions", "rotation", "script-priority", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-padding", "staff-position",
+        "stencil", "transparent", "whiteout",
+    ],
+    "BalloonTextItem": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation-balloon", "annotation-line", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "springs-and-rods",
+        "stencil", "text", "text-direction", "transparent", "whiteout",
+        "word-space",
+    ],
+    "BarLine": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "allow-span-bar", "avoid-slur", "before-line-breaking",
+        "break-align-anchor", "break-align-anchor-alignment",
+        "break-align-symbol", "break-visibility", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "gap", "glyph", "glyph-name", "hair-thickness", "kern", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "space-alist",
+        "springs-and-rods", "stencil", "thick-thickness", "thin-kern",
+        "transparent", "whiteout",
+    ],
+    "BarNumber": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-align-symbols", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-break-align-symbols", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "BassFigure": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "implicit", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "text", "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "BassFigureAlignment": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "align-dir", "avoid-slur", "axes", "before-line-breaking", "color",
+        "cross-staff", "default-staff-staff-spacing", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "positioning-done", "rotation", "springs-and-rods", "stacking-dir",
+        "staff-affinity", "staff-staff-spacing", "stencil", "to-barline",
+        "transparent", "vertical-skylines", "whiteout",
+    ],
+    "BassFigureAlignmentPositioning": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "BassFigureBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "bracket-flare",
+        "break-visibility", "color", "cross-staff", "edge-height",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "shorten-pair",
+        "springs-and-rods", "stencil", "thickness", "transparent", "whiteout",
+    ],
+    "BassFigureContinuation": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "springs-and-rods", "stencil", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "BassFigureLine": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "layer", "max-stretch", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "no-alignment",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods",
+        "staff-affinity", "staff-staff-spacing", "stencil", "to-barline",
+        "transparent", "vertical-skylines", "whiteout",
+    ],
+    "Beam": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation", "auto-knee-gap", "avoid-slur", "beam-thickness",
+        "beamed-stem-shorten", "beaming", "before-line-breaking",
+        "break-overshoot", "breakable", "clip-edges", "collision-interfaces",
+        "collision-voice-only", "color", "concaveness", "cross-staff",
+        "damping", "details", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "gap", "gap-count",
+        "grow-direction", "inspect-quants", "knee", "layer", "length-fraction",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "neutral-direction", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positions", "rotation", "springs-and-rods",
+        "staff-position", "stencil", "to-barline", "transparent", "whiteout",
+    ],
+    "BendAfter": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "stencil", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "BreakAlignGroup": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer",
+        "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment",
+        "non-musical", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "space-alist",
+        "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil",
+        "transparent", "vertical-skylines", "whiteout",
+    ],
+    "BreakAlignment": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-align-orders",
+        "break-visibility", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer",
+        "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment",
+        "non-musical", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positioning-done", "rotation",
+        "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil",
+        "transparent", "vertical-skylines", "whiteout",
+    ],
+    "BreathingSign": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-align-anchor", "break-align-anchor-alignment",
+        "break-align-symbol", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "space-alist",
+        "springs-and-rods", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "ChordName": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "Clef": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "full-size-change", "glyph",
+        "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-default", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "space-alist", "springs-and-rods", "staff-position", "stencil",
+        "transparent", "whiteout",
+    ],
+    "ClusterSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "springs-and-rods", "stencil", "style", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "ClusterSpannerBeacon": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positions", "rotation", "springs-and-rods",
+        "stencil", "transparent", "whiteout",
+    ],
+    "CombineTextScript": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "script-priority", "side-axis", "slur-padding",
+        "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "CueClef": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "full-size-change", "glyph",
+        "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-default", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "space-alist", "springs-and-rods", "staff-position", "stencil",
+        "transparent", "whiteout",
+    ],
+    "CueEndClef": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "full-size-change", "glyph",
+        "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-default", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "space-alist", "springs-and-rods", "staff-position", "stencil",
+        "transparent", "whiteout",
+    ],
+    "Custos": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "neutral-direction", "neutral-position",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "space-alist", "springs-and-rods", "staff-position", "stencil",
+        "style", "transparent", "whiteout",
+    ],
+    "DotColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "default-staff-staff-spacing", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "positioning-done",
+        "rotation", "springs-and-rods", "staff-affinity",
+        "staff-staff-spacing", "stencil", "transparent", "vertical-skylines",
+        "whiteout",
+    ],
+    "Dots": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "direction", "dot-count", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "staff-position", "stencil", "style",
+        "transparent", "whiteout",
+    ],
+    "DoublePercentRepeat": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "dot-negative-kern",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "slash-negative-kern", "slope",
+        "space-alist", "springs-and-rods", "stencil", "thickness",
+        "transparent", "whiteout",
+    ],
+    "DoublePercentRepeatCounter": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "direction",
+        "dot-negative-kern", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-space", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slash-negative-kern", "slope",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "thickness", "transparent", "whiteout", "word-space",
+    ],
+    "DoubleRepeatSlash": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "dot-negative-kern", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "slash-negative-kern", "slope", "springs-and-rods", "stencil",
+        "thickness", "transparent", "whiteout",
+    ],
+    "DynamicLineSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "DynamicText": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positioning-done", "right-padding",
+        "rotation", "script-priority", "self-alignment-X", "self-alignment-Y",
+        "side-relative-direction", "slur-padding", "springs-and-rods",
+        "stencil", "text", "text-direction", "toward-stem-shift",
+        "transparent", "whiteout", "word-space",
+    ],
+    "DynamicTextSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "bound-details", "color", "cross-staff",
+        "dash-fraction", "dash-period", "extra-X-extent", "extra-Y-extent",
+        "extra-dy", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "gap", "layer",
+        "left-bound-info", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "right-bound-info", "rotation",
+        "springs-and-rods", "stencil", "style", "text", "text-direction",
+        "thickness", "to-barline", "transparent", "whiteout", "word-space",
+        "zigzag-length", "zigzag-width",
+    ],
+    "Episema": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-details", "color", "cross-staff", "dash-fraction",
+        "dash-period", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-dy", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "gap", "layer",
+        "left-bound-info", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "right-bound-info", "rotation",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "style", "thickness", "to-barline", "transparent",
+        "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "Fingering": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "script-priority", "self-alignment-X", "self-alignment-Y",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "text", "text-direction", "transparent", "whiteout",
+        "word-space",
+    ],
+    "FootnoteItem": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation-balloon", "annotation-line", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "footnote-text", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "springs-and-rods", "stencil", "text", "text-direction",
+        "transparent", "whiteout", "word-space",
+    ],
+    "FootnoteSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation-balloon", "annotation-line", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "footnote-text",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "springs-and-rods", "stencil", "text", "text-direction",
+        "to-barline", "transparent", "whiteout", "word-space",
+    ],
+    "FretBoard": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "align-dir", "avoid-slur", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "dot-placement-list", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "fret-diagram-details",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "size", "springs-and-rods",
+        "stencil", "thickness", "transparent", "whiteout",
+    ],
+    "Glissando": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-details", "breakable", "color", "cross-staff", "dash-fraction",
+        "dash-period", "extra-X-extent", "extra-Y-extent", "extra-dy",
+        "extra-offset", "gap", "layer", "left-bound-info", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "right-bound-info", "rotation",
+        "springs-and-rods", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "GraceSpacing": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color",
+        "common-shortest-duration", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "shortest-duration-space",
+        "spacing-increment", "springs-and-rods", "stencil", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "GridLine": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "self-alignment-X",
+        "self-alignment-Y", "springs-and-rods", "stencil", "thickness",
+        "transparent", "whiteout",
+    ],
+    "GridPoint": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "transparent", "whiteout",
+    ],
+    "Hairpin": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-padding", "circled-tip", "color", "cross-staff",
+        "dash-fraction", "dash-period", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "grow-direction", "height", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil",
+        "style", "thickness", "to-barline", "transparent", "whiteout",
+        "zigzag-length", "zigzag-width",
+    ],
+    "HorizontalBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bracket-flare", "color", "connect-to-neighbor", "cross-staff",
+        "dash-fraction", "dash-period", "direction", "edge-height",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "shorten-pair",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "style", "thickness", "to-barline", "transparent",
+        "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "InstrumentName": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "layer", "long-text", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "minimum-space",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "self-alignment-X", "self-alignment-Y", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text",
+        "to-barline", "transparent", "whiteout",
+    ],
+    "InstrumentSwitch": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "self-alignment-X", "self-alignment-Y", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "KeyCancellation": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "alteration-alist", "avoid-slur", "before-line-breaking",
+        "break-align-anchor", "break-align-anchor-alignment",
+        "break-align-symbol", "break-visibility", "c0-position", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name-alist", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "padding-pairs", "rotation", "space-alist", "springs-and-rods",
+        "staff-position", "stencil", "transparent", "whiteout",
+    ],
+    "KeySignature": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "alteration-alist", "avoid-slur", "before-line-breaking",
+        "break-align-anchor", "break-align-anchor-alignment",
+        "break-align-symbol", "break-visibility", "c0-position", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name-alist", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "padding-pairs", "rotation", "space-alist", "springs-and-rods",
+        "staff-position", "stencil", "transparent", "whiteout",
+    ],
+    "LaissezVibrerTie": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "control-points", "cross-staff", "details", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "head-direction",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "thickness", "transparent", "whiteout",
+    ],
+    "LaissezVibrerTieColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "head-direction",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positioning-done", "rotation",
+        "springs-and-rods", "stencil", "tie-configuration", "transparent",
+        "whiteout",
+    ],
+    "LedgerLineSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "gap", "layer",
+        "length-fraction", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "minimum-length-fraction", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "LeftEdge": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "space-alist", "springs-and-rods", "stencil", "transparent", "whiteout",
+    ],
+    "LigatureBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bracket-flare", "bracket-visibility", "break-overshoot", "color",
+        "connect-to-neighbor", "control-points", "cross-staff",
+        "dash-fraction", "dash-period", "direction", "edge-height",
+        "edge-text", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "full-length-padding", "full-length-to-extent", "gap", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "positions", "rotation", "shorten-pair", "springs-and-rods",
+        "staff-padding", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "LyricExtender": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "left-padding", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "next", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "right-padding", "rotation",
+        "springs-and-rods", "stencil", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "LyricHyphen": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "dash-period", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "height", "layer", "length",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-distance",
+        "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "springs-and-rods",
+        "stencil", "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "LyricSpace": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "dash-period", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "height", "layer", "length", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-distance", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "springs-and-rods",
+        "stencil", "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "LyricText": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil",
+        "text", "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "MeasureGrouping": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "height", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil",
+        "style", "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "MelodyItem": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "neutral-direction",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "stencil", "transparent", "whiteout",
+    ],
+    "MensuralLigature": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "stencil", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "MetronomeMark": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-align-symbols", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-break-align-symbols", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "MultiMeasureRest": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "bound-padding", "color",
+        "cross-staff", "direction", "expand-limit", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size",
+        "hair-thickness", "layer", "measure-count", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-distance", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "spacing-pair", "springs-and-rods", "staff-position", "stencil",
+        "style", "thick-thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "MultiMeasureRestNumber": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking", "bound-padding",
+        "color", "cross-staff", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "text", "text-direction", "to-barline",
+        "transparent", "whiteout", "word-space",
+    ],
+    "MultiMeasureRestText": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking", "bound-padding",
+        "color", "cross-staff", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "text", "text-direction", "to-barline",
+        "transparent", "whiteout", "word-space",
+    ],
+    "NonMusicalPaperColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "allow-loose-spacing", "avoid-slur", "axes", "before-line-breaking",
+        "between-cols", "break-visibility", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "full-measure-extra-space",
+        "horizontal-skylines", "keep-inside-line", "labels", "layer",
+        "line-break-penalty", "line-break-permission",
+        "line-break-system-details", "max-stretch", "measure-length",
+        "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "page-break-penalty", "page-break-permission", "page-turn-penalty",
+        "page-turn-permission", "rhythmic-location", "rotation",
+        "shortest-playing-duration", "shortest-starter-duration",
+        "skyline-vertical-padding", "springs-and-rods", "staff-affinity",
+        "staff-staff-spacing", "stencil", "transparent", "used",
+        "vertical-skylines", "when", "whiteout",
+    ],
+    "NoteCollision": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "default-staff-staff-spacing",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer", "max-stretch",
+        "merge-differently-dotted", "merge-differently-headed",
+        "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "positioning-done",
+        "prefer-dotted-right", "rotation", "springs-and-rods",
+        "staff-affinity", "staff-staff-spacing", "stencil", "transparent",
+        "vertical-skylines", "whiteout",
+    ],
+    "NoteColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "default-staff-staff-spacing",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "force-hshift",
+        "horizontal-shift", "horizontal-skylines", "ignore-collision", "layer",
+        "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment",
+        "non-musical", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation",
+        "skyline-vertical-padding", "springs-and-rods", "staff-affinity",
+        "staff-staff-spacing", "stencil", "transparent", "vertical-skylines",
+        "whiteout",
+    ],
+    "NoteHead": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "duration-log", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "glyph-name", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "no-ledgers", "non-musical", "note-names",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods",
+        "staff-position", "stem-attachment", "stencil", "style", "thickness",
+        "transparent", "whiteout",
+    ],
+    "NoteName": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "NoteSpacing": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width",
+        "knee-spacing-correction", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "same-direction-correction", "space-to-barline", "springs-and-rods",
+        "stem-spacing-correction", "stencil", "transparent", "whiteout",
+    ],
+    "OctavateEight": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "self-alignment-X", "self-alignment-Y", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "OttavaBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "bracket-flare", "color",
+        "connect-to-neighbor", "cross-staff", "dash-fraction", "dash-period",
+        "direction", "edge-height", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "minimum-space",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "shorten-pair", "side-axis", "slur-padding",
+        "springs-and-rods", "staff-padding", "stencil", "style", "text",
+        "text-direction", "thickness", "to-barline", "transparent", "whiteout",
+        "word-space", "zigzag-length", "zigzag-width",
+    ],
+    "PaperColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "allow-loose-spacing", "avoid-slur", "axes", "before-line-breaking",
+        "between-cols", "break-visibility", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "full-measure-extra-space",
+        "horizontal-skylines", "keep-inside-line", "labels", "layer",
+        "line-break-penalty", "line-break-permission",
+        "line-break-system-details", "max-stretch", "measure-length",
+        "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "page-break-penalty", "page-break-permission", "page-turn-penalty",
+        "page-turn-permission", "rhythmic-location", "rotation",
+        "shortest-playing-duration", "shortest-starter-duration",
+        "skyline-vertical-padding", "springs-and-rods", "staff-affinity",
+        "staff-staff-spacing", "stencil", "transparent", "used",
+        "vertical-skylines", "when", "whiteout",
+    ],
+    "ParenthesesItem": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "springs-and-rods",
+        "stencil", "stencils", "transparent", "whiteout",
+    ],
+    "PercentRepeat": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "bound-padding", "color",
+        "cross-staff", "dot-negative-kern", "expand-limit", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size",
+        "hair-thickness", "layer", "measure-count", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "slash-negative-kern", "slope",
+        "spacing-pair", "springs-and-rods", "stencil", "thick-thickness",
+        "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "PercentRepeatCounter": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking", "color",
+        "cross-staff", "direction", "dot-negative-kern", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slash-negative-kern", "slope",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "thickness", "to-barline", "transparent", "whiteout",
+        "word-space",
+    ],
+    "PhrasingSlur": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation", "avoid-slur", "before-line-breaking", "color",
+        "control-points", "cross-staff", "dash-definition", "details",
+        "direction", "eccentricity", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "height-limit", "inspect-index", "inspect-quants",
+        "layer", "line-thickness", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positions", "ratio", "rotation",
+        "springs-and-rods", "stencil", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "PianoPedalBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-padding", "bracket-flare", "color", "cross-staff",
+        "dash-fraction", "dash-period", "edge-height", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "shorten-pair",
+        "springs-and-rods", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "RehearsalMark": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-align-symbols", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-break-align-symbols", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "self-alignment-X",
+        "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "RepeatSlash": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "dot-negative-kern", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "slash-negative-kern", "slope",
+        "springs-and-rods", "stencil", "thickness", "transparent", "whiteout",
+    ],
+    "RepeatTie": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "control-points", "cross-staff", "details", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "head-direction",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "thickness", "transparent", "whiteout",
+    ],
+    "RepeatTieColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "head-direction",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positioning-done", "rotation",
+        "springs-and-rods", "stencil", "tie-configuration", "transparent",
+        "whiteout",
+    ],
+    "Rest": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "direction", "duration-log", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-distance", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods",
+        "staff-position", "stencil", "style", "transparent", "whiteout",
+    ],
+    "RestCollision": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-distance",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "positioning-done",
+        "rotation", "springs-and-rods", "stencil", "transparent", "whiteout",
+    ],
+    "Script": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "positioning-done", "rotation", "script-priority", "side-axis",
+        "side-relative-direction", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "toward-stem-shift", "transparent",
+        "whiteout",
+    ],
+    "ScriptColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "transparent", "whiteout",
+    ],
+    "ScriptRow": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "transparent", "whiteout",
+    ],
+    "Slur": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation", "avoid-slur", "before-line-breaking", "color",
+        "control-points", "cross-staff", "dash-definition", "details",
+        "direction", "eccentricity", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "height-limit", "inspect-index", "inspect-quants",
+        "layer", "line-thickness", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positions", "ratio", "rotation",
+        "springs-and-rods", "stencil", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "SostenutoPedal": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil",
+        "text", "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "SostenutoPedalLineSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "SpacingSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "average-spacing-wishes", "avoid-slur", "base-shortest-duration",
+        "before-line-breaking", "color", "common-shortest-duration",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "packed-spacing",
+        "rotation", "shortest-duration-space", "spacing-increment",
+        "springs-and-rods", "stencil", "strict-grace-spacing",
+        "strict-note-spacing", "to-barline", "transparent",
+        "uniform-stretching", "whiteout",
+    ],
+    "SpanBar": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "allow-span-bar", "avoid-slur", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "gap", "glyph", "glyph-name",
+        "hair-thickness", "kern", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "stencil", "thick-thickness", "thin-kern",
+        "transparent", "whiteout",
+    ],
+    "StaffGrouper": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "staff-staff-spacing", "staffgroup-staff-spacing",
+        "stencil", "to-barline", "transparent", "whiteout",
+    ],
+    "StaffSpacing": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods",
+        "stem-spacing-correction", "stencil", "transparent", "whiteout",
+    ],
+    "StaffSymbol": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "ledger-line-thickness", "line-count", "line-positions",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "staff-space", "stencil", "thickness",
+        "to-barline", "transparent", "whiteout", "width",
+    ],
+    "StanzaNumber": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "text", "text-direction", "transparent",
+        "whiteout", "word-space",
+    ],
+    "Stem": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-note-head", "avoid-slur", "beaming", "beamlet-default-length",
+        "beamlet-max-length-proportion", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "default-direction",
+        "details", "direction", "duration-log", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "flag", "flag-style", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "french-beaming", "layer", "length", "length-fraction",
+        "max-beam-connect", "minimum-X-extent", "minimum-Y-extent",
+        "neutral-direction", "no-stem-extend", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "positioning-done", "rotation",
+        "springs-and-rods", "stem-end-position", "stemlet-length", "stencil",
+        "stroke-style", "thickness", "transparent", "whiteout",
+    ],
+    "StemTremolo": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "beam-thickness", "beam-width", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "flag-count", "layer", "length-fraction",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "slope", "springs-and-rods",
+        "stencil", "style", "transparent", "whiteout",
+    ],
+    "StringNumber": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space",
+        "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "script-priority", "self-alignment-X", "self-alignment-Y",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "text", "text-direction", "transparent", "whiteout",
+        "word-space",
+    ],
+    "StrokeFinger": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "digit-names", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-space", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "script-priority",
+        "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding",
+        "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "SustainPedal": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil",
+        "text", "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "SustainPedalLineSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "System": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "labels", "layer", "max-stretch", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "no-alignment",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "skyline-horizontal-padding",
+        "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "SystemStartBar": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "collapse-height", "color",
+        "cross-staff", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil",
+        "style", "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "SystemStartBrace": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "collapse-height", "color",
+        "cross-staff", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "minimum-space",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "SystemStartBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "collapse-height", "color",
+        "cross-staff", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "minimum-space",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "SystemStartSquare": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "collapse-height", "color",
+        "cross-staff", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "minimum-space",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout",
+    ],
+    "TabNoteHead": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "details", "duration-log",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "non-musical", "note-names", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "staff-position", "stem-attachment", "stencil",
+        "style", "text", "text-direction", "transparent", "whiteout",
+        "word-space",
+    ],
+    "TextScript": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+        "after-line-breaking", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "break-visibility", "color", "cross-staff",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "fret-diagram-details", "graphical", "harp-pedal-details", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "script-priority",
+        "self-alignment-X", "self-alignment-Y", "side-axis", "size",
+        "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text",
+        "text-direction", "thickness", "transparent", "whiteout", "word-space",
+    ],
+    "TextSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-details", "color", "cross-staff", "dash-fraction",
+        "dash-period", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-dy", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "gap", "layer",
+        "left-bound-info", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "right-bound-info", "rotation",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "style", "thickness", "to-barline", "transparent",
+        "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "Tie": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "annotation", "avoid-slur", "before-line-breaking", "color",
+        "control-points", "cross-staff", "dash-definition", "details",
+        "direction", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "head-direction", "layer", "line-thickness", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "neutral-direction",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "springs-and-rods", "staff-position", "stencil", "thickness",
+        "to-barline", "transparent", "whiteout",
+    ],
+    "TieColumn": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "positioning-done",
+        "rotation", "springs-and-rods", "stencil", "tie-configuration",
+        "to-barline", "transparent", "whiteout",
+    ],
+    "TimeSignature": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-align-anchor",
+        "break-align-anchor-alignment", "break-align-symbol",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "fraction", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "space-alist",
+        "springs-and-rods", "stencil", "style", "transparent", "whiteout",
+    ],
+    "TrillPitchAccidental": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "alteration", "avoid-slur", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "glyph-name-alist",
+        "hide-tied-accidental-after-break", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-space", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "parenthesized", "restore-first",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-padding", "stencil", "transparent", "whiteout",
+    ],
+    "TrillPitchGroup": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "break-visibility",
+        "color", "cross-staff", "default-staff-staff-spacing", "direction",
+        "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "extra-spacing-height", "extra-spacing-width", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name", "layer", "max-stretch", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-space", "no-alignment", "non-musical",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "note-names",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "side-axis",
+        "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding",
+        "staff-staff-spacing", "stem-attachment", "stencil", "stencils",
+        "style", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "TrillPitchHead": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "break-visibility", "color",
+        "cross-staff", "duration-log", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "extra-spacing-height", "extra-spacing-width",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "no-ledgers", "non-musical",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods",
+        "staff-position", "stencil", "transparent", "whiteout",
+    ],
+    "TrillSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-details", "color", "cross-staff", "dash-fraction",
+        "dash-period", "direction", "extra-X-extent", "extra-Y-extent",
+        "extra-dy", "extra-offset", "font-encoding", "font-family",
+        "font-name", "font-series", "font-shape", "font-size", "gap", "layer",
+        "left-bound-info", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "right-bound-info", "rotation",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "style", "thickness", "to-barline", "transparent",
+        "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "TupletBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bracket-flare", "bracket-visibility", "break-overshoot", "color",
+        "connect-to-neighbor", "control-points", "cross-staff",
+        "dash-fraction", "dash-period", "direction", "edge-height",
+        "edge-text", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "full-length-padding", "full-length-to-extent", "gap", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "positions", "rotation", "shorten-pair", "springs-and-rods",
+        "staff-padding", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "TupletNumber": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking", "color",
+        "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset",
+        "font-encoding", "font-family", "font-name", "font-series",
+        "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "text", "text-direction", "to-barline", "transparent", "whiteout",
+        "word-space",
+    ],
+    "UnaCordaPedal": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "baseline-skip", "before-line-breaking",
+        "break-visibility", "color", "cross-staff", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "extra-spacing-height",
+        "extra-spacing-width", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "layer", "minimum-X-extent",
+        "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "rotation",
+        "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil",
+        "text", "text-direction", "transparent", "whiteout", "word-space",
+    ],
+    "UnaCordaPedalLineSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "VaticanaLigature": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "before-line-breaking", "color", "cross-staff",
+        "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding",
+        "font-family", "font-name", "font-series", "font-shape", "font-size",
+        "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent",
+        "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "rotation", "springs-and-rods", "stencil",
+        "thickness", "to-barline", "transparent", "whiteout",
+    ],
+    "VerticalAlignment": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "align-dir", "avoid-slur", "axes", "before-line-breaking", "color",
+        "cross-staff", "default-staff-staff-spacing", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "positioning-done", "rotation", "springs-and-rods", "stacking-dir",
+        "staff-affinity", "staff-staff-spacing", "stencil", "to-barline",
+        "transparent", "vertical-skylines", "whiteout",
+    ],
+    "VerticalAxisGroup": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "layer", "max-stretch", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "no-alignment",
+        "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+        "nonstaff-unrelatedstaff-spacing", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "remove-empty", "remove-first", "rotation",
+        "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+    "VoiceFollower": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking",
+        "bound-details", "color", "cross-staff", "dash-fraction",
+        "dash-period", "extra-X-extent", "extra-Y-extent", "extra-dy",
+        "extra-offset", "gap", "layer", "left-bound-info", "minimum-X-extent",
+        "minimum-Y-extent", "minimum-length", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "right-bound-info", "rotation",
+        "springs-and-rods", "stencil", "style", "thickness", "to-barline",
+        "transparent", "whiteout", "zigzag-length", "zigzag-width",
+    ],
+    "VoltaBracket": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "arrow-length", "arrow-width", "avoid-slur", "baseline-skip",
+        "before-line-breaking", "bracket-flare", "color",
+        "connect-to-neighbor", "cross-staff", "dash-fraction", "dash-period",
+        "direction", "edge-height", "extra-X-extent", "extra-Y-extent",
+        "extra-offset", "font-encoding", "font-family", "font-name",
+        "font-series", "font-shape", "font-size", "height", "layer",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "normalized-endpoints",
+        "outside-staff-horizontal-padding", "outside-staff-padding",
+        "outside-staff-priority", "padding", "rotation", "shorten-pair",
+        "side-axis", "slur-padding", "springs-and-rods", "staff-padding",
+        "stencil", "style", "text", "text-direction", "thickness",
+        "to-barline", "transparent", "whiteout", "word-space", "zigzag-length",
+        "zigzag-width",
+    ],
+    "VoltaBracketSpanner": [
+        "X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking",
+        "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff",
+        "default-staff-staff-spacing", "direction", "extra-X-extent",
+        "extra-Y-extent", "extra-offset", "layer", "max-stretch",
+        "minimum-X-extent", "minimum-Y-extent", "minimum-length",
+        "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing",
+        "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing",
+        "normalized-endpoints", "outside-staff-horizontal-padding",
+        "outside-staff-padding", "outside-staff-priority", "padding",
+        "rotation", "side-axis", "slur-padding", "springs-and-rods",
+        "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil",
+        "to-barline", "transparent", "vertical-skylines", "whiteout",
+    ],
+}
+
+
+property_interfaces = {
+    "X-extent": [
+        "grob-interface", "separation-item-interface",
+    ],
+    "X-offset": [
+        "grob-interface",
+    ],
+    "Y-extent": [
+        "grob-interface",
+    ],
+    "Y-offset": [
+        "grob-interface",
+    ],
+    "add-stem-support": [
+        "script-interface", "text-script-interface",
+    ],
+    "after-line-breaking": [
+        "grob-interface",
+    ],
+    "align-dir": [
+        "align-interface", "fret-diagram-interface",
+    ],
+    "allow-loose-spacing": [
+        "spaceable-grob-interface",
+    ],
+    "allow-span-bar": [
+        "bar-line-interface",
+    ],
+    "alteration": [
+        "accidental-interface",
+    ],
+    "alteration-alist": [
+        "key-signature-interface",
+    ],
+    "annotation": [
+        "beam-interface", "slur-interface", "tie-interface",
+    ],
+    "annotation-balloon": [
+        "balloon-interface",
+    ],
+    "annotation-line": [
+        "balloon-interface",
+    ],
+    "arpeggio-direction": [
+        "arpeggio-interface",
+    ],
+    "arrow-length": [
+        "line-interface",
+    ],
+    "arrow-width": [
+        "line-interface",
+    ],
+    "auto-knee-gap": [
+        "beam-interface",
+    ],
+    "average-spacing-wishes": [
+        "spacing-spanner-interface",
+    ],
+    "avoid-note-head": [
+        "stem-interface",
+    ],
+    "avoid-slur": [
+        "accidental-interface", "dynamic-line-spanner-interface",
+        "grob-interface", "script-interface", "slur-interface",
+        "text-script-interface", "tie-interface", "tuplet-number-interface",
+    ],
+    "axes": [
+        "align-interface", "axis-group-interface",
+    ],
+    "base-shortest-duration": [
+        "spacing-spanner-interface",
+    ],
+    "baseline-skip": [
+        "text-interface",
+    ],
+    "beam-thickness": [
+        "beam-interface", "stem-tremolo-interface",
+    ],
+    "beam-width": [
+        "stem-tremolo-interface",
+    ],
+    "beamed-stem-shorten": [
+        "beam-interface",
+    ],
+    "beaming": [
+        "beam-interface", "stem-interface",
+    ],
+    "beamlet-default-length": [
+        "stem-interface",
+    ],
+    "beamlet-max-length-proportion": [
+        "stem-interface",
+    ],
+    "before-line-breaking": [
+        "grob-interface",
+    ],
+    "between-cols": [
+        "paper-column-interface",
+    ],
+    "bound-details": [
+        "line-spanner-interface",
+    ],
+    "bound-padding": [
+        "hairpin-interface", "multi-measure-interface",
+        "multi-measure-rest-interface", "piano-pedal-bracket-interface",
+    ],
+    "bracket-flare": [
+        "enclosing-bracket-interface", "horizontal-bracket-interface",
+        "ottava-bracket-interface", "piano-pedal-bracket-interface",
+        "tuplet-bracket-interface",
+    ],
+    "bracket-visibility": [
+        "tuplet-bracket-interface",
+    ],
+    "break-align-anchor": [
+        "break-aligned-interface",
+    ],
+    "break-align-anchor-alignment": [
+        "break-aligned-interface",
+    ],
+    "break-align-orders": [
+        "break-alignment-interface",
+    ],
+    "break-align-symbol": [
+        "break-aligned-interface",
+    ],
+    "break-align-symbols": [
+        "break-alignable-interface",
+    ],
+    "break-overshoot": [
+        "beam-interface", "tuplet-bracket-interface",
+    ],
+    "break-visibility": [
+        "item-interface",
+    ],
+    "breakable": [
+        "unbreakable-spanner-interface",
+    ],
+    "c0-position": [
+        "key-signature-interface",
+    ],
+    "circled-tip": [
+        "hairpin-interface",
+    ],
+    "clip-edges": [
+        "beam-interface",
+    ],
+    "collapse-height": [
+        "system-start-delimiter-interface",
+    ],
+    "collision-interfaces": [
+        "beam-interface",
+    ],
+    "collision-voice-only": [
+        "beam-interface",
+    ],
+    "color": [
+        "grob-interface",
+    ],
+    "common-shortest-duration": [
+        "grace-spacing-interface", "spacing-spanner-interface",
+    ],
+    "concaveness": [
+        "beam-interface",
+    ],
+    "connect-to-neighbor": [
+        "horizontal-bracket-interface", "tuplet-bracket-interface",
+    ],
+    "control-points": [
+        "semi-tie-interface", "slur-interface", "tie-interface",
+        "tuplet-bracket-interface",
+    ],
+    "cross-staff": [
+        "grob-interface",
+    ],
+    "damping": [
+        "beam-interface",
+    ],
+    "dash-definition": [
+        "arpeggio-interface", "slur-interface", "tie-interface",
+    ],
+    "dash-fraction": [
+        "line-interface",
+    ],
+    "dash-period": [
+        "line-interface", "lyric-hyphen-interface",
+    ],
+    "default-direction": [
+        "stem-interface",
+    ],
+    "default-staff-staff-spacing": [
+        "axis-group-interface",
+    ],
+    "details": [
+        "beam-interface", "semi-tie-interface", "slur-interface",
+        "stem-interface", "tab-note-head-interface", "tie-interface",
+    ],
+    "digit-names": [
+        "stroke-finger-interface",
+    ],
+    "direction": [
+        "accidental-placement-interface", "beam-interface",
+        "breathing-sign-interface", "dot-column-interface", "dots-interface",
+        "rest-interface", "semi-tie-interface", "side-position-interface",
+        "slur-interface", "stem-interface", "tie-interface",
+        "tuplet-bracket-interface",
+    ],
+    "dot-count": [
+        "dots-interface",
+    ],
+    "dot-negative-kern": [
+        "percent-repeat-interface", "percent-repeat-item-interface",
+    ],
+    "dot-placement-list": [
+        "fret-diagram-interface",
+    ],
+    "duration-log": [
+        "rhythmic-head-interface", "stem-interface",
+    ],
+    "eccentricity": [
+        "slur-interface",
+    ],
+    "edge-height": [
+        "enclosing-bracket-interface", "horizontal-bracket-interface",
+        "ottava-bracket-interface", "piano-pedal-bracket-interface",
+        "tuplet-bracket-interface",
+    ],
+    "edge-text": [
+        "tuplet-bracket-interface",
+    ],
+    "expand-limit": [
+        "multi-measure-rest-interface",
+    ],
+    "extra-X-extent": [
+        "grob-interface",
+    ],
+    "extra-Y-extent": [
+        "grob-interface",
+    ],
+    "extra-dy": [
+        "line-spanner-interface",
+    ],
+    "extra-offset": [
+        "grob-interface",
+    ],
+    "extra-spacing-height": [
+        "item-interface",
+    ],
+    "extra-spacing-width": [
+        "item-interface",
+    ],
+    "flag": [
+        "stem-interface",
+    ],
+    "flag-count": [
+        "stem-tremolo-interface",
+    ],
+    "flag-style": [
+        "stem-interface",
+    ],
+    "font-encoding": [
+        "font-interface",
+    ],
+    "font-family": [
+        "font-interface",
+    ],
+    "font-name": [
+        "font-interface",
+    ],
+    "font-series": [
+        "font-interface",
+    ],
+    "font-shape": [
+        "font-interface",
+    ],
+    "font-size": [
+        "font-interface",
+    ],
+    "footnote-text": [
+        "footnote-interface", "footnote-spanner-interface",
+    ],
+    "force-hshift": [
+        "note-column-interface",
+    ],
+    "fraction": [
+        "time-signature-interface",
+    ],
+    "french-beaming": [
+        "stem-interface",
+    ],
+    "fret-diagram-details": [
+        "fret-diagram-interface", "instrument-specific-markup-interface",
+    ],
+    "full-length-padding": [
+        "tuplet-bracket-interface",
+    ],
+    "full-length-to-extent": [
+        "tuplet-bracket-interface",
+    ],
+    "full-measure-extra-space": [
+        "paper-column-interface",
+    ],
+    "full-size-change": [
+        "clef-interface",
+    ],
+    "gap": [
+        "ambitus-interface", "bar-line-interface", "beam-interface",
+        "ledger-line-spanner-interface", "line-spanner-interface",
+        "tuplet-bracket-interface",
+    ],
+    "gap-count": [
+        "beam-interface",
+    ],
+    "glyph": [
+        "bar-line-interface", "clef-interface",
+    ],
+    "glyph-name": [
+        "bar-line-interface", "clef-interface", "note-head-interface",
+        "span-bar-interface", "vaticana-ligature-interface",
+    ],
+    "glyph-name-alist": [
+        "accidental-interface", "key-signature-interface",
+    ],
+    "graphical": [
+        "instrument-specific-markup-interface",
+    ],
+    "grow-direction": [
+        "beam-interface", "hairpin-interface",
+    ],
+    "hair-thickness": [
+        "bar-line-interface", "multi-measure-rest-interface",
+    ],
+    "harp-pedal-details": [
+        "instrument-specific-markup-interface",
+    ],
+    "head-direction": [
+        "semi-tie-column-interface", "semi-tie-interface", "tie-interface",
+    ],
+    "height": [
+        "hairpin-interface", "ligature-bracket-interface",
+        "lyric-hyphen-interface", "measure-grouping-interface",
+        "volta-bracket-interface",
+    ],
+    "height-limit": [
+        "slur-interface",
+    ],
+    "hide-tied-accidental-after-break": [
+        "accidental-interface",
+    ],
+    "horizontal-shift": [
+        "note-column-interface",
+    ],
+    "horizontal-skylines": [
+        "separation-item-interface",
+    ],
+    "ignore-collision": [
+        "note-column-interface",
+    ],
+    "implicit": [
+        "bass-figure-interface",
+    ],
+    "inspect-index": [
+        "slur-interface",
+    ],
+    "inspect-quants": [
+        "beam-interface", "slur-interface",
+    ],
+    "keep-inside-line": [
+        "spaceable-grob-interface",
+    ],
+    "kern": [
+        "bar-line-interface",
+    ],
+    "knee": [
+        "beam-interface",
+    ],
+    "knee-spacing-correction": [
+        "note-spacing-interface",
+    ],
+    "labels": [
+        "paper-column-interface", "system-interface",
+    ],
+    "layer": [
+        "grob-interface",
+    ],
+    "ledger-line-thickness": [
+        "staff-symbol-interface",
+    ],
+    "left-bound-info": [
+        "line-spanner-interface",
+    ],
+    "left-padding": [
+        "lyric-extender-interface",
+    ],
+    "length": [
+        "lyric-hyphen-interface", "stem-interface",
+    ],
+    "length-fraction": [
+        "beam-interface", "ledger-line-spanner-interface", "stem-interface",
+        "stem-tremolo-interface",
+    ],
+    "line-break-penalty": [
+        "paper-column-interface",
+    ],
+    "line-break-permission": [
+        "paper-column-interface",
+    ],
+    "line-break-system-details": [
+        "paper-column-interface",
+    ],
+    "line-count": [
+        "staff-symbol-interface",
+    ],
+    "line-positions": [
+        "staff-symbol-interface",
+    ],
+    "line-thickness": [
+        "slur-interface", "tie-interface",
+    ],
+    "long-text": [
+        "system-start-text-interface",
+    ],
+    "max-beam-connect": [
+        "stem-interface",
+    ],
+    "max-stretch": [
+        "axis-group-interface",
+    ],
+    "measure-count": [
+        "multi-measure-rest-interface",
+    ],
+    "measure-length": [
+        "spaceable-grob-interface",
+    ],
+    "merge-differently-dotted": [
+        "note-collision-interface",
+    ],
+    "merge-differently-headed": [
+        "note-collision-interface",
+    ],
+    "minimum-X-extent": [
+        "grob-interface",
+    ],
+    "minimum-Y-extent": [
+        "grob-interface",
+    ],
+    "minimum-distance": [
+        "lyric-hyphen-interface", "rest-collision-interface", "rest-interface",
+    ],
+    "minimum-length": [
+        "lyric-hyphen-interface", "multi-measure-rest-interface",
+        "ottava-bracket-interface", "spanner-interface",
+    ],
+    "minimum-length-fraction": [
+        "ledger-line-spanner-interface",
+    ],
+    "minimum-space": [
+        "side-position-interface",
+    ],
+    "neutral-direction": [
+        "beam-interface", "custos-interface", "melody-spanner-interface",
+        "stem-interface", "tie-interface",
+    ],
+    "neutral-position": [
+        "custos-interface",
+    ],
+    "next": [
+        "lyric-extender-interface",
+    ],
+    "no-alignment": [
+        "axis-group-interface",
+    ],
+    "no-ledgers": [
+        "ledgered-interface",
+    ],
+    "no-stem-extend": [
+        "stem-interface",
+    ],
+    "non-break-align-symbols": [
+        "break-alignable-interface",
+    ],
+    "non-default": [
+        "clef-interface",
+    ],
+    "non-musical": [
+        "item-interface",
+    ],
+    "nonstaff-nonstaff-spacing": [
+        "axis-group-interface",
+    ],
+    "nonstaff-relatedstaff-spacing": [
+        "axis-group-interface",
+    ],
+    "nonstaff-unrelatedstaff-spacing": [
+        "axis-group-interface",
+    ],
+    "normalized-endpoints": [
+        "spanner-interface",
+    ],
+    "note-names": [
+        "note-head-interface",
+    ],
+    "outside-staff-horizontal-padding": [
+        "grob-interface",
+    ],
+    "outside-staff-padding": [
+        "grob-interface",
+    ],
+    "outside-staff-priority": [
+        "grob-interface",
+    ],
+    "packed-spacing": [
+        "spacing-spanner-interface",
+    ],
+    "padding": [
+        "accidental-placement-interface", "align-interface",
+        "balloon-interface", "cluster-interface",
+        "enclosing-bracket-interface", "figured-bass-continuation-interface",
+        "key-signature-interface", "lyric-hyphen-interface",
+        "parentheses-interface", "separation-item-interface",
+        "side-position-interface", "tuplet-bracket-interface",
+    ],
+    "padding-pairs": [
+        "key-signature-interface",
+    ],
+    "page-break-penalty": [
+        "paper-column-interface",
+    ],
+    "page-break-permission": [
+        "paper-column-interface",
+    ],
+    "page-turn-penalty": [
+        "paper-column-interface",
+    ],
+    "page-turn-permission": [
+        "paper-column-interface",
+    ],
+    "parenthesized": [
+        "accidental-interface",
+    ],
+    "positioning-done": [
+        "accidental-placement-interface", "align-interface",
+        "break-alignment-interface", "dot-column-interface",
+        "note-collision-interface", "rest-collision-interface",
+        "script-interface", "semi-tie-column-interface", "stem-interface",
+        "tie-column-interface",
+    ],
+    "positions": [
+        "arpeggio-interface", "beam-interface", "cluster-beacon-interface",
+        "slur-interface", "tuplet-bracket-interface",
+    ],
+    "prefer-dotted-right": [
+        "note-collision-interface",
+    ],
+    "ratio": [
+        "slur-interface",
+    ],
+    "remove-empty": [
+        "hara-kiri-group-spanner-interface",
+    ],
+    "remove-first": [
+        "hara-kiri-group-spanner-interface",
+    ],
+    "restore-first": [
+        "accidental-interface",
+    ],
+    "rhythmic-location": [
+        "paper-column-interface",
+    ],
+    "right-bound-info": [
+        "line-spanner-interface",
+    ],
+    "right-padding": [
+        "accidental-placement-interface", "dynamic-text-interface",
+        "lyric-extender-interface",
+    ],
+    "rotation": [
+        "grob-interface",
+    ],
+    "same-direction-correction": [
+        "note-spacing-interface",
+    ],
+    "script-priority": [
+        "accidental-placement-interface", "arpeggio-interface",
+        "script-interface", "text-script-interface",
+    ],
+    "self-alignment-X": [
+        "self-alignment-interface", "system-start-text-interface",
+    ],
+    "self-alignment-Y": [
+        "self-alignment-interface", "system-start-text-interface",
+    ],
+    "shorten-pair": [
+        "enclosing-bracket-interface", "horizontal-bracket-interface",
+        "ottava-bracket-interface", "piano-pedal-bracket-interface",
+        "tuplet-bracket-interface",
+    ],
+    "shortest-duration-space": [
+        "spacing-options-interface", "spacing-spanner-interface",
+    ],
+    "shortest-playing-duration": [
+        "paper-column-interface",
+    ],
+    "shortest-starter-duration": [
+        "paper-column-interface",
+    ],
+    "side-axis": [
+        "side-position-interface",
+    ],
+    "side-relative-direction": [
+        "script-interface",
+    ],
+    "size": [
+        "fret-diagram-interface", "instrument-specific-markup-interface",
+    ],
+    "skyline-horizontal-padding": [
+        "system-interface",
+    ],
+    "skyline-vertical-padding": [
+        "separation-item-interface",
+    ],
+    "slash-negative-kern": [
+        "percent-repeat-interface", "percent-repeat-item-interface",
+    ],
+    "slope": [
+        "percent-repeat-interface", "percent-repeat-item-interface",
+        "stem-tremolo-interface",
+    ],
+    "slur-padding": [
+        "script-interface", "side-position-interface",
+    ],
+    "space-alist": [
+        "break-aligned-interface",
+    ],
+    "space-to-barline": [
+        "note-spacing-interface",
+    ],
+    "spacing-increment": [
+        "spacing-options-interface", "spacing-spanner-interface",
+    ],
+    "spacing-pair": [
+        "multi-measure-rest-interface",
+    ],
+    "springs-and-rods": [
+        "grob-interface",
+    ],
+    "stacking-dir": [
+        "align-interface",
+    ],
+    "staff-affinity": [
+        "axis-group-interface",
+    ],
+    "staff-padding": [
+        "side-position-interface", "tuplet-bracket-interface",
+    ],
+    "staff-position": [
+        "staff-symbol-referencer-interface", "tie-interface",
+    ],
+    "staff-space": [
+        "staff-symbol-interface",
+    ],
+    "staff-staff-spacing": [
+        "axis-group-interface", "staff-grouper-interface",
+    ],
+    "staffgroup-staff-spacing": [
+        "staff-grouper-interface",
+    ],
+    "stem-attachment": [
+        "note-head-interface",
+    ],
+    "stem-end-position": [
+        "stem-interface",
+    ],
+    "stem-spacing-correction": [
+        "note-spacing-interface", "staff-spacing-interface",
+    ],
+    "stemlet-length": [
+        "stem-interface",
+    ],
+    "stencil": [
+        "grob-interface",
+    ],
+    "stencils": [
+        "parentheses-interface",
+    ],
+    "strict-grace-spacing": [
+        "spacing-spanner-interface",
+    ],
+    "strict-note-spacing": [
+        "spacing-spanner-interface",
+    ],
+    "stroke-style": [
+        "stem-interface",
+    ],
+    "style": [
+        "cluster-interface", "custos-interface", "dots-interface",
+        "line-interface", "measure-grouping-interface", "note-head-interface",
+        "rest-interface", "stem-tremolo-interface",
+        "system-start-delimiter-interface", "time-signature-interface",
+    ],
+    "text": [
+        "balloon-interface", "dynamic-text-spanner-interface",
+        "system-start-text-interface", "text-interface",
+    ],
+    "text-direction": [
+        "text-interface",
+    ],
+    "thick-thickness": [
+        "bar-line-interface", "multi-measure-rest-interface",
+    ],
+    "thickness": [
+        "ambitus-interface", "bend-after-interface",
+        "enclosing-bracket-interface", "figured-bass-continuation-interface",
+        "fret-diagram-interface", "grid-line-interface",
+        "instrument-specific-markup-interface",
+        "ledger-line-spanner-interface", "ligature-bracket-interface",
+        "line-interface", "line-spanner-interface", "lyric-extender-interface",
+        "lyric-hyphen-interface", "measure-grouping-interface",
+        "mensural-ligature-interface", "percent-repeat-interface",
+        "percent-repeat-item-interface", "semi-tie-interface",
+        "slur-interface", "staff-symbol-interface", "stem-interface",
+        "system-start-delimiter-interface", "tie-interface",
+        "tuplet-bracket-interface", "vaticana-ligature-interface",
+        "volta-bracket-interface",
+    ],
+    "thin-kern": [
+        "bar-line-interface",
+    ],
+    "tie-configuration": [
+        "semi-tie-column-interface", "tie-column-interface",
+    ],
+    "to-barline": [
+        "line-spanner-interface", "spanner-interface",
+    ],
+    "toward-stem-shift": [
+        "script-interface",
+    ],
+    "transparent": [
+        "grob-interface",
+    ],
+    "uniform-stretching": [
+        "spacing-spanner-interface",
+    ],
+    "used": [
+        "paper-column-interface",
+    ],
+    "vertical-skylines": [
+        "axis-group-interface",
+    ],
+    "when": [
+        "paper-column-interface",
+    ],
+    "whiteout": [
+        "grob-interface",
+    ],
+    "width": [
+        "ligature-bracket-interface", "staff-symbol-interface",
+    ],
+    "word-space": [
+        "text-interface",
+    ],
+    "zigzag-length": [
+        "line-interface",
+    ],
+    "zigzag-width": [
+        "line-interface",
+    ],
+}
+
+
+property_grobs = {
+    "X-extent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "X-offset": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "Y-extent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "Y-offset": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "add-stem-support": [
+        "AccidentalSuggestion", "CombineTextScript", "DynamicText",
+        "Fingering", "Script", "StringNumber", "StrokeFinger", "TextScript",
+    ],
+    "after-line-breaking": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "align-dir": [
+        "BassFigureAlignment", "FretBoard", "VerticalAlignment",
+    ],
+    "allow-loose-spacing": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "allow-span-bar": [
+        "BarLine", "SpanBar",
+    ],
+    "alteration": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "TrillPitchAccidental",
+    ],
+    "alteration-alist": [
+        "KeyCancellation", "KeySignature",
+    ],
+    "annotation": [
+        "Beam", "PhrasingSlur", "Slur", "Tie",
+    ],
+    "annotation-balloon": [
+        "BalloonTextItem", "FootnoteItem", "FootnoteSpanner",
+    ],
+    "annotation-line": [
+        "BalloonTextItem", "FootnoteItem", "FootnoteSpanner",
+    ],
+    "arpeggio-direction": [
+        "Arpeggio",
+    ],
+    "arrow-length": [
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "OttavaBracket",
+        "PianoPedalBracket", "TextSpanner", "TrillSpanner", "TupletBracket",
+        "VoiceFollower", "VoltaBracket",
+    ],
+    "arrow-width": [
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "OttavaBracket",
+        "PianoPedalBracket", "TextSpanner", "TrillSpanner", "TupletBracket",
+        "VoiceFollower", "VoltaBracket",
+    ],
+    "auto-knee-gap": [
+        "Beam",
+    ],
+    "average-spacing-wishes": [
+        "SpacingSpanner",
+    ],
+    "avoid-note-head": [
+        "Stem",
+    ],
+    "avoid-slur": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "axes": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "base-shortest-duration": [
+        "SpacingSpanner",
+    ],
+    "baseline-skip": [
+        "BalloonTextItem", "BarNumber", "BassFigure", "BreathingSign",
+        "ChordName", "CombineTextScript", "DoublePercentRepeatCounter",
+        "DynamicText", "DynamicTextSpanner", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "InstrumentSwitch", "LyricText", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "NoteName",
+        "OctavateEight", "OttavaBracket", "PercentRepeatCounter",
+        "RehearsalMark", "SostenutoPedal", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TupletNumber", "UnaCordaPedal", "VoltaBracket",
+    ],
+    "beam-thickness": [
+        "Beam", "StemTremolo",
+    ],
+    "beam-width": [
+        "StemTremolo",
+    ],
+    "beamed-stem-shorten": [
+        "Beam",
+    ],
+    "beaming": [
+        "Beam", "Stem",
+    ],
+    "beamlet-default-length": [
+        "Stem",
+    ],
+    "beamlet-max-length-proportion": [
+        "Stem",
+    ],
+    "before-line-breaking": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "between-cols": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "bound-details": [
+        "DynamicTextSpanner", "Episema", "Glissando", "TextSpanner",
+        "TrillSpanner", "VoiceFollower",
+    ],
+    "bound-padding": [
+        "Hairpin", "MultiMeasureRest", "MultiMeasureRestNumber",
+        "MultiMeasureRestText", "PercentRepeat", "PianoPedalBracket",
+    ],
+    "bracket-flare": [
+        "BassFigureBracket", "HorizontalBracket", "LigatureBracket",
+        "OttavaBracket", "PianoPedalBracket", "TupletBracket", "VoltaBracket",
+    ],
+    "bracket-visibility": [
+        "LigatureBracket", "TupletBracket",
+    ],
+    "break-align-anchor": [
+        "Ambitus", "AmbitusAccidental", "BarLine", "BreakAlignGroup",
+        "BreathingSign", "Clef", "CueClef", "CueEndClef", "Custos",
+        "DoublePercentRepeat", "KeyCancellation", "KeySignature", "LeftEdge",
+        "TimeSignature",
+    ],
+    "break-align-anchor-alignment": [
+        "Ambitus", "AmbitusAccidental", "BarLine", "BreakAlignGroup",
+        "BreathingSign", "Clef", "CueClef", "CueEndClef", "Custos",
+        "DoublePercentRepeat", "KeyCancellation", "KeySignature", "LeftEdge",
+        "TimeSignature",
+    ],
+    "break-align-orders": [
+        "BreakAlignment",
+    ],
+    "break-align-symbol": [
+        "Ambitus", "AmbitusAccidental", "BarLine", "BreakAlignGroup",
+        "BreathingSign", "Clef", "CueClef", "CueEndClef", "Custos",
+        "DoublePercentRepeat", "KeyCancellation", "KeySignature", "LeftEdge",
+        "TimeSignature",
+    ],
+    "break-align-symbols": [
+        "BarNumber", "MetronomeMark", "RehearsalMark",
+    ],
+    "break-overshoot": [
+        "Beam", "LigatureBracket", "TupletBracket",
+    ],
+    "break-visibility": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureBracket", "BreakAlignGroup",
+        "BreakAlignment", "BreathingSign", "ChordName", "Clef",
+        "ClusterSpannerBeacon", "CombineTextScript", "CueClef", "CueEndClef",
+        "Custos", "DotColumn", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "Fingering", "FootnoteItem", "FretBoard", "GridLine", "GridPoint",
+        "InstrumentSwitch", "KeyCancellation", "KeySignature",
+        "LaissezVibrerTie", "LaissezVibrerTieColumn", "LeftEdge", "LyricText",
+        "MelodyItem", "MetronomeMark", "NonMusicalPaperColumn",
+        "NoteCollision", "NoteColumn", "NoteHead", "NoteName", "NoteSpacing",
+        "OctavateEight", "PaperColumn", "ParenthesesItem", "RehearsalMark",
+        "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest", "RestCollision",
+        "Script", "ScriptColumn", "ScriptRow", "SostenutoPedal", "SpanBar",
+        "StaffSpacing", "StanzaNumber", "Stem", "StemTremolo", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "UnaCordaPedal",
+    ],
+    "breakable": [
+        "Beam", "Glissando",
+    ],
+    "c0-position": [
+        "KeyCancellation", "KeySignature",
+    ],
+    "circled-tip": [
+        "Hairpin",
+    ],
+    "clip-edges": [
+        "Beam",
+    ],
+    "collapse-height": [
+        "SystemStartBar", "SystemStartBrace", "SystemStartBracket",
+        "SystemStartSquare",
+    ],
+    "collision-interfaces": [
+        "Beam",
+    ],
+    "collision-voice-only": [
+        "Beam",
+    ],
+    "color": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "common-shortest-duration": [
+        "GraceSpacing", "SpacingSpanner",
+    ],
+    "concaveness": [
+        "Beam",
+    ],
+    "connect-to-neighbor": [
+        "HorizontalBracket", "LigatureBracket", "OttavaBracket",
+        "TupletBracket", "VoltaBracket",
+    ],
+    "control-points": [
+        "LaissezVibrerTie", "LigatureBracket", "PhrasingSlur", "RepeatTie",
+        "Slur", "Tie", "TupletBracket",
+    ],
+    "cross-staff": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "damping": [
+        "Beam",
+    ],
+    "dash-definition": [
+        "Arpeggio", "PhrasingSlur", "Slur", "Tie",
+    ],
+    "dash-fraction": [
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "OttavaBracket",
+        "PianoPedalBracket", "TextSpanner", "TrillSpanner", "TupletBracket",
+        "VoiceFollower", "VoltaBracket",
+    ],
+    "dash-period": [
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "LyricHyphen", "LyricSpace",
+        "OttavaBracket", "PianoPedalBracket", "TextSpanner", "TrillSpanner",
+        "TupletBracket", "VoiceFollower", "VoltaBracket",
+    ],
+    "default-direction": [
+        "Stem",
+    ],
+    "default-staff-staff-spacing": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "details": [
+        "Beam", "LaissezVibrerTie", "PhrasingSlur", "RepeatTie", "Slur",
+        "Stem", "TabNoteHead", "Tie",
+    ],
+    "digit-names": [
+        "StrokeFinger",
+    ],
+    "direction": [
+        "AccidentalPlacement", "AccidentalSuggestion", "AmbitusAccidental",
+        "Arpeggio", "BarNumber", "BassFigureAlignmentPositioning", "Beam",
+        "BreathingSign", "CombineTextScript", "DotColumn", "Dots",
+        "DoublePercentRepeatCounter", "DynamicLineSpanner", "Episema",
+        "Fingering", "HorizontalBracket", "InstrumentName", "InstrumentSwitch",
+        "LaissezVibrerTie", "LigatureBracket", "MeasureGrouping",
+        "MetronomeMark", "MultiMeasureRest", "MultiMeasureRestNumber",
+        "MultiMeasureRestText", "OctavateEight", "OttavaBracket",
+        "PercentRepeatCounter", "PhrasingSlur", "RehearsalMark", "RepeatTie",
+        "Rest", "Script", "Slur", "SostenutoPedalLineSpanner", "StanzaNumber",
+        "Stem", "StringNumber", "StrokeFinger", "SustainPedalLineSpanner",
+        "SystemStartBar", "SystemStartBrace", "SystemStartBracket",
+        "SystemStartSquare", "TextScript", "TextSpanner", "Tie",
+        "TrillPitchAccidental", "TrillPitchGroup", "TrillSpanner",
+        "TupletBracket", "UnaCordaPedalLineSpanner", "VoltaBracket",
+        "VoltaBracketSpanner",
+    ],
+    "dot-count": [
+        "Dots",
+    ],
+    "dot-negative-kern": [
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "PercentRepeat", "PercentRepeatCounter",
+        "RepeatSlash",
+    ],
+    "dot-placement-list": [
+        "FretBoard",
+    ],
+    "duration-log": [
+        "AmbitusNoteHead", "NoteHead", "Rest", "Stem", "TabNoteHead",
+        "TrillPitchHead",
+    ],
+    "eccentricity": [
+        "PhrasingSlur", "Slur",
+    ],
+    "edge-height": [
+        "BassFigureBracket", "HorizontalBracket", "LigatureBracket",
+        "OttavaBracket", "PianoPedalBracket", "TupletBracket", "VoltaBracket",
+    ],
+    "edge-text": [
+        "LigatureBracket", "TupletBracket",
+    ],
+    "expand-limit": [
+        "MultiMeasureRest", "PercentRepeat",
+    ],
+    "extra-X-extent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "extra-Y-extent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "extra-dy": [
+        "DynamicTextSpanner", "Episema", "Glissando", "TextSpanner",
+        "TrillSpanner", "VoiceFollower",
+    ],
+    "extra-offset": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "extra-spacing-height": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureBracket", "BreakAlignGroup",
+        "BreakAlignment", "BreathingSign", "ChordName", "Clef",
+        "ClusterSpannerBeacon", "CombineTextScript", "CueClef", "CueEndClef",
+        "Custos", "DotColumn", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "Fingering", "FootnoteItem", "FretBoard", "GridLine", "GridPoint",
+        "InstrumentSwitch", "KeyCancellation", "KeySignature",
+        "LaissezVibrerTie", "LaissezVibrerTieColumn", "LeftEdge", "LyricText",
+        "MelodyItem", "MetronomeMark", "NonMusicalPaperColumn",
+        "NoteCollision", "NoteColumn", "NoteHead", "NoteName", "NoteSpacing",
+        "OctavateEight", "PaperColumn", "ParenthesesItem", "RehearsalMark",
+        "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest", "RestCollision",
+        "Script", "ScriptColumn", "ScriptRow", "SostenutoPedal", "SpanBar",
+        "StaffSpacing", "StanzaNumber", "Stem", "StemTremolo", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "UnaCordaPedal",
+    ],
+    "extra-spacing-width": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureBracket", "BreakAlignGroup",
+        "BreakAlignment", "BreathingSign", "ChordName", "Clef",
+        "ClusterSpannerBeacon", "CombineTextScript", "CueClef", "CueEndClef",
+        "Custos", "DotColumn", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "Fingering", "FootnoteItem", "FretBoard", "GridLine", "GridPoint",
+        "InstrumentSwitch", "KeyCancellation", "KeySignature",
+        "LaissezVibrerTie", "LaissezVibrerTieColumn", "LeftEdge", "LyricText",
+        "MelodyItem", "MetronomeMark", "NonMusicalPaperColumn",
+        "NoteCollision", "NoteColumn", "NoteHead", "NoteName", "NoteSpacing",
+        "OctavateEight", "PaperColumn", "ParenthesesItem", "RehearsalMark",
+        "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest", "RestCollision",
+        "Script", "ScriptColumn", "ScriptRow", "SostenutoPedal", "SpanBar",
+        "StaffSpacing", "StanzaNumber", "Stem", "StemTremolo", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "UnaCordaPedal",
+    ],
+    "flag": [
+        "Stem",
+    ],
+    "flag-count": [
+        "StemTremolo",
+    ],
+    "flag-style": [
+        "Stem",
+    ],
+    "font-encoding": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio",
+        "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "Beam",
+        "BreathingSign", "ChordName", "Clef", "CombineTextScript", "CueClef",
+        "CueEndClef", "Custos", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "InstrumentName", "InstrumentSwitch",
+        "KeyCancellation", "KeySignature", "LyricHyphen", "LyricText",
+        "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteHead", "NoteName", "OctavateEight",
+        "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "RehearsalMark", "Rest", "Script",
+        "SostenutoPedal", "SpanBar", "StanzaNumber", "Stem", "StringNumber",
+        "StrokeFinger", "SustainPedal", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+        "TextSpanner", "TimeSignature", "TrillPitchAccidental",
+        "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletNumber",
+        "UnaCordaPedal", "VaticanaLigature", "VoltaBracket",
+    ],
+    "font-family": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio",
+        "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "Beam",
+        "BreathingSign", "ChordName", "Clef", "CombineTextScript", "CueClef",
+        "CueEndClef", "Custos", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "InstrumentName", "InstrumentSwitch",
+        "KeyCancellation", "KeySignature", "LyricHyphen", "LyricText",
+        "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteHead", "NoteName", "OctavateEight",
+        "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "RehearsalMark", "Rest", "Script",
+        "SostenutoPedal", "SpanBar", "StanzaNumber", "Stem", "StringNumber",
+        "StrokeFinger", "SustainPedal", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+        "TextSpanner", "TimeSignature", "TrillPitchAccidental",
+        "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletNumber",
+        "UnaCordaPedal", "VaticanaLigature", "VoltaBracket",
+    ],
+    "font-name": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio",
+        "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "Beam",
+        "BreathingSign", "ChordName", "Clef", "CombineTextScript", "CueClef",
+        "CueEndClef", "Custos", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "InstrumentName", "InstrumentSwitch",
+        "KeyCancellation", "KeySignature", "LyricHyphen", "LyricText",
+        "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteHead", "NoteName", "OctavateEight",
+        "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "RehearsalMark", "Rest", "Script",
+        "SostenutoPedal", "SpanBar", "StanzaNumber", "Stem", "StringNumber",
+        "StrokeFinger", "SustainPedal", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+        "TextSpanner", "TimeSignature", "TrillPitchAccidental",
+        "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletNumber",
+        "UnaCordaPedal", "VaticanaLigature", "VoltaBracket",
+    ],
+    "font-series": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio",
+        "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "Beam",
+        "BreathingSign", "ChordName", "Clef", "CombineTextScript", "CueClef",
+        "CueEndClef", "Custos", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "InstrumentName", "InstrumentSwitch",
+        "KeyCancellation", "KeySignature", "LyricHyphen", "LyricText",
+        "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteHead", "NoteName", "OctavateEight",
+        "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "RehearsalMark", "Rest", "Script",
+        "SostenutoPedal", "SpanBar", "StanzaNumber", "Stem", "StringNumber",
+        "StrokeFinger", "SustainPedal", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+        "TextSpanner", "TimeSignature", "TrillPitchAccidental",
+        "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletNumber",
+        "UnaCordaPedal", "VaticanaLigature", "VoltaBracket",
+    ],
+    "font-shape": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio",
+        "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "Beam",
+        "BreathingSign", "ChordName", "Clef", "CombineTextScript", "CueClef",
+        "CueEndClef", "Custos", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "InstrumentName", "InstrumentSwitch",
+        "KeyCancellation", "KeySignature", "LyricHyphen", "LyricText",
+        "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteHead", "NoteName", "OctavateEight",
+        "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "RehearsalMark", "Rest", "Script",
+        "SostenutoPedal", "SpanBar", "StanzaNumber", "Stem", "StringNumber",
+        "StrokeFinger", "SustainPedal", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+        "TextSpanner", "TimeSignature", "TrillPitchAccidental",
+        "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletNumber",
+        "UnaCordaPedal", "VaticanaLigature", "VoltaBracket",
+    ],
+    "font-size": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio",
+        "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "Beam",
+        "BreathingSign", "ChordName", "Clef", "CombineTextScript", "CueClef",
+        "CueEndClef", "Custos", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "InstrumentName", "InstrumentSwitch",
+        "KeyCancellation", "KeySignature", "LyricHyphen", "LyricText",
+        "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteHead", "NoteName", "OctavateEight",
+        "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "RehearsalMark", "Rest", "Script",
+        "SostenutoPedal", "SpanBar", "StanzaNumber", "Stem", "StringNumber",
+        "StrokeFinger", "SustainPedal", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+        "TextSpanner", "TimeSignature", "TrillPitchAccidental",
+        "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletNumber",
+        "UnaCordaPedal", "VaticanaLigature", "VoltaBracket",
+    ],
+    "footnote-text": [
+        "FootnoteItem", "FootnoteSpanner",
+    ],
+    "force-hshift": [
+        "NoteColumn",
+    ],
+    "fraction": [
+        "TimeSignature",
+    ],
+    "french-beaming": [
+        "Stem",
+    ],
+    "fret-diagram-details": [
+        "FretBoard", "TextScript",
+    ],
+    "full-length-padding": [
+        "LigatureBracket", "TupletBracket",
+    ],
+    "full-length-to-extent": [
+        "LigatureBracket", "TupletBracket",
+    ],
+    "full-measure-extra-space": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "full-size-change": [
+        "Clef", "CueClef", "CueEndClef",
+    ],
+    "gap": [
+        "Ambitus", "AmbitusLine", "AmbitusNoteHead", "BarLine", "Beam",
+        "DynamicTextSpanner", "Episema", "Glissando", "LedgerLineSpanner",
+        "LigatureBracket", "SpanBar", "TextSpanner", "TrillSpanner",
+        "TupletBracket", "VoiceFollower",
+    ],
+    "gap-count": [
+        "Beam",
+    ],
+    "glyph": [
+        "BarLine", "Clef", "CueClef", "CueEndClef", "SpanBar",
+    ],
+    "glyph-name": [
+        "AmbitusNoteHead", "BarLine", "Clef", "CueClef", "CueEndClef",
+        "NoteHead", "SpanBar", "TabNoteHead", "TrillPitchGroup",
+        "VaticanaLigature",
+    ],
+    "glyph-name-alist": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "KeyCancellation", "KeySignature",
+        "TrillPitchAccidental",
+    ],
+    "graphical": [
+        "TextScript",
+    ],
+    "grow-direction": [
+        "Beam", "Hairpin",
+    ],
+    "hair-thickness": [
+        "BarLine", "MultiMeasureRest", "PercentRepeat", "SpanBar",
+    ],
+    "harp-pedal-details": [
+        "TextScript",
+    ],
+    "head-direction": [
+        "LaissezVibrerTie", "LaissezVibrerTieColumn", "RepeatTie",
+        "RepeatTieColumn", "Tie",
+    ],
+    "height": [
+        "Hairpin", "LyricHyphen", "LyricSpace", "MeasureGrouping",
+        "VoltaBracket",
+    ],
+    "height-limit": [
+        "PhrasingSlur", "Slur",
+    ],
+    "hide-tied-accidental-after-break": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "TrillPitchAccidental",
+    ],
+    "horizontal-shift": [
+        "NoteColumn",
+    ],
+    "horizontal-skylines": [
+        "NonMusicalPaperColumn", "NoteColumn", "PaperColumn",
+    ],
+    "ignore-collision": [
+        "NoteColumn",
+    ],
+    "implicit": [
+        "BassFigure",
+    ],
+    "inspect-index": [
+        "PhrasingSlur", "Slur",
+    ],
+    "inspect-quants": [
+        "Beam", "PhrasingSlur", "Slur",
+    ],
+    "keep-inside-line": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "kern": [
+        "BarLine", "SpanBar",
+    ],
+    "knee": [
+        "Beam",
+    ],
+    "knee-spacing-correction": [
+        "NoteSpacing",
+    ],
+    "labels": [
+        "NonMusicalPaperColumn", "PaperColumn", "System",
+    ],
+    "layer": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "ledger-line-thickness": [
+        "StaffSymbol",
+    ],
+    "left-bound-info": [
+        "DynamicTextSpanner", "Episema", "Glissando", "TextSpanner",
+        "TrillSpanner", "VoiceFollower",
+    ],
+    "left-padding": [
+        "LyricExtender",
+    ],
+    "length": [
+        "LyricHyphen", "LyricSpace", "Stem",
+    ],
+    "length-fraction": [
+        "Beam", "LedgerLineSpanner", "Stem", "StemTremolo",
+    ],
+    "line-break-penalty": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "line-break-permission": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "line-break-system-details": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "line-count": [
+        "StaffSymbol",
+    ],
+    "line-positions": [
+        "StaffSymbol",
+    ],
+    "line-thickness": [
+        "PhrasingSlur", "Slur", "Tie",
+    ],
+    "long-text": [
+        "InstrumentName",
+    ],
+    "max-beam-connect": [
+        "Stem",
+    ],
+    "max-stretch": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "measure-count": [
+        "MultiMeasureRest", "PercentRepeat",
+    ],
+    "measure-length": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "merge-differently-dotted": [
+        "NoteCollision",
+    ],
+    "merge-differently-headed": [
+        "NoteCollision",
+    ],
+    "minimum-X-extent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "minimum-Y-extent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "minimum-distance": [
+        "LyricHyphen", "LyricSpace", "MultiMeasureRest", "Rest",
+        "RestCollision",
+    ],
+    "minimum-length": [
+        "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "ClusterSpanner", "DynamicLineSpanner", "DynamicTextSpanner",
+        "Episema", "FootnoteSpanner", "Glissando", "GraceSpacing", "Hairpin",
+        "HorizontalBracket", "InstrumentName", "LedgerLineSpanner",
+        "LigatureBracket", "LyricExtender", "LyricHyphen", "LyricSpace",
+        "MeasureGrouping", "MensuralLigature", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OttavaBracket",
+        "PercentRepeat", "PercentRepeatCounter", "PhrasingSlur",
+        "PianoPedalBracket", "Slur", "SostenutoPedalLineSpanner",
+        "SpacingSpanner", "StaffGrouper", "StaffSymbol",
+        "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextSpanner", "Tie", "TieColumn", "TrillSpanner", "TupletBracket",
+        "TupletNumber", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "minimum-length-fraction": [
+        "LedgerLineSpanner",
+    ],
+    "minimum-space": [
+        "AccidentalSuggestion", "AmbitusAccidental", "Arpeggio", "BarNumber",
+        "BassFigureAlignmentPositioning", "CombineTextScript",
+        "DoublePercentRepeatCounter", "DynamicLineSpanner", "Episema",
+        "Fingering", "HorizontalBracket", "InstrumentName", "InstrumentSwitch",
+        "MeasureGrouping", "MetronomeMark", "MultiMeasureRestNumber",
+        "MultiMeasureRestText", "OctavateEight", "OttavaBracket",
+        "PercentRepeatCounter", "RehearsalMark", "Script",
+        "SostenutoPedalLineSpanner", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedalLineSpanner", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextScript", "TextSpanner", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillSpanner", "UnaCordaPedalLineSpanner", "VoltaBracket",
+        "VoltaBracketSpanner",
+    ],
+    "neutral-direction": [
+        "Beam", "Custos", "MelodyItem", "Stem", "Tie",
+    ],
+    "neutral-position": [
+        "Custos",
+    ],
+    "next": [
+        "LyricExtender",
+    ],
+    "no-alignment": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "no-ledgers": [
+        "AmbitusNoteHead", "NoteHead", "TrillPitchHead",
+    ],
+    "no-stem-extend": [
+        "Stem",
+    ],
+    "non-break-align-symbols": [
+        "BarNumber", "MetronomeMark", "RehearsalMark",
+    ],
+    "non-default": [
+        "Clef", "CueClef", "CueEndClef",
+    ],
+    "non-musical": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureBracket", "BreakAlignGroup",
+        "BreakAlignment", "BreathingSign", "ChordName", "Clef",
+        "ClusterSpannerBeacon", "CombineTextScript", "CueClef", "CueEndClef",
+        "Custos", "DotColumn", "Dots", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicText",
+        "Fingering", "FootnoteItem", "FretBoard", "GridLine", "GridPoint",
+        "InstrumentSwitch", "KeyCancellation", "KeySignature",
+        "LaissezVibrerTie", "LaissezVibrerTieColumn", "LeftEdge", "LyricText",
+        "MelodyItem", "MetronomeMark", "NonMusicalPaperColumn",
+        "NoteCollision", "NoteColumn", "NoteHead", "NoteName", "NoteSpacing",
+        "OctavateEight", "PaperColumn", "ParenthesesItem", "RehearsalMark",
+        "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest", "RestCollision",
+        "Script", "ScriptColumn", "ScriptRow", "SostenutoPedal", "SpanBar",
+        "StaffSpacing", "StanzaNumber", "Stem", "StemTremolo", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "UnaCordaPedal",
+    ],
+    "nonstaff-nonstaff-spacing": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "nonstaff-relatedstaff-spacing": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "nonstaff-unrelatedstaff-spacing": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "normalized-endpoints": [
+        "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "ClusterSpanner", "DynamicLineSpanner", "DynamicTextSpanner",
+        "Episema", "FootnoteSpanner", "Glissando", "GraceSpacing", "Hairpin",
+        "HorizontalBracket", "InstrumentName", "LedgerLineSpanner",
+        "LigatureBracket", "LyricExtender", "LyricHyphen", "LyricSpace",
+        "MeasureGrouping", "MensuralLigature", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OttavaBracket",
+        "PercentRepeat", "PercentRepeatCounter", "PhrasingSlur",
+        "PianoPedalBracket", "Slur", "SostenutoPedalLineSpanner",
+        "SpacingSpanner", "StaffGrouper", "StaffSymbol",
+        "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextSpanner", "Tie", "TieColumn", "TrillSpanner", "TupletBracket",
+        "TupletNumber", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "note-names": [
+        "AmbitusNoteHead", "NoteHead", "TabNoteHead", "TrillPitchGroup",
+    ],
+    "outside-staff-horizontal-padding": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "outside-staff-padding": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "outside-staff-priority": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "packed-spacing": [
+        "SpacingSpanner",
+    ],
+    "padding": [
+        "AccidentalPlacement", "AccidentalSuggestion", "AmbitusAccidental",
+        "Arpeggio", "BalloonTextItem", "BarNumber", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "ClusterSpanner", "CombineTextScript",
+        "DoublePercentRepeatCounter", "DynamicLineSpanner", "Episema",
+        "Fingering", "FootnoteItem", "FootnoteSpanner", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LigatureBracket", "LyricHyphen", "LyricSpace",
+        "MeasureGrouping", "MetronomeMark", "MultiMeasureRestNumber",
+        "MultiMeasureRestText", "NonMusicalPaperColumn", "NoteColumn",
+        "OctavateEight", "OttavaBracket", "PaperColumn", "ParenthesesItem",
+        "PercentRepeatCounter", "RehearsalMark", "Script",
+        "SostenutoPedalLineSpanner", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedalLineSpanner", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextScript", "TextSpanner", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillSpanner", "TupletBracket", "UnaCordaPedalLineSpanner",
+        "VerticalAlignment", "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "padding-pairs": [
+        "KeyCancellation", "KeySignature",
+    ],
+    "page-break-penalty": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "page-break-permission": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "page-turn-penalty": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "page-turn-permission": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "parenthesized": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "TrillPitchAccidental",
+    ],
+    "positioning-done": [
+        "AccidentalPlacement", "AccidentalSuggestion", "BassFigureAlignment",
+        "BreakAlignment", "DotColumn", "DynamicText", "LaissezVibrerTieColumn",
+        "NoteCollision", "RepeatTieColumn", "RestCollision", "Script", "Stem",
+        "TieColumn", "VerticalAlignment",
+    ],
+    "positions": [
+        "Arpeggio", "Beam", "ClusterSpannerBeacon", "LigatureBracket",
+        "PhrasingSlur", "Slur", "TupletBracket",
+    ],
+    "prefer-dotted-right": [
+        "NoteCollision",
+    ],
+    "ratio": [
+        "PhrasingSlur", "Slur",
+    ],
+    "remove-empty": [
+        "VerticalAxisGroup",
+    ],
+    "remove-first": [
+        "VerticalAxisGroup",
+    ],
+    "restore-first": [
+        "Accidental", "AccidentalCautionary", "AccidentalSuggestion",
+        "AmbitusAccidental", "TrillPitchAccidental",
+    ],
+    "rhythmic-location": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "right-bound-info": [
+        "DynamicTextSpanner", "Episema", "Glissando", "TextSpanner",
+        "TrillSpanner", "VoiceFollower",
+    ],
+    "right-padding": [
+        "AccidentalPlacement", "DynamicText", "LyricExtender",
+    ],
+    "rotation": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "same-direction-correction": [
+        "NoteSpacing",
+    ],
+    "script-priority": [
+        "AccidentalPlacement", "AccidentalSuggestion", "Arpeggio",
+        "CombineTextScript", "DynamicText", "Fingering", "Script",
+        "StringNumber", "StrokeFinger", "TextScript",
+    ],
+    "self-alignment-X": [
+        "AccidentalSuggestion", "BarNumber", "DoublePercentRepeatCounter",
+        "DynamicText", "Fingering", "GridLine", "Hairpin", "InstrumentName",
+        "InstrumentSwitch", "LyricText", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OctavateEight",
+        "PercentRepeatCounter", "RehearsalMark", "SostenutoPedal",
+        "StringNumber", "StrokeFinger", "SustainPedal", "TextScript",
+        "UnaCordaPedal",
+    ],
+    "self-alignment-Y": [
+        "AccidentalSuggestion", "BarNumber", "DoublePercentRepeatCounter",
+        "DynamicText", "Fingering", "GridLine", "Hairpin", "InstrumentName",
+        "InstrumentSwitch", "LyricText", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OctavateEight",
+        "PercentRepeatCounter", "RehearsalMark", "SostenutoPedal",
+        "StringNumber", "StrokeFinger", "SustainPedal", "TextScript",
+        "UnaCordaPedal",
+    ],
+    "shorten-pair": [
+        "BassFigureBracket", "HorizontalBracket", "LigatureBracket",
+        "OttavaBracket", "PianoPedalBracket", "TupletBracket", "VoltaBracket",
+    ],
+    "shortest-duration-space": [
+        "GraceSpacing", "SpacingSpanner",
+    ],
+    "shortest-playing-duration": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "shortest-starter-duration": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "side-axis": [
+        "AccidentalSuggestion", "AmbitusAccidental", "Arpeggio", "BarNumber",
+        "BassFigureAlignmentPositioning", "CombineTextScript",
+        "DoublePercentRepeatCounter", "DynamicLineSpanner", "Episema",
+        "Fingering", "HorizontalBracket", "InstrumentName", "InstrumentSwitch",
+        "MeasureGrouping", "MetronomeMark", "MultiMeasureRestNumber",
+        "MultiMeasureRestText", "OctavateEight", "OttavaBracket",
+        "PercentRepeatCounter", "RehearsalMark", "Script",
+        "SostenutoPedalLineSpanner", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedalLineSpanner", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextScript", "TextSpanner", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillSpanner", "UnaCordaPedalLineSpanner", "VoltaBracket",
+        "VoltaBracketSpanner",
+    ],
+    "side-relative-direction": [
+        "AccidentalSuggestion", "DynamicText", "Script",
+    ],
+    "size": [
+        "FretBoard", "TextScript",
+    ],
+    "skyline-horizontal-padding": [
+        "System",
+    ],
+    "skyline-vertical-padding": [
+        "NonMusicalPaperColumn", "NoteColumn", "PaperColumn",
+    ],
+    "slash-negative-kern": [
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "PercentRepeat", "PercentRepeatCounter",
+        "RepeatSlash",
+    ],
+    "slope": [
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "PercentRepeat", "PercentRepeatCounter",
+        "RepeatSlash", "StemTremolo",
+    ],
+    "slur-padding": [
+        "AccidentalSuggestion", "AmbitusAccidental", "Arpeggio", "BarNumber",
+        "BassFigureAlignmentPositioning", "CombineTextScript",
+        "DoublePercentRepeatCounter", "DynamicLineSpanner", "DynamicText",
+        "Episema", "Fingering", "HorizontalBracket", "InstrumentName",
+        "InstrumentSwitch", "MeasureGrouping", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OctavateEight",
+        "OttavaBracket", "PercentRepeatCounter", "RehearsalMark", "Script",
+        "SostenutoPedalLineSpanner", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedalLineSpanner", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextScript", "TextSpanner", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillSpanner", "UnaCordaPedalLineSpanner", "VoltaBracket",
+        "VoltaBracketSpanner",
+    ],
+    "space-alist": [
+        "Ambitus", "AmbitusAccidental", "BarLine", "BreakAlignGroup",
+        "BreathingSign", "Clef", "CueClef", "CueEndClef", "Custos",
+        "DoublePercentRepeat", "KeyCancellation", "KeySignature", "LeftEdge",
+        "TimeSignature",
+    ],
+    "space-to-barline": [
+        "NoteSpacing",
+    ],
+    "spacing-increment": [
+        "GraceSpacing", "SpacingSpanner",
+    ],
+    "spacing-pair": [
+        "MultiMeasureRest", "PercentRepeat",
+    ],
+    "springs-and-rods": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "stacking-dir": [
+        "BassFigureAlignment", "VerticalAlignment",
+    ],
+    "staff-affinity": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "staff-padding": [
+        "AccidentalSuggestion", "AmbitusAccidental", "Arpeggio", "BarNumber",
+        "BassFigureAlignmentPositioning", "CombineTextScript",
+        "DoublePercentRepeatCounter", "DynamicLineSpanner", "Episema",
+        "Fingering", "HorizontalBracket", "InstrumentName", "InstrumentSwitch",
+        "LigatureBracket", "MeasureGrouping", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OctavateEight",
+        "OttavaBracket", "PercentRepeatCounter", "RehearsalMark", "Script",
+        "SostenutoPedalLineSpanner", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedalLineSpanner", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextScript", "TextSpanner", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillSpanner", "TupletBracket", "UnaCordaPedalLineSpanner",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "staff-position": [
+        "AmbitusNoteHead", "Arpeggio", "Beam", "Clef", "CueClef", "CueEndClef",
+        "Custos", "Dots", "KeyCancellation", "KeySignature",
+        "MultiMeasureRest", "NoteHead", "Rest", "TabNoteHead", "Tie",
+        "TrillPitchHead",
+    ],
+    "staff-space": [
+        "StaffSymbol",
+    ],
+    "staff-staff-spacing": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "StaffGrouper", "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "staffgroup-staff-spacing": [
+        "StaffGrouper",
+    ],
+    "stem-attachment": [
+        "AmbitusNoteHead", "NoteHead", "TabNoteHead", "TrillPitchGroup",
+    ],
+    "stem-end-position": [
+        "Stem",
+    ],
+    "stem-spacing-correction": [
+        "NoteSpacing", "StaffSpacing",
+    ],
+    "stemlet-length": [
+        "Stem",
+    ],
+    "stencil": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "stencils": [
+        "ParenthesesItem", "TrillPitchGroup",
+    ],
+    "strict-grace-spacing": [
+        "SpacingSpanner",
+    ],
+    "strict-note-spacing": [
+        "SpacingSpanner",
+    ],
+    "stroke-style": [
+        "Stem",
+    ],
+    "style": [
+        "AmbitusNoteHead", "ClusterSpanner", "Custos", "Dots",
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "MeasureGrouping",
+        "MultiMeasureRest", "NoteHead", "OttavaBracket", "PianoPedalBracket",
+        "Rest", "StemTremolo", "SystemStartBar", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TabNoteHead",
+        "TextSpanner", "TimeSignature", "TrillPitchGroup", "TrillSpanner",
+        "TupletBracket", "VoiceFollower", "VoltaBracket",
+    ],
+    "text": [
+        "BalloonTextItem", "BarNumber", "BassFigure", "BreathingSign",
+        "ChordName", "CombineTextScript", "DoublePercentRepeatCounter",
+        "DynamicText", "DynamicTextSpanner", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "InstrumentName", "InstrumentSwitch", "LyricText",
+        "MetronomeMark", "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NoteName", "OctavateEight", "OttavaBracket", "PercentRepeatCounter",
+        "RehearsalMark", "SostenutoPedal", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TupletNumber", "UnaCordaPedal", "VoltaBracket",
+    ],
+    "text-direction": [
+        "BalloonTextItem", "BarNumber", "BassFigure", "BreathingSign",
+        "ChordName", "CombineTextScript", "DoublePercentRepeatCounter",
+        "DynamicText", "DynamicTextSpanner", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "InstrumentSwitch", "LyricText", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "NoteName",
+        "OctavateEight", "OttavaBracket", "PercentRepeatCounter",
+        "RehearsalMark", "SostenutoPedal", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TupletNumber", "UnaCordaPedal", "VoltaBracket",
+    ],
+    "thick-thickness": [
+        "BarLine", "MultiMeasureRest", "PercentRepeat", "SpanBar",
+    ],
+    "thickness": [
+        "Ambitus", "AmbitusLine", "AmbitusNoteHead", "BassFigureBracket",
+        "BassFigureContinuation", "BendAfter", "DoublePercentRepeat",
+        "DoublePercentRepeatCounter", "DoubleRepeatSlash",
+        "DynamicTextSpanner", "Episema", "FretBoard", "Glissando", "GridLine",
+        "Hairpin", "HorizontalBracket", "LaissezVibrerTie",
+        "LedgerLineSpanner", "LigatureBracket", "LyricExtender", "LyricHyphen",
+        "LyricSpace", "MeasureGrouping", "MensuralLigature", "NoteHead",
+        "OttavaBracket", "PercentRepeat", "PercentRepeatCounter",
+        "PhrasingSlur", "PianoPedalBracket", "RepeatSlash", "RepeatTie",
+        "Slur", "StaffSymbol", "Stem", "SystemStartBar", "SystemStartBrace",
+        "SystemStartBracket", "SystemStartSquare", "TextScript", "TextSpanner",
+        "Tie", "TrillSpanner", "TupletBracket", "VaticanaLigature",
+        "VoiceFollower", "VoltaBracket",
+    ],
+    "thin-kern": [
+        "BarLine", "SpanBar",
+    ],
+    "tie-configuration": [
+        "LaissezVibrerTieColumn", "RepeatTieColumn", "TieColumn",
+    ],
+    "to-barline": [
+        "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "ClusterSpanner", "DynamicLineSpanner", "DynamicTextSpanner",
+        "Episema", "FootnoteSpanner", "Glissando", "GraceSpacing", "Hairpin",
+        "HorizontalBracket", "InstrumentName", "LedgerLineSpanner",
+        "LigatureBracket", "LyricExtender", "LyricHyphen", "LyricSpace",
+        "MeasureGrouping", "MensuralLigature", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "OttavaBracket",
+        "PercentRepeat", "PercentRepeatCounter", "PhrasingSlur",
+        "PianoPedalBracket", "Slur", "SostenutoPedalLineSpanner",
+        "SpacingSpanner", "StaffGrouper", "StaffSymbol",
+        "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TextSpanner", "Tie", "TieColumn", "TrillSpanner", "TupletBracket",
+        "TupletNumber", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "toward-stem-shift": [
+        "AccidentalSuggestion", "DynamicText", "Script",
+    ],
+    "transparent": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "uniform-stretching": [
+        "SpacingSpanner",
+    ],
+    "used": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "vertical-skylines": [
+        "Ambitus", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+        "BassFigureLine", "BreakAlignGroup", "BreakAlignment", "DotColumn",
+        "DynamicLineSpanner", "NonMusicalPaperColumn", "NoteCollision",
+        "NoteColumn", "PaperColumn", "SostenutoPedalLineSpanner",
+        "SustainPedalLineSpanner", "System", "TrillPitchGroup",
+        "UnaCordaPedalLineSpanner", "VerticalAlignment", "VerticalAxisGroup",
+        "VoltaBracketSpanner",
+    ],
+    "when": [
+        "NonMusicalPaperColumn", "PaperColumn",
+    ],
+    "whiteout": [
+        "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+        "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+        "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine",
+        "BarNumber", "BassFigure", "BassFigureAlignment",
+        "BassFigureAlignmentPositioning", "BassFigureBracket",
+        "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter",
+        "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName",
+        "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript",
+        "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots",
+        "DoublePercentRepeat", "DoublePercentRepeatCounter",
+        "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+        "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing",
+        "GridLine", "GridPoint", "Hairpin", "HorizontalBracket",
+        "InstrumentName", "InstrumentSwitch", "KeyCancellation",
+        "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn",
+        "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender",
+        "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping",
+        "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest",
+        "MultiMeasureRestNumber", "MultiMeasureRestText",
+        "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead",
+        "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket",
+        "PaperColumn", "ParenthesesItem", "PercentRepeat",
+        "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+        "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+        "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+        "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner",
+        "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol",
+        "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger",
+        "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar",
+        "SystemStartBrace", "SystemStartBracket", "SystemStartSquare",
+        "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn",
+        "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup",
+        "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber",
+        "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature",
+        "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower",
+        "VoltaBracket", "VoltaBracketSpanner",
+    ],
+    "width": [
+        "StaffSymbol",
+    ],
+    "word-space": [
+        "BalloonTextItem", "BarNumber", "BassFigure", "BreathingSign",
+        "ChordName", "CombineTextScript", "DoublePercentRepeatCounter",
+        "DynamicText", "DynamicTextSpanner", "Fingering", "FootnoteItem",
+        "FootnoteSpanner", "InstrumentSwitch", "LyricText", "MetronomeMark",
+        "MultiMeasureRestNumber", "MultiMeasureRestText", "NoteName",
+        "OctavateEight", "OttavaBracket", "PercentRepeatCounter",
+        "RehearsalMark", "SostenutoPedal", "StanzaNumber", "StringNumber",
+        "StrokeFinger", "SustainPedal", "TabNoteHead", "TextScript",
+        "TupletNumber", "UnaCordaPedal", "VoltaBracket",
+    ],
+    "zigzag-length": [
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "OttavaBracket",
+        "PianoPedalBracket", "TextSpanner", "TrillSpanner", "TupletBracket",
+        "VoiceFollower", "VoltaBracket",
+    ],
+    "zigzag-width": [
+        "DynamicTextSpanner", "Episema", "Glissando", "Hairpin",
+        "HorizontalBracket", "LigatureBracket", "OttavaBracket",
+        "PianoPedalBracket", "TextSpanner", "TrillSpanner", "TupletBracket",
+        "VoiceFollower", "VoltaBracket",
+    ],
+}
+
+
+grobs = [
+    "Accidental", "AccidentalCautionary", "AccidentalPlacement",
+    "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine",
+    "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine", "BarNumber",
+    "BassFigure", "BassFigureAlignment", "BassFigureAlignmentPositioning",
+    "BassFigureBracket", "BassFigureContinuation", "BassFigureLine", "Beam",
+    "BendAfter", "BreakAlignGroup", "BreakAlignment", "BreathingSign",
+    "ChordName", "Clef", "ClusterSpanner", "ClusterSpannerBeacon",
+    "CombineTextScript", "CueClef", "CueEndClef", "Custos", "DotColumn",
+    "Dots", "DoublePercentRepeat", "DoublePercentRepeatCounter",
+    "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText",
+    "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem",
+    "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing", "GridLine",
+    "GridPoint", "Hairpin", "HorizontalBracket", "InstrumentName",
+    "InstrumentSwitch", "KeyCancellation", "KeySignature", "LaissezVibrerTie",
+    "LaissezVibrerTieColumn", "LedgerLineSpanner", "LeftEdge",
+    "LigatureBracket", "LyricExtender", "LyricHyphen", "LyricSpace",
+    "LyricText", "MeasureGrouping", "MelodyItem", "MensuralLigature",
+    "MetronomeMark", "MultiMeasureRest", "MultiMeasureRestNumber",
+    "MultiMeasureRestText", "NonMusicalPaperColumn", "NoteCollision",
+    "NoteColumn", "NoteHead", "NoteName", "NoteSpacing", "OctavateEight",
+    "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat",
+    "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket",
+    "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest",
+    "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur",
+    "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner", "SpanBar",
+    "StaffGrouper", "StaffSpacing", "StaffSymbol", "StanzaNumber", "Stem",
+    "StemTremolo", "StringNumber", "StrokeFinger", "SustainPedal",
+    "SustainPedalLineSpanner", "System", "SystemStartBar", "SystemStartBrace",
+    "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript",
+    "TextSpanner", "Tie", "TieColumn", "TimeSignature", "TrillPitchAccidental",
+    "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletBracket",
+    "TupletNumber", "UnaCordaPedal", "UnaCordaPedalLineSpanner",
+    "VaticanaLigature", "VerticalAlignment", "VerticalAxisGroup",
+    "VoiceFollower", "VoltaBracket", "VoltaBracketSpanner",
+]
+
+
+all_grob_properties = [
+    "X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support",
+    "after-line-breaking", "align-dir", "allow-loose-spacing",
+    "allow-span-bar", "alteration", "alteration-alist", "annotation",
+    "annotation-balloon", "annotation-line", "arpeggio-direction",
+    "arrow-length", "arrow-width", "auto-knee-gap", "average-spacing-wishes",
+    "avoid-note-head", "avoid-slur", "axes", "base-shortest-duration",
+    "baseline-skip", "beam-thickness", "beam-width", "beamed-stem-shorten",
+    "beaming", "beamlet-default-length", "beamlet-max-length-proportion",
+    "before-line-breaking", "between-cols", "bound-details", "bound-padding",
+    "bracket-flare", "bracket-visibility", "break-align-anchor",
+    "break-align-anchor-alignment", "break-align-orders", "break-align-symbol",
+    "break-align-symbols", "break-overshoot", "break-visibility", "breakable",
+    "c0-position", "circled-tip", "clip-edges", "collapse-height",
+    "collision-interfaces", "collision-voice-only", "color",
+    "common-shortest-duration", "concaveness", "connect-to-neighbor",
+    "control-points", "cross-staff", "damping", "dash-definition",
+    "dash-fraction", "dash-period", "default-direction",
+    "default-staff-staff-spacing", "details", "digit-names", "direction",
+    "dot-count", "dot-negative-kern", "dot-placement-list", "duration-log",
+    "eccentricity", "edge-height", "edge-text", "expand-limit",
+    "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset",
+    "extra-spacing-height", "extra-spacing-width", "flag", "flag-count",
+    "flag-style", "font-encoding", "font-family", "font-name", "font-series",
+    "font-shape", "font-size", "footnote-text", "force-hshift", "fraction",
+    "french-beaming", "fret-diagram-details", "full-length-padding",
+    "full-length-to-extent", "full-measure-extra-space", "full-size-change",
+    "gap", "gap-count", "glyph", "glyph-name", "glyph-name-alist", "graphical",
+    "grow-direction", "hair-thickness", "harp-pedal-details", "head-direction",
+    "height", "height-limit", "hide-tied-accidental-after-break",
+    "horizontal-shift", "horizontal-skylines", "ignore-collision", "implicit",
+    "inspect-index", "inspect-quants", "keep-inside-line", "kern", "knee",
+    "knee-spacing-correction", "labels", "layer", "ledger-line-thickness",
+    "left-bound-info", "left-padding", "length", "length-fraction",
+    "line-break-penalty", "line-break-permission", "line-break-system-details",
+    "line-count", "line-positions", "line-thickness", "long-text",
+    "max-beam-connect", "max-stretch", "measure-count", "measure-length",
+    "merge-differently-dotted", "merge-differently-headed", "minimum-X-extent",
+    "minimum-Y-extent", "minimum-distance", "minimum-length",
+    "minimum-length-fraction", "minimum-space", "neutral-direction",
+    "neutral-position", "next", "no-alignment", "no-ledgers", "no-stem-extend",
+    "non-break-align-symbols", "non-default", "non-musical",
+    "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing",
+    "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "note-names",
+    "outside-staff-horizontal-padding", "outside-staff-padding",
+    "outside-staff-priority", "packed-spacing", "padding", "padding-pairs",
+    "page-break-penalty", "page-break-permission", "page-turn-penalty",
+    "page-turn-permission", "parenthesized", "positioning-done", "positions",
+    "prefer-dotted-right", "ratio", "remove-empty", "remove-first",
+    "restore-first", "rhythmic-location", "right-bound-info", "right-padding",
+    "rotation", "same-direction-correction", "script-priority",
+    "self-alignment-X", "self-alignment-Y", "shorten-pair",
+    "shortest-duration-space", "shortest-playing-duration",
+    "shortest-starter-duration", "side-axis", "side-relative-direction",
+    "size", "skyline-horizontal-padding", "skyline-vertical-padding",
+    "slash-negative-kern", "slope", "slur-padding", "space-alist",
+    "space-to-barline", "spacing-increment", "spacing-pair",
+    "springs-and-rods", "stacking-dir", "staff-affinity", "staff-padding",
+    "staff-position", "staff-space", "staff-staff-spacing",
+    "staffgroup-staff-spacing", "stem-attachment", "stem-end-position",
+    "stem-spacing-correction", "stemlet-length", "stencil", "stencils",
+    "strict-grace-spacing", "strict-note-spacing", "stroke-style", "style",
+    "text", "text-direction", "thick-thickness", "thickness", "thin-kern",
+    "tie-configuration", "to-barline", "toward-stem-shift", "transparent",
+    "uniform-stretching", "used", "vertical-skylines", "when", "whiteout",
+    "width", "word-space", "zigzag-length", "zigzag-width",
+]
+
+
+context_properties = [
+    "aDueText", "alignAboveContext", "alignBassFigureAccidentals",
+    "alignBelowContext", "associatedVoice", "autoAccidentals", "autoBeamCheck",
+    "autoBeaming", "autoCautionaries", "automaticBars", "barAlways",
+    "barCheckSynchronize", "barNumberVisibility", "baseMoment",
+    "bassFigureFormatFunction", "bassStaffProperties", "beamExceptions",
+    "beatStructure", "chordChanges", "chordNameExceptions",
+    "chordNameExceptionsFull", "chordNameExceptionsPartial",
+    "chordNameFunction", "chordNameLowercaseMinor", "chordNameSeparator",
+    "chordNoteNamer", "chordPrefixSpacer", "chordRootNamer", "clefGlyph",
+    "clefOctavation", "clefPosition", "completionBusy", "connectArpeggios",
+    "countPercentRepeats", "createKeyOnClefChange", "createSpacing",
+    "crescendoSpanner", "crescendoText", "cueClefGlyph", "cueClefOctavation",
+    "cueClefPosition", "currentBarNumber", "decrescendoSpanner",
+    "decrescendoText", "defaultBarType", "defaultStrings", "doubleRepeatType",
+    "doubleSlurs", "drumPitchTable", "drumStyleTable",
+    "explicitClefVisibility", "explicitCueClefVisibility",
+    "explicitKeySignatureVisibility", "extendersOverRests", "extraNatural",
+    "figuredBassAlterationDirection", "figuredBassCenterContinuations",
+    "figuredBassFormatter", "figuredBassPlusDirection",
+    "fingeringOrientations", "firstClef", "followVoice", "fontSize",
+    "forbidBreak", "forceClef", "fretLabels", "glissandoMap", "gridInterval",
+    "handleNegativeFrets", "harmonicAccidentals", "harmonicDots",
+    "highStringOne", "ignoreBarChecks", "ignoreFiguredBassRest",
+    "ignoreMelismata", "implicitBassFigures",
+    "implicitTimeSignatureVisibility", "includeGraceNotes",
+    "instrumentCueName", "instrumentEqualizer", "instrumentName",
+    "instrumentTransposition", "internalBarNumber", "keepAliveInterfaces",
+    "keyAlterationOrder", "keySignature", "lyricMelismaAlignment",
+    "majorSevenSymbol", "markFormatter", "maximumFretStretch", "measureLength",
+    "measurePosition", "melismaBusyProperties", "metronomeMarkFormatter",
+    "middleCClefPosition", "middleCCuePosition", "middleCOffset",
+    "middleCPosition", "midiChannelMapping", "midiInstrument",
+    "midiMaximumVolume", "midiMinimumVolume", "minimumFret",
+    "minimumPageTurnLength", "minimumRepeatLengthForPageTurn", "noChordSymbol",
+    "noteToFretFunction", "ottavation", "output", "partCombineTextsOnNote",
+    "pedalSostenutoStrings", "pedalSostenutoStyle", "pedalSustainStrings",
+    "pedalSustainStyle", "pedalUnaCordaStrings", "pedalUnaCordaStyle",
+    "predefinedDiagramTable", "printKeyCancellation", "printOctaveNames",
+    "printPartCombineTexts", "proportionalNotationDuration", "rehearsalMark",
+    "repeatCommands", "repeatCountVisibility", "restCompletionBusy",
+    "restNumberThreshold", "searchForVoice", "shapeNoteStyles",
+    "shortInstrumentName", "shortVocalName", "skipBars", "skipTypesetting",
+    "soloIIText", "soloText", "squashedPosition", "staffLineLayoutFunction",
+    "stanza", "stemLeftBeamCount", "stemRightBeamCount",
+    "stringNumberOrientations", "stringOneTopmost", "stringTunings",
+    "strokeFingerOrientations", "subdivideBeams", "suggestAccidentals",
+    "systemStartDelimiter", "systemStartDelimiterHierarchy",
+    "tabStaffLineLayoutFunction", "tablatureFormat", "tempoHideNote",
+    "tempoWholesPerMinute", "tieWaitForNote", "timeSignatureFraction",
+    "timeSignatureSettings", "timing", "tonic", "topLevelAlignment",
+    "trebleStaffProperties", "tremoloFlags", "tupletFullLength",
+    "tupletFullLengthNote", "tupletSpannerDuration", "useBassFigureExtenders",
+    "vocalName", "voltaSpannerDuration", "whichBar",
+]
+
+
+engravers = [
+    "Accidental_engraver", "Ambitus_engraver", "Arpeggio_engraver",
+    "Auto_beam_engraver", "Axis_group_engraver", "Balloon_engraver",
+    "Bar_engraver", "Bar_number_engraver", "Beam_collision_engraver",
+    "Beam_engraver", "Beam_performer", "Bend_engraver", "Break_align_engraver",
+    "Breathing_sign_engraver", "Chord_name_engraver", "Chord_tremolo_engraver",
+    "Clef_engraver", "Cluster_spanner_engraver", "Collision_engraver",
+    "Completion_heads_engraver", "Completion_rest_engraver",
+    "Control_track_performer", "Cue_clef_engraver", "Custos_engraver",
+    "Default_bar_line_engraver", "Dot_column_engraver", "Dots_engraver",
+    "Double_percent_repeat_engraver", "Drum_note_performer",
+    "Drum_notes_engraver", "Dynamic_align_engraver", "Dynamic_engraver",
+    "Dynamic_performer", "Engraver", "Episema_engraver", "Extender_engraver",
+    "Figured_bass_engraver", "Figured_bass_position_engraver",
+    "Fingering_engraver", "Font_size_engraver", "Footnote_engraver",
+    "Forbid_line_break_engraver", "Fretboard_engraver", "Glissando_engraver",
+    "Grace_beam_engraver", "Grace_engraver", "Grace_spacing_engraver",
+    "Grid_line_span_engraver", "Grid_point_engraver", "Grob_pq_engraver",
+    "Hara_kiri_engraver", "Horizontal_bracket_engraver", "Hyphen_engraver",
+    "Instrument_name_engraver", "Instrument_switch_engraver",
+    "Keep_alive_together_engraver", "Key_engraver", "Key_performer",
+    "Laissez_vibrer_engraver", "Ledger_line_engraver",
+    "Ligature_bracket_engraver", "Lyric_engraver", "Lyric_performer",
+    "Mark_engraver", "Measure_grouping_engraver", "Melody_engraver",
+    "Mensural_ligature_engraver", "Metronome_mark_engraver",
+    "Multi_measure_rest_engraver", "New_dynamic_engraver",
+    "New_fingering_engraver", "Note_head_line_engraver", "Note_heads_engraver",
+    "Note_name_engraver", "Note_performer", "Note_spacing_engraver",
+    "Ottava_spanner_engraver", "Output_property_engraver",
+    "Page_turn_engraver", "Paper_column_engraver", "Parenthesis_engraver",
+    "Part_combine_engraver", "Percent_repeat_engraver",
+    "Phrasing_slur_engraver", "Piano_pedal_align_engraver",
+    "Piano_pedal_engraver", "Piano_pedal_performer", "Pitch_squash_engraver",
+    "Pitched_trill_engraver", "Repeat_acknowledge_engraver",
+    "Repeat_tie_engraver", "Rest_collision_engraver", "Rest_engraver",
+    "Rhythmic_column_engraver", "Scheme_engraver", "Script_column_engraver",
+    "Script_engraver", "Script_row_engraver", "Separating_line_group_engraver",
+    "Slash_repeat_engraver", "Slur_engraver", "Slur_performer",
+    "Spacing_engraver", "Span_arpeggio_engraver", "Span_bar_engraver",
+    "Spanner_break_forbid_engraver", "Staff_collecting_engraver",
+    "Staff_performer", "Staff_symbol_engraver", "Stanza_number_align_engraver",
+    "Stanza_number_engraver", "Stem_engraver",
+    "System_start_delimiter_engraver", "Tab_note_heads_engraver",
+    "Tab_staff_symbol_engraver", "Tab_tie_follow_engraver", "Tempo_performer",
+    "Text_engraver", "Text_spanner_engraver", "Tie_engraver", "Tie_performer",
+    "Time_signature_engraver", "Time_signature_performer", "Timing_translator",
+    "Translator", "Trill_spanner_engraver", "Tuplet_engraver",
+    "Tweak_engraver", "Vaticana_ligature_engraver", "Vertical_align_engraver",
+    "Volta_engraver",
+]
+
+
+music_glyphs = [
+    "accidentals.doublesharp", "accidentals.flat",
+    "accidentals.flat.arrowboth", "accidentals.flat.arrowdown",
+    "accidentals.flat.arrowup", "accidentals.flat.slash",
+    "accidentals.flat.slashslash", "accidentals.flatflat",
+    "accidentals.flatflat.slash", "accidentals.hufnagelM1",
+    "accidentals.leftparen", "accidentals.medicaeaM1", "accidentals.mensural1",
+    "accidentals.mensuralM1", "accidentals.mirroredflat",
+    "accidentals.mirroredflat.backslash", "accidentals.mirroredflat.flat",
+    "accidentals.natural", "accidentals.natural.arrowboth",
+    "accidentals.natural.arrowdown", "accidentals.natural.arrowup",
+    "accidentals.rightparen", "accidentals.sharp",
+    "accidentals.sharp.arrowboth", "accidentals.sharp.arrowdown",
+    "accidentals.sharp.arrowup", "accidentals.sharp.slashslash.stem",
+    "accidentals.sharp.slashslash.stemstemstem",
+    "accidentals.sharp.slashslashslash.stem",
+    "accidentals.sharp.slashslashslash.stemstem", "accidentals.vaticana0",
+    "accidentals.vaticanaM1", "accordion.bayanbass", "accordion.discant",
+    "accordion.dot", "accordion.freebass", "accordion.oldEE", "accordion.pull",
+    "accordion.push", "accordion.stdbass", "arrowheads.close.01",
+    "arrowheads.close.0M1", "arrowheads.close.11", "arrowheads.close.1M1",
+    "arrowheads.open.01", "arrowheads.open.0M1", "arrowheads.open.11",
+    "arrowheads.open.1M1", "brackettips.down", "brackettips.up", "clefs.C",
+    "clefs.C_change", "clefs.F", "clefs.F_change", "clefs.G", "clefs.G_change",
+    "clefs.hufnagel.do", "clefs.hufnagel.do.fa", "clefs.hufnagel.do.fa_change",
+    "clefs.hufnagel.do_change", "clefs.hufnagel.fa",
+    "clefs.hufnagel.fa_change", "clefs.medicaea.do",
+    "clefs.medicaea.do_change", "clefs.medicaea.fa",
+    "clefs.medicaea.fa_change", "clefs.mensural.c", "clefs.mensural.c_change",
+    "clefs.mensural.f", "clefs.mensural.f_change", "clefs.mensural.g",
+    "clefs.mensural.g_change", "clefs.neomensural.c",
+    "clefs.neomensural.c_change", "clefs.percussion",
+    "clefs.percussion_change", "clefs.petrucci.c1", "clefs.petrucci.c1_change",
+    "clefs.petrucci.c2", "clefs.petrucci.c2_change", "clefs.petrucci.c3",
+    "clefs.petrucci.c3_change", "clefs.petrucci.c4",
+    "clefs.petrucci.c4_change", "clefs.petrucci.c5",
+    "clefs.petrucci.c5_change", "clefs.petrucci.f", "clefs.petrucci.f_change",
+    "clefs.petrucci.g", "clefs.petrucci.g_change", "clefs.tab",
+    "clefs.tab_change", "clefs.vaticana.do", "clefs.vaticana.do_change",
+    "clefs.vaticana.fa", "clefs.vaticana.fa_change", "comma",
+    "custodes.hufnagel.d0", "custodes.hufnagel.d1", "custodes.hufnagel.d2",
+    "custodes.hufnagel.u0", "custodes.hufnagel.u1", "custodes.hufnagel.u2",
+    "custodes.medicaea.d0", "custodes.medicaea.d1", "custodes.medicaea.d2",
+    "custodes.medicaea.u0", "custodes.medicaea.u1", "custodes.medicaea.u2",
+    "custodes.mensural.d0", "custodes.mensural.d1", "custodes.mensural.d2",
+    "custodes.mensural.u0", "custodes.mensural.u1", "custodes.mensural.u2",
+    "custodes.vaticana.d0", "custodes.vaticana.d1", "custodes.vaticana.d2",
+    "custodes.vaticana.u0", "custodes.vaticana.u1", "custodes.vaticana.u2",
+    "dots.dot", "dots.dotvaticana", "eight", "f", "five", "flags.d3",
+    "flags.d4", "flags.d5", "flags.d6", "flags.d7", "flags.dgrace",
+    "flags.mensurald03", "flags.mensurald04", "flags.mensurald05",
+    "flags.mensurald06", "flags.mensurald13", "flags.mensurald14",
+    "flags.mensurald15", "flags.mensurald16", "flags.mensurald23",
+    "flags.mensurald24", "flags.mensurald25", "flags.mensurald26",
+    "flags.mensuralu03", "flags.mensuralu04", "flags.mensuralu05",
+    "flags.mensuralu06", "flags.mensuralu13", "flags.mensuralu14",
+    "flags.mensuralu15", "flags.mensuralu16", "flags.mensuralu23",
+    "flags.mensuralu24", "flags.mensuralu25", "flags.mensuralu26", "flags.u3",
+    "flags.u4", "flags.u5", "flags.u6", "flags.u7", "flags.ugrace", "four",
+    "hyphen", "m", "nine", "noteheads.d0doFunk", "noteheads.d0fa",
+    "noteheads.d0faFunk", "noteheads.d0faThin", "noteheads.d0miFunk",
+    "noteheads.d0reFunk", "noteheads.d0tiFunk", "noteheads.d1do",
+    "noteheads.d1doFunk", "noteheads.d1doThin", "noteheads.d1doWalker",
+    "noteheads.d1fa", "noteheads.d1faFunk", "noteheads.d1faThin",
+    "noteheads.d1faWalker", "noteheads.d1miFunk", "noteheads.d1re",
+    "noteheads.d1reFunk", "noteheads.d1reThin", "noteheads.d1reWalker",
+    "noteheads.d1ti", "noteheads.d1tiFunk", "noteheads.d1tiThin",
+    "noteheads.d1tiWalker", "noteheads.d1triangle", "noteheads.d2do",
+    "noteheads.d2doFunk", "noteheads.d2doThin", "noteheads.d2doWalker",
+    "noteheads.d2fa", "noteheads.d2faFunk", "noteheads.d2faThin",
+    "noteheads.d2faWalker", "noteheads.d2re", "noteheads.d2reFunk",
+    "noteheads.d2reThin", "noteheads.d2reWalker", "noteheads.d2ti",
+    "noteheads.d2tiFunk", "noteheads.d2tiThin", "noteheads.d2tiWalker",
+    "noteheads.d2triangle", "noteheads.dM2", "noteheads.s0",
+    "noteheads.s0blackmensural", "noteheads.s0blackpetrucci",
+    "noteheads.s0cross", "noteheads.s0diamond", "noteheads.s0do",
+    "noteheads.s0doThin", "noteheads.s0doWalker", "noteheads.s0faWalker",
+    "noteheads.s0harmonic", "noteheads.s0la", "noteheads.s0laFunk",
+    "noteheads.s0laThin", "noteheads.s0laWalker", "noteheads.s0mensural",
+    "noteheads.s0mi", "noteheads.s0miMirror", "noteheads.s0miThin",
+    "noteheads.s0miWalker", "noteheads.s0neomensural", "noteheads.s0petrucci",
+    "noteheads.s0re", "noteheads.s0reThin", "noteheads.s0reWalker",
+    "noteheads.s0slash", "noteheads.s0sol", "noteheads.s0solFunk",
+    "noteheads.s0ti", "noteheads.s0tiThin", "noteheads.s0tiWalker",
+    "noteheads.s0triangle", "noteheads.s1", "noteheads.s1blackpetrucci",
+    "noteheads.s1cross", "noteheads.s1diamond", "noteheads.s1la",
+    "noteheads.s1laFunk", "noteheads.s1laThin", "noteheads.s1laWalker",
+    "noteheads.s1mensural", "noteheads.s1mi", "noteheads.s1miMirror",
+    "noteheads.s1miThin", "noteheads.s1miWalker", "noteheads.s1neomensural",
+    "noteheads.s1petrucci", "noteheads.s1slash", "noteheads.s1sol",
+    "noteheads.s1solFunk", "noteheads.s2", "noteheads.s2blackpetrucci",
+    "noteheads.s2cross", "noteheads.s2diamond", "noteheads.s2harmonic",
+    "noteheads.s2la", "noteheads.s2laFunk", "noteheads.s2laThin",
+    "noteheads.s2laWalker", "noteheads.s2mensural", "noteheads.s2mi",
+    "noteheads.s2miFunk", "noteheads.s2miMirror", "noteheads.s2miThin",
+    "noteheads.s2miWalker", "noteheads.s2neomensural", "noteheads.s2petrucci",
+    "noteheads.s2slash", "noteheads.s2sol", "noteheads.s2solFunk",
+    "noteheads.s2xcircle", "noteheads.sM1", "noteheads.sM1blackmensural",
+    "noteheads.sM1double", "noteheads.sM1mensural", "noteheads.sM1neomensural",
+    "noteheads.sM1semimensural", "noteheads.sM2blackmensural",
+    "noteheads.sM2mensural", "noteheads.sM2neomensural",
+    "noteheads.sM2semimensural", "noteheads.sM3blackligmensural",
+    "noteheads.sM3blackmensural", "noteheads.sM3ligmensural",
+    "noteheads.sM3mensural", "noteheads.sM3neomensural",
+    "noteheads.sM3semiligmensural", "noteheads.sM3semimensural",
+    "noteheads.shufnagel.lpes", "noteheads.shufnagel.punctum",
+    "noteheads.shufnagel.virga", "noteheads.slmensural",
+    "noteheads.slneomensural", "noteheads.smedicaea.inclinatum",
+    "noteheads.smedicaea.punctum", "noteheads.smedicaea.rvirga",
+    "noteheads.smedicaea.virga", "noteheads.ssolesmes.auct.asc",
+    "noteheads.ssolesmes.auct.desc", "noteheads.ssolesmes.incl.auctum",
+    "noteheads.ssolesmes.incl.parvum", "noteheads.ssolesmes.oriscus",
+    "noteheads.ssolesmes.stropha", "noteheads.ssolesmes.stropha.aucta",
+    "noteheads.svaticana.cephalicus", "noteheads.svaticana.epiphonus",
+    "noteheads.svaticana.inclinatum", "noteheads.svaticana.inner.cephalicus",
+    "noteheads.svaticana.linea.punctum",
+    "noteheads.svaticana.linea.punctum.cavum", "noteheads.svaticana.lpes",
+    "noteheads.svaticana.plica", "noteheads.svaticana.punctum",
+    "noteheads.svaticana.punctum.cavum", "noteheads.svaticana.quilisma",
+    "noteheads.svaticana.reverse.plica", "noteheads.svaticana.reverse.vplica",
+    "noteheads.svaticana.upes", "noteheads.svaticana.vepiphonus",
+    "noteheads.svaticana.vlpes", "noteheads.svaticana.vplica",
+    "noteheads.svaticana.vupes", "noteheads.u0doFunk", "noteheads.u0fa",
+    "noteheads.u0faFunk", "noteheads.u0faThin", "noteheads.u0miFunk",
+    "noteheads.u0reFunk", "noteheads.u0tiFunk", "noteheads.u1do",
+    "noteheads.u1doFunk", "noteheads.u1doThin", "noteheads.u1doWalker",
+    "noteheads.u1fa", "noteheads.u1faFunk", "noteheads.u1faThin",
+    "noteheads.u1faWalker", "noteheads.u1miFunk", "noteheads.u1re",
+    "noteheads.u1reFunk", "noteheads.u1reThin", "noteheads.u1reWalker",
+    "noteheads.u1ti", "noteheads.u1tiFunk", "noteheads.u1tiThin",
+    "noteheads.u1tiWalker", "noteheads.u1triangle", "noteheads.u2do",
+    "noteheads.u2doFunk", "noteheads.u2doThin", "noteheads.u2doWalker",
+    "noteheads.u2fa", "noteheads.u2faFunk", "noteheads.u2faThin",
+    "noteheads.u2faWalker", "noteheads.u2re", "noteheads.u2reFunk",
+    "noteheads.u2reThin", "noteheads.u2reWalker", "noteheads.u2ti",
+    "noteheads.u2tiFunk", "noteheads.u2tiThin", "noteheads.u2tiWalker",
+    "noteheads.u2triangle", "noteheads.uM2", "one", "p", "pedal.*", "pedal..",
+    "pedal.M", "pedal.P", "pedal.Ped", "pedal.d", "pedal.e", "period", "plus",
+    "r", "rests.0", "rests.0mensural", "rests.0neomensural", "rests.0o",
+    "rests.1", "rests.1mensural", "rests.1neomensural", "rests.1o", "rests.2",
+    "rests.2classical", "rests.2mensural", "rests.2neomensural", "rests.3",
+    "rests.3mensural", "rests.3neomensural", "rests.4", "rests.4mensural",
+    "rests.4neomensural", "rests.5", "rests.6", "rests.7", "rests.M1",
+    "rests.M1mensural", "rests.M1neomensural", "rests.M2", "rests.M2mensural",
+    "rests.M2neomensural", "rests.M3", "rests.M3mensural",
+    "rests.M3neomensural", "s", "scripts.arpeggio", "scripts.arpeggio.arrow.1",
+    "scripts.arpeggio.arrow.M1", "scripts.augmentum", "scripts.caesura.curved",
+    "scripts.caesura.straight", "scripts.circulus", "scripts.coda",
+    "scripts.daccentus", "scripts.dfermata", "scripts.dlongfermata",
+    "scripts.dmarcato", "scripts.downbow", "scripts.downmordent",
+    "scripts.downprall", "scripts.dpedalheel", "scripts.dpedaltoe",
+    "scripts.dportato", "scripts.dsemicirculus", "scripts.dshortfermata",
+    "scripts.dsignumcongruentiae", "scripts.dstaccatissimo",
+    "scripts.dverylongfermata", "scripts.espr", "scripts.flageolet",
+    "scripts.halfopen", "scripts.ictus", "scripts.lcomma", "scripts.lineprall",
+    "scripts.lvarcomma", "scripts.mordent", "scripts.open", "scripts.prall",
+    "scripts.pralldown", "scripts.prallmordent", "scripts.prallprall",
+    "scripts.prallup", "scripts.rcomma", "scripts.reverseturn",
+    "scripts.rvarcomma", "scripts.segno", "scripts.sforzato",
+    "scripts.snappizzicato", "scripts.staccato", "scripts.stopped",
+    "scripts.tenuto", "scripts.thumb", "scripts.trilelement", "scripts.trill",
+    "scripts.trill_element", "scripts.turn", "scripts.uaccentus",
+    "scripts.ufermata", "scripts.ulongfermata", "scripts.umarcato",
+    "scripts.upbow", "scripts.upedalheel", "scripts.upedaltoe",
+    "scripts.upmordent", "scripts.uportato", "scripts.upprall",
+    "scripts.usemicirculus", "scripts.ushortfermata",
+    "scripts.usignumcongruentiae", "scripts.ustaccatissimo",
+    "scripts.uverylongfermata", "scripts.varcoda", "scripts.varsegno", "seven",
+    "six", "space", "three", "timesig.C22", "timesig.C44",
+    "timesig.mensural22", "timesig.mensural24", "timesig.mensural32",
+    "timesig.mensural34", "timesig.mensural44", "timesig.mensural48",
+    "timesig.mensural64", "timesig.mensural68", "timesig.mensural68alt",
+    "timesig.mensural94", "timesig.mensural98", "timesig.neomensural22",
+    "timesig.neomensural24", "timesig.neomensural32", "timesig.neomensural34",
+    "timesig.neomensural44", "timesig.neomensural48", "timesig.neomensural64",
+    "timesig.neomensural68", "timesig.neomensural68alt",
+    "timesig.neomensural94", "timesig.neomensural98", "two", "z", "zero",
+]
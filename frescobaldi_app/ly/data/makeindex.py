@@ -0,0 +1,107 @@
+#! python
+
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2011 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Writes the _index.py module with lookup tables computed from _data.py.
+
+Usage: python makeindex.py > _index.py
+
+The tables map grobs to their interfaces and properties, properties to the
+interfaces and grobs supporting them, and contain the sorted lists of words,
+so that the query functions in ly.data can return them without computing.
+
+"""
+
+from __future__ import print_function
+
+import textwrap
+
+import _data
+
+
+def format_list(items, indent):
+    """Formats a list of strings as Python code, wrapped at 79 columns."""
+    if not items:
+        return "[]"
+    text = ", ".join('"{0}"'.format(item) for item in items)
+    prefix = " " * (indent + 4)
+    lines = textwrap.wrap(text, 79, initial_indent=prefix,
+        subsequent_indent=prefix, break_long_words=False, break_on_hyphens=False)
+    return "[\n" + "\n".join(lines) + ",\n" + " " * indent + "]"
+
+
+def format_dict(name, d):
+    """Formats a dict mapping strings to lists of strings as Python code."""
+    lines = ["{0} = {{".format(name)]
+    for key in sorted(d):
+        lines.append('    "{0}": {1},'.format(key, format_list(d[key], 4)))
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main():
+    interface_properties = dict((iface, sorted(props))
+        for iface, props in _data.interfaces.items())
+    grob_interfaces = dict((grob, sorted(ifaces))
+        for grob, ifaces in _data.grobs.items())
+    grob_properties = dict((grob, sorted(set(prop
+        for iface in ifaces for prop in _data.interfaces[iface])))
+        for grob, ifaces in _data.grobs.items())
+    property_interfaces = {}
+    for iface, props in _data.interfaces.items():
+        for prop in props:
+            property_interfaces.setdefault(prop, []).append(iface)
+    property_grobs = {}
+    for grob, props in grob_properties.items():
+        for prop in props:
+            property_grobs.setdefault(prop, []).append(grob)
+    for d in property_interfaces, property_grobs:
+        for items in d.values():
+            items.sort()
+
+    print("#! python")
+    print("# generated from _data.py by makeindex.py, do not edit")
+    print()
+    print('version = "{0}"'.format(_data.version))
+    for name, d in (
+        ("interface_properties", interface_properties),
+        ("grob_interfaces", grob_interfaces),
+        ("grob_properties", grob_properties),
+        ("property_interfaces", property_interfaces),
+        ("property_grobs", property_grobs),
+        ):
+        print()
+        print()
+        print(format_dict(name, d))
+    for name, items in (
+        ("grobs", sorted(_data.grobs)),
+        ("all_grob_properties", sorted(property_interfaces)),
+        ("context_properties", sorted(_data.contextproperties)),
+        ("engravers", _data.engravers),
+        ("music_glyphs", _data.musicglyphs),
+        ):
+        print()
+        print()
+        print("{0} = {1}".format(name, format_list(items, 0)))
+
+
+if __name__ == '__main__':
+    main()
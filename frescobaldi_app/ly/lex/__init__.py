@@ -86,7 +86,7 @@ from __future__ import unicode_literals
 
 import slexer
 from ._token import *
-from ._mode import extensions, modes, guessMode
+from ._mode import extensions, modes, guessMode, markers
 
 
 __all__ = [
@@ -21,7 +21,7 @@
 Registry for the different modes used by the tokenizer.
 
 
-There are two items in this module:
+There are three items in this module:
 
 1. the modes dictionary.
 
@@ -32,18 +32,25 @@ There are two items in this module:
 2. the guessMode function.
 
    This tries to guess the type of the given text and returns a mode name.
+
+3. the markers dictionary.
+
+   This maps a mode name to the strings that guessMode looks for in the whole
+   text, if the start of the text is not decisive.
    
    
 You can easily add more modes in separate modules and mention them here,
 
-Don't use this module directly!  modes and guessMode are imported in the main
+Don't use this module directly!  modes, guessMode and markers are imported in the main
 tokenize module.
 
 """
 
 from __future__ import unicode_literals
 
-__all__ = ['modes', 'guessMode']
+import re
+
+__all__ = ['modes', 'guessMode', 'markers']
 
 
 def _modes():
@@ -87,31 +94,45 @@ modes = _modes()
 del _modes
 
 
+# strings that, found anywhere in a text, decide its mode when the start
+# of the text is ambiguous
+markers = {
+    'latex':    ("\\documentclass", "\\section"),
+    'docbook':  ("DOCTYPE book", "<programlisting"),
+}
+
+_space = re.compile(r'\s*').match
+
+
 def guessMode(text):
     """Tries to guess the type of the input text, using a quite fast heuristic.
     
     Returns one of the strings also present as key in the modes dictionary.
     
+    Only the first non-blank characters of the text and the presence of the
+    strings in the markers dictionary are looked at.
+    
     """
-    text = text.lstrip()
-    if text.startswith(('%', '\\')) and ("\\documentclass" in text or "\\section" in text):
+    start = _space(text).end()
+    def found(mode):
+        return any(marker in text for marker in markers[mode])
+    if text.startswith(('%', '\\'), start) and found('latex'):
         return "latex"
-    elif text.startswith("<<"):
+    elif text.startswith("<<", start):
         return "lilypond"
-    elif text.startswith("<"):
-        if 'DOCTYPE book' in text or "<programlisting" in text:
+    elif text.startswith("<", start):
+        if found('docbook'):
             return "docbook"
         else:
             return "html"
-    elif text.startswith(("#!", ";", "(")):
+    elif text.startswith(("#!", ";", "("), start):
         return "scheme"
-    elif text.startswith('@'):
+    elif text.startswith('@', start):
         return "texinfo"
     else:
         return "lilypond"
 
 
-
 # dictionary mapping mode name to a default extension for a file of that mode.
 extensions = {
     'lilypond': '.ly',
@@ -39,6 +39,7 @@ import plugin
 import resultfiles
 import signals
 import popplertools
+import qpopplerview
 
 
 _cache = weakref.WeakValueDictionary()
@@ -72,10 +73,11 @@ def load(filename):
         return _cache[key]
     except KeyError:
         with open(filename, 'rb') as f:
-            data = QByteArray(f.read())
-        doc = popplerqt4.Poppler.Document.loadFromData(data)
+            data = f.read()
+        doc = popplerqt4.Poppler.Document.loadFromData(QByteArray(data))
         if doc:
             _cache[key] = doc
+            qpopplerview.cache.setsource(doc, data)
         return doc or None
 
 
@@ -24,6 +24,7 @@ Generate meaningful tooltips for cursor positions.
 from __future__ import unicode_literals
 
 import tokeniter
+import tokenindex
 import ly.lex.lilypond
 
 
@@ -38,8 +39,9 @@ def text(cursor):
     return text
 
 def get_definition(cursor):
-    block = cursor.block()
-    while block.isValid():
+    keys = (ly.lex.lilypond.Name, '\\score')
+    end = cursor.block().next()
+    for block in reversed(tokenindex.blocks(cursor.document(), keys, end=end)):
         state = tokeniter.state(block)
         if isinstance(state.parser(), ly.lex.lilypond.ParseGlobal):
             for t in tokeniter.tokens(block)[:2]:
@@ -47,6 +49,5 @@ def get_definition(cursor):
                     return t[:]
                 elif isinstance(t, ly.lex.lilypond.Keyword) and t == '\\score':
                     return '\\score'
-        block = block.previous()
 
 
@@ -26,7 +26,10 @@ This is used throughout Frescobaldi, to obey color settings etc.
 
 from __future__ import unicode_literals
 
+import os
+
 from PyQt4.QtCore import QSettings
+from PyQt4.QtGui import QDesktopServices
 
 import app
 import textformats
@@ -42,6 +45,35 @@ app.settingsChanged.connect(_setbackground, -1)
 _setbackground()
 
 
+# global setup of the number of processes rendering the pages
+def _setprocesses():
+    try:
+        processes = int(QSettings().value("musicview/render_processes", 0))
+    except ValueError:
+        processes = 0
+    if processes != qpopplerview.renderpool.size():
+        qpopplerview.renderpool.setsize(processes)
+app.settingsChanged.connect(_setprocesses, -1)
+_setprocesses()
+
+
+# global setup of the cache of rendered pages on disk
+def _setdiskcache():
+    try:
+        size = int(QSettings().value("musicview/disk_cache_size", 200))
+    except ValueError:
+        size = 200
+    if size > 0:
+        path = QDesktopServices.storageLocation(QDesktopServices.CacheLocation)
+        qpopplerview.diskcache.setpath(os.path.join(path, 'pages.db'))
+        qpopplerview.diskcache.setmaxsize(size * 1048576)
+    else:
+        qpopplerview.diskcache.setpath(None)
+app.settingsChanged.connect(_setdiskcache, -1)
+app.aboutToQuit.connect(qpopplerview.diskcache.stop)
+_setdiskcache()
+
+
 class View(qpopplerview.View):
     def __init__(self, parent=None):
         super(View, self).__init__(parent)
@@ -26,12 +26,13 @@ from __future__ import unicode_literals
 from PyQt4.QtCore import QSettings, Qt
 from PyQt4.QtGui import (
     QCheckBox, QDoubleSpinBox, QFont, QFontComboBox, QGridLayout, QHBoxLayout,
-    QLabel, QSlider, QSpinBox, QVBoxLayout)
+    QLabel, QPushButton, QSlider, QSpinBox, QVBoxLayout)
 
 import app
 import util
 import preferences
 import popplerview
+import qpopplerview
 
 
 class Tools(preferences.GroupsPage):
@@ -135,6 +136,22 @@ class MusicView(preferences.Group):
         layout.addWidget(self.magnifierScaleSlider, 1, 1)
         layout.addWidget(self.magnifierScaleSpinBox, 1, 2)
         
+        self.renderProcessesLabel = QLabel()
+        self.renderProcessesSpinBox = QSpinBox(valueChanged=self.changed)
+        self.renderProcessesSpinBox.setRange(0, 32)
+        layout.addWidget(self.renderProcessesLabel, 2, 0)
+        layout.addWidget(self.renderProcessesSpinBox, 2, 1)
+        
+        self.diskCacheLabel = QLabel()
+        self.diskCacheSpinBox = QSpinBox(valueChanged=self.changed)
+        self.diskCacheSpinBox.setRange(0, 10000)
+        self.diskCacheSpinBox.setSingleStep(50)
+        self.diskCacheClear = QPushButton()
+        self.diskCacheClear.clicked.connect(self.clearDiskCache)
+        layout.addWidget(self.diskCacheLabel, 3, 0)
+        layout.addWidget(self.diskCacheSpinBox, 3, 1)
+        layout.addWidget(self.diskCacheClear, 3, 2)
+        
         app.translateUI(self)
         
     def translateUI(self):
@@ -148,17 +165,54 @@ class MusicView(preferences.Group):
         self.magnifierScaleLabel.setToolTip(_(
             "Magnification of the magnifier."))
         self.magnifierScaleSpinBox.setSuffix(_("percent unit sign", "%"))
+        self.renderProcessesLabel.setText(_("Render Processes:"))
+        self.renderProcessesLabel.setToolTip(_(
+            "The number of processes that render the pages of a document in "
+            "parallel. If set to 0, the pages are rendered one at a time in "
+            "the background."))
+        self.renderProcessesSpinBox.setSpecialValueText(_("Off"))
+        self.diskCacheLabel.setText(_("Disk Cache:"))
+        self.diskCacheLabel.setToolTip(_(
+            "The maximum size of the rendered pages that are kept on disk, "
+            "so that documents that are opened again are shown faster."))
+        # L10N: as in "200 MB", appended after number in spinbox, note the leading space
+        self.diskCacheSpinBox.setSuffix(_(" MB"))
+        self.diskCacheSpinBox.setSpecialValueText(_("Off"))
+        self.diskCacheClear.setText(_("Clear"))
+        self.diskCacheClear.setToolTip(_(
+            "Removes all rendered pages from the disk cache."))
             
+    def clearDiskCache(self):
+        qpopplerview.diskcache.clear()
+        self.diskCacheClear.setEnabled(False)
+    
     def loadSettings(self):
         s = popplerview.MagnifierSettings.load()
         self.magnifierSizeSlider.setValue(s.size)
         self.magnifierScaleSlider.setValue(s.scale)
+        s = QSettings()
+        s.beginGroup("musicview")
+        try:
+            processes = int(s.value("render_processes", 0))
+        except ValueError:
+            processes = 0
+        self.renderProcessesSpinBox.setValue(processes)
+        try:
+            size = int(s.value("disk_cache_size", 200))
+        except ValueError:
+            size = 200
+        self.diskCacheSpinBox.setValue(size)
+        self.diskCacheClear.setEnabled(qpopplerview.diskcache.enabled())
     
     def saveSettings(self):
         s = popplerview.MagnifierSettings()
         s.size = self.magnifierSizeSlider.value()
         s.scale = self.magnifierScaleSlider.value()
         s.save()
+        s = QSettings()
+        s.beginGroup("musicview")
+        s.setValue("render_processes", self.renderProcessesSpinBox.value())
+        s.setValue("disk_cache_size", self.diskCacheSpinBox.value())
 
 
 class CharMap(preferences.Group):
@@ -0,0 +1,170 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Records the time spent in parts of the application.
+
+A Profile collects the number of calls and the time spent, per category and
+name. A Profiler holds the Profile that is used while profiling is enabled;
+modules that can be profiled create one and check its profile() before timing
+something, so that there is hardly any overhead when profiling is disabled.
+
+"""
+
+from __future__ import unicode_literals
+
+import functools
+import timeit
+
+
+# the timer used for measuring
+timer = timeit.default_timer
+
+
+class Profile(object):
+    """Collects the number of calls and the time spent, per category and name.
+    
+    The entries attribute is a dictionary mapping a category to a dictionary
+    that maps a name to a list [count, seconds]. If durations is True, the
+    duration of every call is kept as well, see durations().
+    
+    """
+    def __init__(self, durations=False):
+        self._keep = durations
+        self.clear()
+    
+    def clear(self):
+        """Discards all collected information."""
+        self.entries = {}
+        self._durations = {}
+    
+    def record(self, category, name, seconds):
+        """Records a call that took the given number of seconds."""
+        try:
+            entry = self.entries[category][name]
+        except KeyError:
+            entry = self.entries.setdefault(category, {})[name] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        if self._keep:
+            self._durations.setdefault(category, {}).setdefault(name, []).append(seconds)
+    
+    def names(self, category):
+        """Returns the names of the category, the most time consuming first."""
+        names = self.entries.get(category, {})
+        return sorted(names, key=lambda name: names[name][1], reverse=True)
+    
+    def durations(self, category, name=None):
+        """Returns the sorted list of durations of a category.
+        
+        If name is None, the durations of all names are combined. The list is
+        empty if the durations are not kept.
+        
+        """
+        names = self._durations.get(category, {})
+        if name is not None:
+            return sorted(names.get(name, []))
+        return sorted(d for durations in names.values() for d in durations)
+    
+    def report(self, categories=None):
+        """Returns a text report with the number of calls and the time spent.
+        
+        The times are in milliseconds; if the durations are kept, the latency
+        percentiles are reported as well. categories is a list of the
+        categories to report, by default all categories are reported.
+        
+        """
+        lines = []
+        if self._keep:
+            lines.append("{0:40} {1:>7} {2:>9} {3:>8} {4:>8} {5:>8} {6:>8}".format(
+                "Function", "calls", "total", "p50", "p95", "p99", "max"))
+        else:
+            lines.append("{0:40} {1:>7} {2:>9}".format("Function", "calls", "total"))
+        for category in categories or sorted(self.entries):
+            for name in self.names(category):
+                count, seconds = self.entries[category][name]
+                line = "{0:40} {1:7} {2:9.3f}".format(
+                    "{0}: {1}".format(category, name), count, seconds * 1000)
+                if self._keep:
+                    durations = self.durations(category, name)
+                    line += " {0:8.3f} {1:8.3f} {2:8.3f} {3:8.3f}".format(
+                        percentile(durations, 50) * 1000,
+                        percentile(durations, 95) * 1000,
+                        percentile(durations, 99) * 1000,
+                        durations[-1] * 1000)
+                lines.append(line)
+        return "\n".join(lines) + "\n"
+
+
+def percentile(durations, percent):
+    """Returns the percentile of the sorted list of durations, 0 if empty."""
+    if not durations:
+        return 0
+    return durations[min(len(durations) - 1, len(durations) * percent // 100)]
+
+
+class Profiler(object):
+    """Holds the Profile that is used while profiling is enabled.
+    
+    factory is called to create a Profile when enable() is called without one.
+    
+    """
+    def __init__(self, factory=Profile):
+        self._factory = factory
+        self._profile = None
+    
+    def enable(self, profile=None):
+        """Starts recording in a Profile.
+        
+        If profile is None, a new Profile is created. Returns the Profile that
+        is used; use disable() to stop.
+        
+        """
+        self._profile = profile or self._factory()
+        return self._profile
+    
+    def disable(self):
+        """Stops recording. Returns the Profile that was used, or None."""
+        profile, self._profile = self._profile, None
+        return profile
+    
+    def profile(self):
+        """Returns the Profile that is currently used, or None if not profiling."""
+        return self._profile
+    
+    def timed(self, category):
+        """Returns a decorator that records the duration of calls if profiling.
+        
+        The calls are recorded in the category under the name of the function.
+        
+        """
+        def decorator(f):
+            name = f.__name__
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                profile = self._profile
+                if profile is None:
+                    return f(*args, **kwargs)
+                start = timer()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    profile.record(category, name, timer() - start)
+            return wrapper
+        return decorator
@@ -68,7 +68,8 @@ View, Surface, (Abstract)Layout and Page can all be inherited from to build
 more specialized Poppler viewers.
 
 The cache module implements in-memory caching for drawed Page images.
-The images are rendered in a background thread.
+The images are rendered in a background thread, or in a pool of worker processes
+(see the renderpool module). The diskcache module can keep them on disk.
 
 Furthermore, there is a printer module containing functions to create a PostScript
 file of a Poppler.Document and a class to print a Poppler.Document to a QPrinter
@@ -97,11 +98,13 @@ from .highlight import Highlighter
 from .magnifier import Magnifier
 from .locking import lock
 from . import cache
+from . import renderpool
+from . import diskcache
 
 
 __all__ = [
     'FixedScale', 'FitWidth', 'FitHeight', 'FitBoth',
     'View', 'Page', 'AbstractLayout', 'Layout', 'Surface',
     'RenderOptions', 'Highlighter', 'Magnifier',
-    'lock', 'cache',
+    'lock', 'cache', 'renderpool', 'diskcache',
 ]
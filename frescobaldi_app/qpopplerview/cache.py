@@ -20,9 +20,23 @@
 
 """
 Caching of generated images.
+
+Pages are rendered in tiles of at most tilesize by tilesize pixels, only the
+tiles that are painted are generated.
+
+The tiles are rendered in a background thread, or in parallel in the worker
+processes of the renderpool module if it is enabled for the document.
+
+The images are kept in an imagecache.ImageCache, that evicts the least recently
+used images when the maximum size, or the budget of a document, is exceeded.
+
+If the diskcache is enabled, rendered images are also stored on disk, and looked
+up there before a tile is rendered. This needs the contents of the PDF document,
+see setsource().
+
 """
 
-import time
+import hashlib
 import weakref
 
 try:
@@ -30,85 +44,138 @@ try:
 except ImportError:
     from . import popplerqt4_dummy as popplerqt4
 
-from PyQt4.QtCore import QThread
+from PyQt4.QtCore import QRectF, QThread, QTimer
 
+from . import diskcache
+from . import imagecache
 from . import render
 from . import rectangles
+from . import renderpool
 from .locking import lock
 
-__all__ = ['maxsize', 'setmaxsize', 'image', 'generate', 'clear', 'links', 'options']
+__all__ = ['maxsize', 'setmaxsize', 'budget', 'setbudget', 'stats', 'resetstats',
+           'setsource',
+           'tiles', 'image', 'scaled', 'generate', 'clear', 'links', 'options']
 
 
-_cache = weakref.WeakKeyDictionary()
+# cache size
+_cache = imagecache.ImageCache(104857600) # 100M
 _schedulers = weakref.WeakKeyDictionary()
 _options = weakref.WeakKeyDictionary()
 _links = weakref.WeakKeyDictionary()
+_hashes = weakref.WeakKeyDictionary()
 
 
-# cache size
-_maxsize = 104857600 # 100M
-_currentsize = 0
-
 _globaloptions = None
 
+# the maximum width and height of a tile
+tilesize = 1024
+
 
 def setmaxsize(maxsize):
     """Sets the maximum cache size in Megabytes."""
-    global _maxsize
-    _maxsize = maxsize * 1048576
-    purge()
+    _cache.setmaxsize(maxsize * 1048576)
     
 
 def maxsize():
     """Returns the maximum cache size in Megabytes."""
-    return _maxsize / 1048576
+    return _cache.maxsize() / 1048576
+
+
+def setbudget(document, maxsize):
+    """Sets the maximum size in Megabytes the images of the Poppler.Document may take.
+    
+    Use None to remove the budget, then only the maximum cache size applies.
+    
+    """
+    _cache.setbudget(document, None if maxsize is None else maxsize * 1048576)
+
+
+def budget(document):
+    """Returns the maximum size in Megabytes of the images of the document, None if not set."""
+    budget = _cache.budget(document)
+    return None if budget is None else budget / 1048576
+
+
+def stats(document=None):
+    """Returns a dictionary with statistics about the cache.
+    
+    The keys are 'hits', 'misses' and 'evictions', counted since the last call
+    to resetstats(), and 'images', 'bytes' and 'maxsize' (in bytes), the number
+    and size of the cached images and the maximum size. If a Poppler.Document
+    is given, the latter three are about that document ('maxsize' is its budget
+    or None).
+    
+    """
+    return _cache.stats(document)
+
+
+def resetstats():
+    """Sets the hits, misses and evictions counters to zero."""
+    _cache.resetstats()
 
 
 def clear(document=None):
     """Clears the whole cache or the cache for the given Poppler.Document."""
-    if document:
-        try:
-            del _cache[document]
-        except KeyError:
-            pass
-    else:
-        _cache.clear()
-        global _currentsize
-        _currentsize = 0
+    _cache.clear(document)
 
 
-def image(page, exact=True):
-    """Returns a rendered image for given Page if in cache.
+def tiles(page, rect):
+    """Returns the list of tiles of the Page that intersect the QRect.
     
-    If exact is True (default), the function returns None if the exact size was
-    not in the cache. If exact is False, the function may return a temporary
-    rendering of the page scaled from a different size, if that was available.
+    The rect is relative to the page. A tile is a tuple (x, y, width, height)
+    relative to the page, the tiles are ordered from top left to bottom right.
     
     """
-    document = page.document()
-    pageKey = (page.pageNumber(), page.rotation())
-    sizeKey = (page.width(), page.height())
+    width, height = int(page.width()), int(page.height())
+    left, top = max(0, rect.x()), max(0, rect.y())
+    right = min(width, rect.x() + rect.width())
+    bottom = min(height, rect.y() + rect.height())
+    return [(x, y, min(tilesize, width - x), min(tilesize, height - y))
+            for y in range(top - top % tilesize, bottom, tilesize)
+            for x in range(left - left % tilesize, right, tilesize)]
+
+
+def image(page, tile):
+    """Returns the rendered image for the tile of the given Page if in cache.
     
-    if exact:
-        try:
-            entry = _cache[document][pageKey][sizeKey]
-        except KeyError:
-            return
-        else:
-            entry[1] = time.time()
-            return entry[0]
-    try:
-        sizes = _cache[document][pageKey].keys()
-    except KeyError:
-        return
-    # find the closest size (assuming aspect ratio has not changed)
-    if sizes:
-        sizes.sort(key=lambda s: abs(1 - s[0] / float(page.width())))
-        return _cache[document][pageKey][sizes[0]][0]
+    Returns None if the tile was not in the cache at the page's current size.
+    
+    """
+    return _cache.get(page.document(), page.pageNumber(), page.rotation(),
+                      (page.width(), page.height()), tile)
 
 
-def generate(page):
-    """Schedule an image to be generated for the cache."""
+def scaled(page, rect):
+    """Returns a temporary rendering of a part of the Page from another size.
+    
+    The rect is relative to the page. Returns a list of (target, image, source)
+    tuples, where target is a QRectF relative to the page and source the QRectF
+    of the image to draw there. The images are tiles from the cached size that
+    is closest to the page's current size. The list may be empty.
+    
+    """
+    nearest = _cache.nearest(page.document(), page.pageNumber(), page.rotation(),
+                             (page.width(), page.height()))
+    if not nearest:
+        return []
+    size, images = nearest
+    hscale = size[0] / float(page.width())
+    vscale = size[1] / float(page.height())
+    area = QRectF(rect.x() * hscale, rect.y() * vscale,
+                  rect.width() * hscale, rect.height() * vscale)
+    result = []
+    for (x, y, w, h), image in images.items():
+        source = area & QRectF(x, y, w, h)
+        if not source.isEmpty():
+            target = QRectF(source.x() / hscale, source.y() / vscale,
+                            source.width() / hscale, source.height() / vscale)
+            result.append((target, image, source.translated(-x, -y)))
+    return result
+
+
+def generate(page, tile):
+    """Schedule an image of the tile of the Page to be generated for the cache."""
     # Poppler-Qt4 crashes when different pages from a Document are rendered at the same time,
     # so we schedule them to be run in sequence.
     document = page.document()
@@ -116,47 +183,63 @@ def generate(page):
         scheduler = _schedulers[document]
     except KeyError:
         scheduler = _schedulers[document] = Scheduler()
-    scheduler.schedulejob(page)
+    scheduler.schedulejob(page, tile)
+
+
+def setsource(document, data):
+    """Sets the contents of the PDF file the Poppler.Document was loaded from.
+    
+    This enables rendering its pages in the renderpool and storing the images
+    in the diskcache, where they are found again if the same PDF is loaded
+    later.
+    
+    """
+    _hashes[document] = hashlib.sha1(data).hexdigest()
+    renderpool.setsource(document, data)
 
 
-def add(image, document, pageNumber, rotation, width, height):
+def add(image, document, pageNumber, rotation, width, height, tile):
     """(Internal) Adds an image to the cache."""
-    pageKey = (pageNumber, rotation)
-    sizeKey = (width, height)
-    _cache.setdefault(document, {}).setdefault(pageKey, {})[sizeKey] = [image, time.time()]
+    _cache.add(document, pageNumber, rotation, (width, height), tile, image)
+
+
+def store(job, image):
+    """(Internal) Stores the rendered image of the Job in the diskcache if enabled."""
+    if job.diskkey and not image.isNull() and diskcache.enabled():
+        diskcache.store(job.diskkey, image)
+
+
+def diskkey(document, job):
+    """(Internal) Returns the key of the image of the Job in the diskcache.
+    
+    This is a tuple of the hash of the document's contents and a string
+    describing the tile. Returns None if the diskcache is disabled or the
+    contents of the document are not known.
     
-    # maintain cache size
-    global _maxsize, _currentsize
-    _currentsize += image.byteCount()
-    if _currentsize > _maxsize:
-        purge()
+    """
+    if diskcache.enabled() and document in _hashes:
+        x, y, w, h = job.tile
+        renderHint, paperColor = renderoptions(document)
+        return _hashes[document], "{0}-{1}-{2}x{3}-{4},{5},{6},{7}-{8}-{9}".format(
+            job.pageNumber, job.rotation, job.width, job.height, x, y, w, h,
+            renderHint, paperColor.rgba() if paperColor is not None else None)
 
 
-def purge():
-    """Removes old images from the cache to limit the space used.
+def renderoptions(document):
+    """(Internal) Returns the render hints (int) and paper color used to render the document.
     
-    (Not necessary to call, as the cache will monitor its size automatically.)
+    Both are None if not set in the options of the document nor in the global
+    options.
     
     """
-    # make a list of the images, sorted on time, newest first
-    images = iter(sorted((
-        (time, document, pageKey, sizeKey, image.byteCount())
-            for document, pageKeys in _cache.items()
-            for pageKey, sizeKeys in pageKeys.items()
-            for sizeKey, (image, time) in sizeKeys.items()),
-                reverse=True))
-
-    # sum the size of the newest images
-    global _maxsize, _currentsize
-    byteCount = 0
-    for item in images:
-        byteCount += item[4]
-        if byteCount > _maxsize:
-            break
-    _currentsize = byteCount
-    # delete the other images
-    for time, document, pageKey, sizeKey, byteCount in images:
-        del _cache[document][pageKey][sizeKey]
+    renderHint, paperColor = options(document).renderHint(), options(document).paperColor()
+    if renderHint is None:
+        renderHint = options().renderHint()
+    if paperColor is None:
+        paperColor = options().paperColor()
+    if renderHint is not None:
+        renderHint = int(renderHint)
+    return renderHint, paperColor
 
 
 def links(page):
@@ -208,63 +291,199 @@ def setoptions(options, document=None):
 
 
 class Scheduler(object):
-    """Manages running rendering jobs in sequence for a Document."""
+    """Manages running rendering jobs for a Document.
+    
+    The jobs run in sequence, or, if the renderpool is available for the
+    document, as many at a time as there are worker processes.
+    
+    The jobs for the tiles closest to the center of the visible part of the
+    layout of their page (see AbstractLayout.viewport()) are started first.
+    Jobs that no page waits for anymore, e.g. for a page that has been zoomed
+    or for a tile that has been scrolled out of view, are canceled.
+    
+    Jobs are started when control returns to the event loop, so all tiles
+    requested while painting are known before the first one is started.
+    
+    """
     def __init__(self):
         self._schedule = []     # order
         self._jobs = {}         # jobs on key
-        self._waiting = weakref.WeakKeyDictionary()      # jobs on page
-        self._running = None
+        self._waiting = weakref.WeakKeyDictionary()      # (size, set of jobs) on page
+        self._running = {}      # runners on job
+        self._canceled = set()  # runners of canceled jobs that did not yet finish
+        self._starting = False  # whether start() will be called
         
-    def schedulejob(self, page):
+    def schedulejob(self, page, tile):
         """Creates or retriggers an existing Job.
         
-        If a Job was already scheduled for the page, it is canceled.
-        The page's update() method will be called when the Job has completed.
+        If Jobs were already scheduled for the page at another size or rotation,
+        they are canceled. The page's update() method will be called when the
+        Job has completed.
         
         """
         # uniquely identify the image to be generated
-        key = (page.pageNumber(), page.rotation(), page.width(), page.height())
+        size = (page.rotation(), page.width(), page.height())
+        key = (page.pageNumber(),) + size + (tile,)
         try:
             job = self._jobs[key]
         except KeyError:
-            job = self._jobs[key] = Job(page)
+            job = self._jobs[key] = Job(page, tile)
             job.key = key
+            self.load(job)
         else:
             self._schedule.remove(job)
         self._schedule.append(job)
-        self._waiting[page] = job
+        try:
+            waitsize, jobs = self._waiting[page]
+        except KeyError:
+            waitsize = None
+        if waitsize != size:
+            jobs = set()
+            self._waiting[page] = (size, jobs)
+        jobs.add(job)
         self.checkStart()
         
     def checkStart(self):
-        """Starts a job if none is running and at least one is waiting."""
-        while self._schedule and not self._running:
-            job = self._schedule[-1]
+        """Makes sure start() is called once when control returns to the event loop."""
+        if not self._starting:
+            self._starting = True
+            QTimer.singleShot(0, self.start)
+    
+    def start(self):
+        """Starts the most urgent jobs while fewer than allowed are running."""
+        self._starting = False
+        priorities = self.purge()
+        waiting = [job for job in self._schedule[::-1]
+                   if job not in self._running and not job.loading]
+        waiting.sort(key=priorities.get)
+        for job in waiting:
             document = job.document()
-            if document and job in self._waiting.values():
-                self._running = Runner(self, document, job)
+            if not document:
+                self.cancel(job)
+            elif renderpool.available(document):
+                if len(self._running) >= renderpool.size():
+                    break
+                self._running[job] = PoolRunner(self, document, job)
+            elif self._running:
                 break
             else:
-                self.done(job)
-            
+                self._running[job] = Runner(self, document, job)
+    
+    def load(self, job):
+        """Looks up the image of a new job in the diskcache, if enabled.
+        
+        The image is not looked up if the diskcache has no images of the
+        document. Otherwise the job is not started until the diskcache has
+        answered. If the image is found, the job is done without rendering.
+        
+        """
+        job.diskkey = diskkey(job.document(), job)
+        if job.diskkey and diskcache.contains(job.diskkey[0]):
+            job.loading = True
+            diskcache.load(job.diskkey, lambda image: self.loaded(job, image))
+    
+    def loaded(self, job, image):
+        """Called when the diskcache has looked up the image of the job."""
+        job.loading = False
+        if job.canceled:
+            return
+        document = job.document()
+        if image is not None and not image.isNull() and document:
+            add(image, document, job.pageNumber, job.rotation,
+                job.width, job.height, job.tile)
+            self.done(job)
+        self.checkStart()
+    
+    def purge(self):
+        """Cancels the jobs no page is waiting for.
+        
+        A page stops waiting for the tiles that are outside the visible part of
+        its layout, they are scheduled again when they are painted. Returns a
+        dictionary with the priority of the other jobs, lower is more urgent.
+        
+        """
+        priorities = {}
+        for page, (size, jobs) in list(self._waiting.items()):
+            for job in list(jobs):
+                priority = _priority(page, job.tile)
+                if priority[0]:
+                    jobs.remove(job)
+                elif job not in priorities or priority < priorities[job]:
+                    priorities[job] = priority
+            if not jobs:
+                del self._waiting[page]
+        for job in self._schedule[:]:
+            if job not in priorities:
+                self.cancel(job)
+        return priorities
+    
+    def cancel(self, job):
+        """Cancels the job.
+        
+        If the job is running, its runner is asked to stop and the image it
+        renders is not used.
+        
+        """
+        job.canceled = True
+        del self._jobs[job.key]
+        self._schedule.remove(job)
+        runner = self._running.pop(job, None)
+        if runner:
+            self._canceled.add(runner)
+            runner.abort()
+    
+    def release(self, runner):
+        """Called when the runner of a canceled job has finished."""
+        self._canceled.discard(runner)
+        
     def done(self, job):
-        """Called when the job has completed."""
+        """Called when the job has completed or could not complete."""
         del self._jobs[job.key]
         self._schedule.remove(job)
-        self._running = None
-        for page in list(self._waiting):
-            if self._waiting[page] is job:
+        self._running.pop(job, None)
+        for page, (size, jobs) in list(self._waiting.items()):
+            if job in jobs:
                 page.update()
-                del self._waiting[page]
+                jobs.remove(job)
+                if not jobs:
+                    del self._waiting[page]
+
+
+def _priority(page, tile):
+    """(Internal) Returns the priority of rendering the tile of the Page.
+    
+    This is a tuple with the distance of the tile to the visible part of the
+    layout of the page, and the distance of its center to the center of the
+    visible part. Tiles of pages without layout or viewport come first.
+    
+    """
+    layout = page.layout() if hasattr(page, 'layout') else None
+    viewport = layout.viewport() if layout else None
+    if not viewport or viewport.isEmpty():
+        return (0, 0)
+    pos = page.pos()
+    x, y, w, h = tile
+    x += pos.x()
+    y += pos.y()
+    left, top = viewport.x(), viewport.y()
+    right, bottom = left + viewport.width(), top + viewport.height()
+    distance = (max(0, left - x - w, x - right) + max(0, top - y - h, y - bottom))
+    center = abs(2 * x + w - left - right) + abs(2 * y + h - top - bottom)
+    return (distance, center)
 
 
 class Job(object):
     """Simply contains data needed to create an image later."""
-    def __init__(self, page):
+    def __init__(self, page, tile):
         self.document = weakref.ref(page.document())
         self.pageNumber = page.pageNumber()
         self.rotation = page.rotation()
         self.width = page.width()
         self.height = page.height()
+        self.tile = tile
+        self.canceled = False
+        self.loading = False
+        self.diskkey = None
 
 
 class Runner(QThread):
@@ -279,6 +498,8 @@ class Runner(QThread):
         
     def run(self):
         """Main method of this thread, called by Qt on start()."""
+        if self.job.canceled:
+            return
         page = self.document.page(self.job.pageNumber)
         pageSize = page.pageSize()
         if self.job.rotation & 1:
@@ -286,13 +507,64 @@ class Runner(QThread):
         xres = 72.0 * self.job.width / pageSize.width()
         yres = 72.0 * self.job.height / pageSize.height()
         with lock(self.document):
+            if self.job.canceled:
+                # canceled while waiting for another job to complete
+                return
             options().write(self.document)
             options(self.document).write(self.document)
-            self.image = page.renderToImage(xres, yres, 0, 0, self.job.width, self.job.height, self.job.rotation)
+            x, y, w, h = self.job.tile
+            self.image = page.renderToImage(xres, yres, x, y, w, h, self.job.rotation)
+        
+    def abort(self):
+        """Called when the job is canceled, does nothing.
+        
+        The thread checks whether the job is canceled before rendering, a
+        render that Poppler has started can't be interrupted.
+        
+        """
         
     def slotFinished(self):
         """Called when the thread has completed."""
-        add(self.image, self.document, self.job.pageNumber, self.job.rotation, self.job.width, self.job.height)
-        self.scheduler.done(self.job)
+        if self.job.canceled:
+            self.scheduler.release(self)
+        else:
+            add(self.image, self.document, self.job.pageNumber, self.job.rotation,
+                self.job.width, self.job.height, self.job.tile)
+            store(self.job, self.image)
+            self.scheduler.done(self.job)
+        self.scheduler.checkStart()
+
+
+class PoolRunner(object):
+    """Runs a Job in a worker process of the renderpool."""
+    def __init__(self, scheduler, document, job):
+        self.scheduler = scheduler
+        self.job = job
+        self.document = document
+        renderHint, paperColor = renderoptions(document)
+        renderpool.render(self, document, job, renderHint, paperColor)
+        
+    def abort(self):
+        """Called when the job is canceled, withdraws it if it is still waiting for a worker."""
+        if renderpool.cancel(self):
+            self.scheduler.release(self)
+    
+    def slotFinished(self):
+        """Called when the image has been rendered."""
+        if self.job.canceled:
+            self.scheduler.release(self)
+        else:
+            add(self.image, self.document, self.job.pageNumber, self.job.rotation,
+                self.job.width, self.job.height, self.job.tile)
+            store(self.job, self.image)
+            self.scheduler.done(self.job)
+        self.scheduler.checkStart()
+    
+    def cancel(self):
+        """Called when the job could not complete, the tile is generated again when needed."""
+        if self.job.canceled:
+            self.scheduler.release(self)
+        else:
+            self.scheduler.done(self.job)
         self.scheduler.checkStart()
 
@@ -0,0 +1,289 @@
+# This file is part of the qpopplerview package.
+#
+# Copyright (c) 2010 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+Stores rendered images on disk, so that they survive a restart.
+
+The images are compressed and stored in a SQLite database (see
+lrustore.Store). The key of an image is a tuple (document, name) of strings,
+that the cache module computes: document from the contents of the PDF
+document, name from the page, the size and the render options. The database
+holds at most maxsize() bytes of images, when it grows larger the least
+recently used ones are removed.
+
+All database access happens in a background thread. load() calls back when
+the image has been read, store() returns immediately. When the database is
+opened, the documents with stored images are read, after that contains()
+tells whether it is worth looking up the images of a document.
+
+The disk cache is disabled until a path is set with setpath().
+
+"""
+
+import itertools
+import sqlite3
+import struct
+import threading
+import zlib
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from PyQt4.QtCore import QThread, pyqtSignal
+from PyQt4.QtGui import QImage
+
+import lrustore
+
+__all__ = ['setpath', 'path', 'setmaxsize', 'maxsize', 'enabled', 'contains',
+           'load', 'store', 'clear', 'stop']
+
+
+_path = None
+_maxsize = 209715200 # 200M
+_worker = None
+_callbacks = {}
+_documents = set()  # the documents that have stored images
+_known = False      # whether the stored documents have been read
+
+
+def setpath(path):
+    """Sets the filename of the database. None disables the disk cache."""
+    global _path
+    if path != _path:
+        stop()
+        _path = path
+
+
+def path():
+    """Returns the filename of the database, None if the disk cache is disabled."""
+    return _path
+
+
+def setmaxsize(maxsize):
+    """Sets the maximum size in bytes of the images in the database."""
+    global _maxsize
+    _maxsize = maxsize
+    if _worker:
+        _worker.request(1, 'maxsize', maxsize)
+
+
+def maxsize():
+    """Returns the maximum size in bytes of the images in the database."""
+    return _maxsize
+
+
+def enabled():
+    """Returns True if the disk cache is enabled."""
+    return _path is not None
+
+
+def contains(document):
+    """Returns False if it is known that no images of the document are stored.
+    
+    Returns True until the documents with stored images have been read.
+    
+    """
+    return not _known or document in _documents
+
+
+def load(key, callback):
+    """Reads the image stored under the key in the background.
+    
+    The callback is called in the main thread with the QImage, or with None
+    if no image was stored under the key. When the same key is requested again
+    before it was read, all callbacks are called.
+    
+    """
+    try:
+        _callbacks[key].append(callback)
+    except KeyError:
+        _callbacks[key] = [callback]
+        worker().request(0, 'load', key)
+
+
+def store(key, image):
+    """Stores the image under the key in the background."""
+    _documents.add(key[0])
+    worker().store(key, image)
+
+
+def clear():
+    """Removes all images from the database."""
+    if _path is not None:
+        _documents.clear()
+        worker().request(0, 'clear')
+
+
+def stop():
+    """Stops the background thread after it has stored the pending images.
+    
+    Callbacks of pending reads are called with None.
+    
+    """
+    global _worker, _known
+    if _worker:
+        _worker.request(2, None)
+        _worker.wait()
+        _worker = None
+    _documents.clear()
+    _known = False
+    for key, callbacks in list(_callbacks.items()):
+        _loaded(key, None)
+
+
+def worker():
+    """(Internal) Returns the running Worker, starting it if needed."""
+    global _worker
+    if _worker is None:
+        _worker = Worker(_path, _maxsize)
+    return _worker
+
+
+def _loaded(key, image):
+    """(Internal) Called in the main thread when an image has been read."""
+    for callback in _callbacks.pop(key, ()):
+        callback(image)
+
+
+class Worker(QThread):
+    """Reads and writes the database in a background thread.
+    
+    Requests are handled in order of priority: reading (0), writing (1),
+    stopping (2). Images that are not yet written are found by reading as well.
+    
+    """
+    loaded = pyqtSignal(object, object)
+    opened = pyqtSignal(object)
+    
+    def __init__(self, path, maxsize):
+        super(Worker, self).__init__()
+        self._path = path
+        self._maxsize = maxsize
+        self._queue = queue.PriorityQueue()
+        self._count = itertools.count()
+        self._lock = threading.Lock()
+        self._unwritten = {}
+        self.loaded.connect(_loaded)
+        self.opened.connect(self.slotOpened)
+        self.start()
+    
+    def request(self, priority, action, *args):
+        """Adds a request for the background thread."""
+        self._queue.put((priority, next(self._count), action, args))
+    
+    def store(self, key, image):
+        """Adds a request to store the image under the key."""
+        with self._lock:
+            self._unwritten[key] = image
+        self.request(1, 'store', key)
+    
+    def slotOpened(self, documents):
+        """Called in the main thread with the set of documents that have images."""
+        global _known
+        if self is _worker:
+            _documents.update(documents)
+            _known = True
+    
+    def run(self):
+        """Main method of this thread, called by Qt on start()."""
+        db = lrustore.Store(self._path, 'tiles', self._maxsize)
+        documents = set()
+        if db.open():
+            try:
+                documents = db.groups()
+            except sqlite3.Error:
+                pass
+        else:
+            db = None
+        self.opened.emit(documents)
+        while True:
+            priority, count, action, args = self._queue.get()
+            if action is None:
+                break
+            elif action == 'load':
+                key = args[0]
+                with self._lock:
+                    image = self._unwritten.get(key)
+                if image is None and db:
+                    try:
+                        value = db.get(*key)
+                        if value is not None:
+                            image = decode(value)
+                    except (sqlite3.Error, zlib.error, struct.error):
+                        pass
+                self.loaded.emit(key, image)
+            elif action == 'store':
+                key = args[0]
+                with self._lock:
+                    image = self._unwritten.get(key)
+                if image is not None and db:
+                    try:
+                        db.set(key[0], key[1], encode(image))
+                    except sqlite3.Error:
+                        pass
+                with self._lock:
+                    if image is not None and self._unwritten.get(key) is image:
+                        del self._unwritten[key]
+            elif not db:
+                continue
+            elif action == 'maxsize':
+                try:
+                    db.setmaxsize(args[0])
+                except sqlite3.Error:
+                    pass
+            elif action == 'clear':
+                with self._lock:
+                    self._unwritten.clear()
+                try:
+                    db.clear()
+                except sqlite3.Error:
+                    pass
+        if db:
+            db.close()
+
+
+# header: width, height, bytes per line, format, number of colors
+_header = struct.Struct('<IIIII')
+
+
+def encode(image):
+    """Returns a compressed string with the QImage."""
+    colors = image.colorTable()
+    count = image.bytesPerLine() * image.height()
+    return b''.join((
+        _header.pack(image.width(), image.height(), image.bytesPerLine(),
+                     int(image.format()), len(colors)),
+        struct.pack('<%dI' % len(colors), *colors),
+        zlib.compress(image.constBits().asstring(count)),
+    ))
+
+
+def decode(value):
+    """Returns a QImage from a string created by encode()."""
+    width, height, bytesPerLine, format, ncolors = _header.unpack_from(value)
+    offset = _header.size + ncolors * 4
+    colors = struct.unpack_from('<%dI' % ncolors, value, _header.size)
+    data = zlib.decompress(value[offset:])
+    image = QImage(data, width, height, bytesPerLine, QImage.Format(format)).copy()
+    if colors:
+        image.setColorTable(list(colors))
+    return image
@@ -0,0 +1,297 @@
+# This file is part of the qpopplerview package.
+#
+# Copyright (c) 2010 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+A least recently used cache for the rendered images of Poppler documents.
+
+Used by the cache module. The images are kept in a linked list in the order
+they were used, so adding, finding and evicting an image takes constant time.
+
+"""
+
+import bisect
+import weakref
+
+
+class ImageCache(object):
+    """Stores the rendered tiles of pages of Poppler documents.
+    
+    An image is stored under its document, page number, rotation, size
+    (width, height) and tile. When the images take more than maxsize bytes,
+    the least recently used images are evicted. A document can have its own
+    budget, then its least recently used images are evicted when they take
+    more than that.
+    
+    The cache counts hits, misses and evictions, see stats().
+    
+    """
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._bytes = 0
+        self._lru = LinkedList()
+        self._documents = weakref.WeakKeyDictionary()
+        self._budgets = weakref.WeakKeyDictionary()
+        self.resetstats()
+    
+    def setmaxsize(self, maxsize):
+        """Sets the maximum number of bytes the images may take."""
+        self._maxsize = maxsize
+        self._evict(self._lru, lambda: self._bytes > self._maxsize)
+    
+    def maxsize(self):
+        """Returns the maximum number of bytes the images may take."""
+        return self._maxsize
+    
+    def setbudget(self, document, maxsize):
+        """Sets the maximum number of bytes the images of the document may take.
+        
+        Use None to remove the budget of the document.
+        
+        """
+        if maxsize is None:
+            self._budgets.pop(document, None)
+        else:
+            self._budgets[document] = maxsize
+            d = self._documents.get(document)
+            if d:
+                self._evict(d.lru, lambda: d.bytes > maxsize)
+    
+    def budget(self, document):
+        """Returns the maximum number of bytes of the images of the document, None if not set."""
+        return self._budgets.get(document)
+    
+    def get(self, document, pageNumber, rotation, size, tile):
+        """Returns the image, or None if it is not in the cache."""
+        try:
+            entry = self._documents[document].pages[pageNumber, rotation].sizes[size][tile]
+        except KeyError:
+            self._misses += 1
+            return
+        self._hits += 1
+        self._touch(entry)
+        return entry.image
+    
+    def nearest(self, document, pageNumber, rotation, size):
+        """Returns the tiles of the page at the size closest to the given size.
+        
+        Does not consider the size itself. Returns a tuple (size, tiles), where
+        tiles is a dictionary with the images on their tile. Returns None if
+        there are no images at another size. Do not alter the dictionary.
+        
+        """
+        try:
+            page = self._documents[document].pages[pageNumber, rotation]
+        except KeyError:
+            return
+        order = page.order
+        i = bisect.bisect_left(order, size)
+        candidates = order[max(0, i - 1):i] + [s for s in order[i:i+2] if s != size][:1]
+        if not candidates:
+            return
+        # find the closest size (assuming aspect ratio has not changed)
+        closest = min(candidates, key=lambda s: abs(1 - s[0] / float(size[0] or 1)))
+        return closest, dict((tile, entry.image)
+            for tile, entry in page.sizes[closest].items())
+    
+    def add(self, document, pageNumber, rotation, size, tile, image):
+        """Adds the image, evicting the least recently used ones if needed."""
+        d = self._documents.get(document)
+        if d is None:
+            d = self._documents[document] = Document()
+            # drop the images of the document when it is deleted
+            d.ref = weakref.ref(document, lambda ref, d=d: self._discard(d))
+        try:
+            page = d.pages[pageNumber, rotation]
+        except KeyError:
+            page = d.pages[pageNumber, rotation] = Page()
+        old = page.sizes.get(size, {}).get(tile)
+        if old:
+            self._remove(old)
+        try:
+            tiles = page.sizes[size]
+        except KeyError:
+            tiles = page.sizes[size] = {}
+            bisect.insort(page.order, size)
+        entry = tiles[tile] = Entry(d, page, size, tile, image)
+        self._lru.append(entry.link)
+        d.lru.append(entry.doclink)
+        d.bytes += entry.byteCount
+        self._bytes += entry.byteCount
+        budget = self._budgets.get(document)
+        if budget is not None:
+            self._evict(d.lru, lambda: d.bytes > budget, entry)
+        self._evict(self._lru, lambda: self._bytes > self._maxsize, entry)
+    
+    def clear(self, document=None):
+        """Removes all images, or those of the given document."""
+        if document is None:
+            for d in list(self._documents.values()):
+                self._discard(d)
+            self._documents.clear()
+        else:
+            d = self._documents.pop(document, None)
+            if d:
+                self._discard(d)
+    
+    def stats(self, document=None):
+        """Returns a dictionary with statistics.
+        
+        The keys are 'hits', 'misses' and 'evictions' (counted since the last
+        resetstats()), 'images' and 'bytes' (the number and size of the images
+        in the cache) and 'maxsize'. If a document is given, 'images', 'bytes'
+        and 'maxsize' (its budget, None if not set) are about that document.
+        
+        """
+        result = {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+        }
+        if document is None:
+            result['images'] = len(self._lru)
+            result['bytes'] = self._bytes
+            result['maxsize'] = self._maxsize
+        else:
+            d = self._documents.get(document)
+            result['images'] = len(d.lru) if d else 0
+            result['bytes'] = d.bytes if d else 0
+            result['maxsize'] = self._budgets.get(document)
+        return result
+    
+    def resetstats(self):
+        """Sets the hits, misses and evictions counters to zero."""
+        self._hits = self._misses = self._evictions = 0
+    
+    def _touch(self, entry):
+        """(Internal) Marks the entry as the most recently used one."""
+        self._lru.remove(entry.link)
+        self._lru.append(entry.link)
+        lru = entry.document.lru
+        lru.remove(entry.doclink)
+        lru.append(entry.doclink)
+    
+    def _evict(self, lru, full, keep=None):
+        """(Internal) Removes the least recently used entries of the list while full() returns True.
+        
+        The entry keep is never removed.
+        
+        """
+        while full():
+            entry = lru.first()
+            if entry is None or entry is keep:
+                break
+            self._remove(entry)
+            self._evictions += 1
+    
+    def _remove(self, entry):
+        """(Internal) Removes the entry."""
+        self._lru.remove(entry.link)
+        d = entry.document
+        d.lru.remove(entry.doclink)
+        d.bytes -= entry.byteCount
+        self._bytes -= entry.byteCount
+        page = entry.page
+        tiles = page.sizes[entry.size]
+        del tiles[entry.tile]
+        if not tiles:
+            del page.sizes[entry.size]
+            del page.order[bisect.bisect_left(page.order, entry.size)]
+    
+    def _discard(self, d):
+        """(Internal) Removes all entries of the Document entry d."""
+        for entry in list(d.lru):
+            self._lru.remove(entry.link)
+            self._bytes -= entry.byteCount
+        d.lru = LinkedList()
+        d.pages.clear()
+        d.bytes = 0
+
+
+class Document(object):
+    """The images of a document, with their own usage order."""
+    def __init__(self):
+        self.pages = {}     # Page on (pageNumber, rotation)
+        self.lru = LinkedList()
+        self.bytes = 0
+        self.ref = None
+
+
+class Page(object):
+    """The images of a page, on size and tile, and the sorted list of sizes."""
+    def __init__(self):
+        self.sizes = {}     # {tile: Entry} on (width, height)
+        self.order = []
+
+
+class Entry(object):
+    """An image in the cache, linked in the list of all images and in that of its document."""
+    __slots__ = ('document', 'page', 'size', 'tile', 'image', 'byteCount', 'link', 'doclink')
+    def __init__(self, document, page, size, tile, image):
+        self.document = document
+        self.page = page
+        self.size = size
+        self.tile = tile
+        self.image = image
+        self.byteCount = image.byteCount()
+        self.link = Link(self)
+        self.doclink = Link(self)
+
+
+class Link(object):
+    """A node of a LinkedList."""
+    __slots__ = ('prev', 'next', 'value')
+    def __init__(self, value=None):
+        self.prev = self.next = self
+        self.value = value
+
+
+class LinkedList(object):
+    """A circular doubly linked list, with the oldest Link first."""
+    def __init__(self):
+        self._root = Link()
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def __iter__(self):
+        link = self._root.next
+        while link is not self._root:
+            yield link.value
+            link = link.next
+    
+    def append(self, link):
+        """Adds the Link at the end."""
+        root = self._root
+        link.prev, link.next = root.prev, root
+        root.prev.next = root.prev = link
+        self._count += 1
+    
+    def remove(self, link):
+        """Removes the Link."""
+        link.prev.next, link.next.prev = link.next, link.prev
+        link.prev = link.next = link
+        self._count -= 1
+    
+    def first(self):
+        """Returns the value of the first Link, None if the list is empty."""
+        link = self._root.next
+        if link is not self._root:
+            return link.value
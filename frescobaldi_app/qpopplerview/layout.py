@@ -58,6 +58,7 @@ class AbstractLayout(QObject):
         self._scale = 1.0
         self._scaleChanged = False
         self._dpi = (72, 72)
+        self._viewport = QRect()
         
     def own(self, page):
         """(Internal) Makes the page have ourselves as layout."""
@@ -159,6 +160,18 @@ class AbstractLayout(QObject):
     def dpi(self):
         """Returns our DPI as a tuple(XDPI, YDPI)."""
         return self._dpi
+    
+    def setViewport(self, rect):
+        """Sets the QRect of us that is currently visible (set by the Surface).
+        
+        The cache renders the tiles closest to this rectangle first.
+        
+        """
+        self._viewport = rect
+    
+    def viewport(self):
+        """Returns the QRect of us that is currently visible, may be empty if not known."""
+        return self._viewport
         
     def scale(self):
         """Returns the scale (1.0 == 100%)."""
@@ -24,7 +24,7 @@ The Magnifier magnifies a part of the displayed Poppler document.
 
 import weakref
 
-from PyQt4.QtCore import QPoint, QRect
+from PyQt4.QtCore import QPoint, QPointF, QRect
 from PyQt4.QtGui import QPainter, QRegion, QWidget
 
 from . import cache
@@ -89,17 +89,20 @@ class Magnifier(QWidget):
         relx = pagePos.x() / float(page.width())
         rely = pagePos.y() / float(page.height())
         
-        image = cache.image(self._page)
-        img_rect = QRect(self.rect())
-        if not image:
-            cache.generate(self._page)
-            image = cache.image(self._page, False)
+        # the part of the magnified page we display
+        rect = QRect(self.rect())
+        rect.moveCenter(QPoint(relx * self._page.width(), rely * self._page.height()))
+        painter = QPainter(self)
+        for tile in cache.tiles(self._page, rect):
+            part = rect & QRect(*tile)
+            image = cache.image(self._page, tile)
             if image:
-                img_rect.setWidth(self.width() * image.width() / self._page.width())
-                img_rect.setHeight(self.height() * image.height() / self._page.height())
-        if image:
-            img_rect.moveCenter(QPoint(relx * image.width(), rely * image.height()))
-            QPainter(self).drawImage(self.rect(), image, img_rect)
+                painter.drawImage(part.translated(-rect.topLeft()), image,
+                                  part.translated(-tile[0], -tile[1]))
+            else:
+                cache.generate(self._page, tile)
+                for target, image, source in cache.scaled(self._page, part):
+                    painter.drawImage(target.translated(-QPointF(rect.topLeft())), image, source)
 
 
 class Page(object):
@@ -115,8 +118,8 @@ class Page(object):
         size = page.pageSize()
         self._document = weakref.ref(page.document())
         self._pageNumber = page.pageNumber()
-        self._width = size.width() * dpix * scale / 72.0
-        self._height = size.height() * dpiy * scale / 72.0
+        self._width = int(round(size.width() * dpix * scale / 72.0))
+        self._height = int(round(size.height() * dpiy * scale / 72.0))
         self._rotation = page.rotation()
         self.magnifier = None
         
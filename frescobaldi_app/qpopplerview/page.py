@@ -28,7 +28,7 @@ try:
 except ImportError:
     from . import popplerqt4_dummy as popplerqt4
 
-from PyQt4.QtCore import QRect, QRectF, QSize
+from PyQt4.QtCore import QPointF, QRect, QRectF, QSize
 
 from . import cache
 from .locking import lock
@@ -159,27 +159,30 @@ class Page(object):
         if not update_rect:
             return
         image_rect = QRect(update_rect.topLeft() - self.rect().topLeft(), update_rect.size())
-        image = cache.image(self)
-        self._waiting = not image
-        if image:
-            painter.drawImage(update_rect, image, image_rect)
-        else:
-            # schedule an image to be generated, if done our update() method is called
-            cache.generate(self)
-            # find suitable image to be scaled from other size
-            image = cache.image(self, False)
+        missing = []
+        for tile in cache.tiles(self, image_rect):
+            part = image_rect & QRect(*tile)
+            image = cache.image(self, tile)
             if image:
-                hscale = float(image.width()) / self.width()
-                vscale = float(image.height()) / self.height()
-                image_rect = QRectF(image_rect.x() * hscale, image_rect.y() * vscale,
-                                    image_rect.width() * hscale, image_rect.height() * vscale)
-                painter.drawImage(QRectF(update_rect), image, image_rect)
+                painter.drawImage(part.translated(self.pos()), image,
+                                  part.translated(-tile[0], -tile[1]))
             else:
-                # draw blank paper, using the background color of the cache rendering (if set)
-                # or from the document itself.
-                color = (cache.options(self.document()).paperColor()
-                         or cache.options().paperColor() or self.document().paperColor())
-                painter.fillRect(update_rect, color)
+                missing.append((tile, part))
+        self._waiting = bool(missing)
+        if missing:
+            # draw blank paper, using the background color of the cache rendering (if set)
+            # or from the document itself.
+            color = (cache.options(self.document()).paperColor()
+                     or cache.options().paperColor() or self.document().paperColor())
+            offset = QPointF(self.pos())
+            for tile, part in missing:
+                painter.fillRect(part.translated(self.pos()), color)
+                # draw suitable images scaled from other size
+                for target, image, source in cache.scaled(self, part):
+                    painter.drawImage(target.translated(offset), image, source)
+            # schedule the tiles to be generated, if done our update() method is called
+            for tile, part in missing:
+                cache.generate(self, tile)
 
     def update(self):
         """Called when an image is drawn."""
@@ -190,7 +193,8 @@ class Page(object):
     def repaint(self):
         """Call this to force a repaint (e.g. when the rendering options are changed)."""
         self._waiting = True
-        cache.generate(self)
+        if self.layout():
+            self.layout().updatePage(self)
     
     def image(self, rect, xdpi=72.0, ydpi=None, options=None):
         """Returns a QImage of the specified rectangle (relative to our layout).
@@ -0,0 +1,270 @@
+# This file is part of the qpopplerview package.
+#
+# Copyright (c) 2010 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+Renders pages in a pool of worker processes.
+
+Poppler can't render different pages of one Document at the same time, so
+the cache renders the tiles of a Document one at a time in a background thread.
+If the pool size is set with setsize() and the PDF data of a Document is known
+(set with setsource()), the cache renders its tiles in parallel in worker
+processes that each load their own copy of the PDF.
+
+The workers run the renderworker module as a script in a new Python
+interpreter, started with the subprocess module. Every worker has its own
+block of shared memory, the rendered images are passed back through it.
+
+The pool needs pipes that a QSocketNotifier can watch, so it is only available
+on POSIX systems; elsewhere the tiles are always rendered in a background
+thread. The pool is also disabled when a worker exits before it has rendered
+anything, e.g. because it can't import Poppler.
+
+"""
+
+import itertools
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import weakref
+
+from PyQt4.QtCore import QSocketNotifier
+from PyQt4.QtGui import QImage
+
+from . import renderworker
+
+__all__ = ['setsize', 'size', 'setsource', 'available', 'render', 'cancel']
+
+
+_size = 0
+_pool = None
+_sources = weakref.WeakKeyDictionary()
+_ids = itertools.count()
+
+# the script the workers run
+_script = os.path.splitext(renderworker.__file__)[0] + '.py'
+
+
+def setsize(size):
+    """Sets the number of worker processes. 0 disables the pool.
+    
+    Running workers are stopped and their jobs canceled, the new workers are
+    started when needed.
+    
+    """
+    global _size, _pool
+    usable = os.name == 'posix' and os.path.exists(_script)
+    _size = max(0, size) if usable else 0
+    if _pool:
+        runners = _pool.close()
+        _pool = None
+        for runner in runners:
+            runner.cancel()
+
+
+def size():
+    """Returns the number of worker processes, 0 if the pool is disabled."""
+    return _size
+
+
+def setsource(document, data):
+    """Sets the contents of the PDF file the Poppler.Document was loaded from.
+    
+    The data (a str) is sent to the workers, that load their own Document
+    from it.
+    
+    """
+    _sources[document] = (next(_ids), data)
+
+
+def available(document):
+    """Returns True if the tiles of the Poppler.Document can be rendered in the pool."""
+    return _size > 0 and document in _sources
+
+
+def render(runner, document, job, renderHint, paperColor):
+    """Renders the tile of the Job in the pool.
+    
+    The renderHint (int) and paperColor (QColor or None) are the render options
+    to use. When the image is ready, runner.image is set and runner.slotFinished() is
+    called. If no worker is idle, the job waits for the first one that is.
+    If the job can't complete, runner.cancel() is called.
+    
+    """
+    global _pool
+    if not _pool:
+        _pool = Pool(_size)
+    docid, data = _sources[document]
+    color = paperColor.rgba() if paperColor is not None else None
+    _pool.render(runner, (docid, data, job.pageNumber, job.rotation,
+        job.width, job.height, job.tile, renderHint, color))
+
+
+def cancel(runner):
+    """Withdraws the job of the runner if it is still waiting for a worker.
+    
+    Returns True if the job was withdrawn. Otherwise it is being rendered and
+    the runner is called when it has completed.
+    
+    """
+    return bool(_pool) and _pool.cancel(runner)
+
+
+class Pool(object):
+    """Manages the worker processes."""
+    def __init__(self, size):
+        from .cache import tilesize
+        self._buffersize = tilesize * tilesize * 4
+        self._workers = [Worker(self, self._buffersize) for i in range(size)]
+        self._waiting = []
+    
+    def render(self, runner, request):
+        """Gives the request to an idle worker or queues it."""
+        for worker in self._workers:
+            if not worker.runner:
+                worker.start(runner, request)
+                return
+        self._waiting.append((runner, request))
+    
+    def cancel(self, runner):
+        """Removes the request of the runner from the queue, returns True if found."""
+        for index, (r, request) in enumerate(self._waiting):
+            if r is runner:
+                del self._waiting[index]
+                return True
+        return False
+    
+    def idle(self, worker):
+        """Called by a worker that has finished, gives it the next request."""
+        if self._waiting:
+            worker.start(*self._waiting.pop(0))
+    
+    def failed(self, worker):
+        """Called when a worker process died, replaces it with a new one."""
+        index = self._workers.index(worker)
+        worker = self._workers[index] = Worker(self, self._buffersize)
+        self.idle(worker)
+    
+    def close(self):
+        """Stops the worker processes.
+        
+        Returns the runners of the requests that were running or waiting.
+        
+        """
+        runners = [worker.runner for worker in self._workers if worker.runner]
+        runners.extend(runner for runner, request in self._waiting)
+        for worker in self._workers:
+            worker.close()
+        del self._workers[:], self._waiting[:]
+        return runners
+
+
+class Worker(object):
+    """A worker process, with pipes and a block of shared memory."""
+    def __init__(self, pool, buffersize):
+        self.pool = pool
+        self.runner = None
+        self.documents = [] # the ids of the documents the worker has open
+        self.results = 0
+        fd, self.filename = tempfile.mkstemp()
+        try:
+            os.ftruncate(fd, buffersize)
+            self.buffer = mmap.mmap(fd, buffersize)
+        finally:
+            os.close(fd)
+        self.process = subprocess.Popen(
+            [sys.executable, _script, self.filename, str(buffersize)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, close_fds=True)
+        self.notifier = QSocketNotifier(self.process.stdout.fileno(), QSocketNotifier.Read)
+        self.notifier.activated.connect(self.slotReady)
+    
+    def start(self, runner, request):
+        """Sends the request to the process.
+        
+        The PDF data is only sent if the process has not opened the document.
+        It keeps the renderworker.maxdocuments documents that were used most
+        recently.
+        
+        """
+        self.runner = runner
+        docid = request[0]
+        if docid in self.documents:
+            self.documents.remove(docid)
+            request = request[:1] + (None,) + request[2:]
+        self.documents.append(docid)
+        del self.documents[:-renderworker.maxdocuments]
+        try:
+            renderworker.send(self.process.stdin.fileno(), request)
+        except (IOError, OSError):
+            # the process died, slotReady() is called when its output closes
+            pass
+    
+    def slotReady(self):
+        """Called when the process has sent a result."""
+        try:
+            result = renderworker.receive(self.process.stdout.fileno())
+        except (EOFError, IOError, OSError):
+            runner, self.runner = self.runner, None
+            self.close()
+            if not self.results:
+                # the worker script can't run here
+                setsize(0)
+            else:
+                self.pool.failed(self)
+            if runner:
+                runner.cancel()
+            return
+        self.results += 1
+        if result is None:
+            image = QImage()
+        else:
+            width, height, bytesPerLine, format, colorTable, data = result
+            if data is None:
+                data = self.buffer[:bytesPerLine * height]
+            image = QImage(data, width, height, bytesPerLine, QImage.Format(format)).copy()
+            if colorTable:
+                image.setColorTable(colorTable)
+        runner, self.runner = self.runner, None
+        runner.image = image
+        runner.slotFinished()
+        if self.runner is None:
+            self.pool.idle(self)
+    
+    def close(self):
+        """Stops the process and waits for it to exit.
+        
+        An idle process exits when its input is closed, a busy one is
+        terminated.
+        
+        """
+        self.notifier.setEnabled(False)
+        if self.process.returncode is None:
+            self.process.stdin.close()
+            if self.runner:
+                self.process.terminate()
+            self.process.wait()
+            self.process.stdout.close()
+        try:
+            # the process normally removes the file when it has mapped it
+            os.remove(self.filename)
+        except OSError:
+            pass
+        self.runner = None
@@ -0,0 +1,167 @@
+# This file is part of the qpopplerview package.
+#
+# Copyright (c) 2010 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+A worker process of the renderpool.
+
+The renderpool module runs this file as a script in a new Python interpreter:
+
+    python renderworker.py buffer size
+
+where buffer is the name of a file of size bytes that the process maps into
+memory and deletes. The requests are read from standard input, the results are
+written to standard output, as pickled objects preceded by their length (see
+send() and receive()). The rendered images are put in the buffer if they fit.
+
+As this file runs as a script, it imports the render module directly.
+
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    import popplerqt4
+except ImportError:
+    popplerqt4 = None
+
+from PyQt4.QtCore import QByteArray
+from PyQt4.QtGui import QColor
+
+
+# the number of documents a worker keeps open
+maxdocuments = 4
+
+_length = struct.Struct('<I')
+
+
+def send(fd, obj):
+    """Writes the object to the file descriptor."""
+    data = pickle.dumps(obj, 2)
+    view = memoryview(_length.pack(len(data)) + data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def receive(fd):
+    """Reads an object written by send() from the file descriptor.
+    
+    Raises EOFError if the file descriptor is closed.
+    
+    """
+    length, = _length.unpack(_read(fd, _length.size))
+    return pickle.loads(_read(fd, length))
+
+
+def _read(fd, count):
+    """(Internal) Reads count bytes from the file descriptor."""
+    chunks = []
+    while count:
+        chunk = os.read(fd, min(count, 1048576))
+        if not chunk:
+            raise EOFError
+        chunks.append(chunk)
+        count -= len(chunk)
+    return b''.join(chunks)
+
+
+def main():
+    """Maps the buffer given on the command line and handles the requests."""
+    if popplerqt4 is None:
+        sys.exit("renderworker: can't import popplerqt4")
+    filename, size = sys.argv[1], int(sys.argv[2])
+    with open(filename, 'r+b') as f:
+        buffer = mmap.mmap(f.fileno(), size)
+    os.remove(filename)
+    # keep standard output for the results, messages go to standard error
+    output = os.dup(1)
+    os.dup2(2, 1)
+    work(0, output, buffer)
+
+
+def work(input, output, buffer):
+    """Handles requests until the input is closed or a None request is read.
+    
+    Receives requests from the input file descriptor, renders the tiles and
+    puts the images in the buffer, or sends them via the output if they do
+    not fit.
+    
+    """
+    documents = {}
+    order = []
+    while True:
+        try:
+            request = receive(input)
+        except EOFError:
+            break
+        if request is None:
+            break
+        docid, data, pageNumber, rotation, width, height, tile, hint, color = request
+        if data is not None:
+            documents[docid] = popplerqt4.Poppler.Document.loadFromData(QByteArray(data))
+        else:
+            order.remove(docid)
+        order.append(docid)
+        for old in order[:-maxdocuments]:
+            del documents[old]
+        del order[:-maxdocuments]
+        try:
+            image = renderimage(documents[order[-1]], pageNumber, rotation,
+                width, height, tile, hint, color)
+        except Exception:
+            image = None
+        if not image or image.isNull():
+            send(output, None)
+            continue
+        count = image.bytesPerLine() * image.height()
+        data = image.constBits().asstring(count)
+        if count <= len(buffer):
+            buffer[:count] = data
+            data = None
+        send(output, (image.width(), image.height(), image.bytesPerLine(),
+            int(image.format()), image.colorTable(), data))
+
+
+def renderimage(document, pageNumber, rotation, width, height, tile, hint, color):
+    """Renders the tile of a page of the Poppler.Document, returns a QImage."""
+    if hint is not None:
+        document.setRenderHint(int(document.renderHints()), False)
+        document.setRenderHint(hint)
+    if color is not None:
+        document.setPaperColor(QColor.fromRgba(color))
+    page = document.page(pageNumber)
+    pageSize = page.pageSize()
+    if rotation & 1:
+        pageSize.transpose()
+    xres = 72.0 * width / pageSize.width()
+    yres = 72.0 * height / pageSize.height()
+    x, y, w, h = tile
+    return page.renderToImage(xres, yres, x, y, w, h, rotation)
+
+
+if __name__ == '__main__':
+    main()
@@ -228,6 +228,7 @@ class Surface(QWidget):
         self.update(sum((page.rect() for page in d), QRegion()))
     
     def paintEvent(self, ev):
+        self.pageLayout().setViewport(self.viewportRect())
         painter = QPainter(self)
         pages = list(self.pageLayout().pagesAt(ev.rect()))
         for page in pages:
@@ -337,6 +338,7 @@ class Surface(QWidget):
             self.updateCursor(ev.pos())
     
     def moveEvent(self, ev):
+        self.pageLayout().setViewport(self.viewportRect())
         pos = self.mapFromGlobal(QCursor.pos())
         if self._selecting:
             self._moveSelection(pos)
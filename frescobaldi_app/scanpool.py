@@ -0,0 +1,204 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Scans files for their \\include arguments in a pool of worker processes.
+
+fileinfo.scanincludes() uses the pool to read and tokenize many files at
+once, using all processor cores, instead of one by one in the GUI thread,
+which only hands out the filenames and collects the results.
+
+The workers run the scanworker module as a script in a new Python
+interpreter, started with the subprocess module, like the render workers of
+qpopplerview. They are started when first needed and keep running until
+close() is called or the application exits.
+
+The pool waits for the results with select(), so it is only available on
+POSIX systems. It is also disabled when a worker exits before it has sent
+any result, e.g. because the script can't be run.
+
+"""
+
+from __future__ import unicode_literals
+
+import atexit
+import multiprocessing
+import os
+import select
+import subprocess
+import sys
+
+import scanworker
+
+__all__ = ['setsize', 'size', 'available', 'scan', 'close']
+
+
+_size = 0
+_pool = None
+
+# the script the workers run
+_script = os.path.splitext(scanworker.__file__)[0] + '.py'
+
+
+def setsize(size):
+    """Sets the number of worker processes. 0 disables the pool.
+    
+    If size is None, a worker is used for every processor core, but the pool
+    is disabled if there is only one core. Running workers are stopped.
+    
+    """
+    global _size
+    if size is None:
+        try:
+            size = multiprocessing.cpu_count()
+        except NotImplementedError:
+            size = 1
+        if size < 2:
+            size = 0
+    usable = os.name == 'posix' and os.path.exists(_script)
+    _size = max(0, size) if usable else 0
+    close()
+
+
+def size():
+    """Returns the number of worker processes, 0 if the pool is disabled."""
+    return _size
+
+
+def available():
+    """Returns True if the pool can be used."""
+    return _size > 0
+
+
+def scan(filenames):
+    """Scans the files in the worker processes.
+    
+    Returns a list of (filename, mtime, arguments) tuples, see scanworker.
+    mtime and arguments are None for files that could not be scanned.
+    
+    """
+    global _pool
+    if not _pool:
+        _pool = Pool(_size)
+        atexit.register(close)
+    results = _pool.scan(list(filenames))
+    if _pool.broken:
+        setsize(0)
+    return results
+
+
+def close():
+    """Stops the worker processes."""
+    global _pool
+    if _pool:
+        _pool.close()
+        _pool = None
+
+
+class Pool(object):
+    """Manages the worker processes."""
+    def __init__(self, size):
+        self._workers = [Worker() for i in range(size)]
+        self.broken = False
+    
+    def scan(self, filenames):
+        """Divides the filenames over the workers, returns all results."""
+        chunksize = max(1, min(50, len(filenames) // (4 * len(self._workers))))
+        chunks = [filenames[i:i+chunksize] for i in range(0, len(filenames), chunksize)]
+        chunks.reverse()
+        results = []
+        busy = {}
+        for worker in self._workers:
+            if chunks:
+                busy[worker] = worker.start(chunks.pop())
+        while busy:
+            for worker in select.select(list(busy), [], [])[0]:
+                chunk = busy.pop(worker)
+                try:
+                    results.extend(worker.receive())
+                except (EOFError, IOError, OSError):
+                    results.extend((filename, None, None) for filename in chunk)
+                    worker = self.failed(worker)
+                    if not worker:
+                        continue
+                if chunks:
+                    busy[worker] = worker.start(chunks.pop())
+        for chunk in chunks:
+            results.extend((filename, None, None) for filename in chunk)
+        return results
+    
+    def failed(self, worker):
+        """Called when a worker process died, replaces it with a new one.
+        
+        Returns the new worker, or None if the worker never sent a result;
+        the pool is then broken and should not be used anymore.
+        
+        """
+        worker.close()
+        index = self._workers.index(worker)
+        if not worker.results:
+            # the worker script can't run here
+            del self._workers[index]
+            self.broken = True
+            return
+        worker = self._workers[index] = Worker()
+        return worker
+    
+    def close(self):
+        """Stops the worker processes."""
+        for worker in self._workers:
+            worker.close()
+        del self._workers[:]
+
+
+class Worker(object):
+    """A worker process."""
+    def __init__(self):
+        self.results = 0
+        self.process = subprocess.Popen([sys.executable, _script],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, close_fds=True)
+    
+    def fileno(self):
+        """Returns the file descriptor the results are read from, for select()."""
+        return self.process.stdout.fileno()
+    
+    def start(self, filenames):
+        """Sends the filenames to the process, returns them."""
+        try:
+            scanworker.send(self.process.stdin.fileno(), filenames)
+        except (IOError, OSError):
+            # the process died, receive() raises EOFError
+            pass
+        return filenames
+    
+    def receive(self):
+        """Returns the results of the last request."""
+        results = scanworker.receive(self.fileno())
+        self.results += 1
+        return results
+    
+    def close(self):
+        """Stops the process and waits for it to exit."""
+        if self.process.returncode is None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process.stdout.close()
+
+
+setsize(None)
@@ -0,0 +1,110 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+A worker process of the scanpool.
+
+The scanpool module runs this file as a script in a new Python interpreter:
+
+    python scanworker.py
+
+The requests are lists of filenames, read from standard input. For every
+request a list of (filename, mtime, arguments) tuples is written to standard
+output, where arguments is the list of \\include arguments of the file (see
+fileinfo.scanincludeargs()). mtime and arguments are None if the file can't
+be read. Requests and results are pickled objects preceded by their length
+(see send() and receive()).
+
+As this file runs as a script, it imports the fileinfo module directly, so
+the files are read and tokenized exactly like in the application.
+
+"""
+
+import os
+import struct
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+
+_length = struct.Struct('<I')
+
+
+def send(fd, obj):
+    """Writes the object to the file descriptor."""
+    data = pickle.dumps(obj, 2)
+    view = memoryview(_length.pack(len(data)) + data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def receive(fd):
+    """Reads an object written by send() from the file descriptor.
+    
+    Raises EOFError if the file descriptor is closed.
+    
+    """
+    length, = _length.unpack(_read(fd, _length.size))
+    return pickle.loads(_read(fd, length))
+
+
+def _read(fd, count):
+    """(Internal) Reads count bytes from the file descriptor."""
+    chunks = []
+    while count:
+        chunk = os.read(fd, min(count, 1048576))
+        if not chunk:
+            raise EOFError
+        chunks.append(chunk)
+        count -= len(chunk)
+    return b''.join(chunks)
+
+
+def main():
+    """Handles requests until the input is closed or a None request is read."""
+    import sip
+    sip.setapi("QString", 2)
+    sip.setapi("QVariant", 2)
+    # keep standard output for the results, messages go to standard error
+    output = os.dup(1)
+    os.dup2(2, 1)
+    while True:
+        try:
+            filenames = receive(0)
+        except EOFError:
+            break
+        if filenames is None:
+            break
+        send(output, [scan(filename) for filename in filenames])
+
+
+def scan(filename):
+    """Returns the filename, its mtime and its include arguments."""
+    import fileinfo
+    try:
+        mtime = os.path.getmtime(filename)
+        return filename, mtime, fileinfo.scanincludeargs(filename)
+    except (IOError, OSError):
+        return filename, None, None
+
+
+if __name__ == '__main__':
+    main()
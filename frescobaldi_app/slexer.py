@@ -39,6 +39,20 @@ A State can be frozen to be thawn later to resume parsing text starting
 in a particular context. A Fridge can be used to store and recover a state under
 a simple integer number.
 
+A Parser class can set its dispatch attribute to True (or enableDispatch()
+can be called for it) to look at the character at the current position and
+only try the token classes that can start with that character. This yields the
+same tokens, but may be faster for Parsers with many items.
+
+A TokenArray stores a sequence of tokens in a compact way, it can reproduce the
+tokens when the original text is given.
+
+By calling enableProfiling(), State.tokens() records the time spent and the
+number of matches per Parser class, Token class and fallthrough() call in a
+Profile object. When profiling is disabled (the default), there is no overhead.
+Profiling needs Frescobaldi's profiling module; when slexer is used on its own,
+enableProfiling() raises a RuntimeError.
+
 How to use slexer:
 
 from slexer import Token, Parser, State
@@ -109,13 +123,26 @@ from __future__ import unicode_literals
 import sys
 if sys.version_info[0] < 3:
     str = unicode
+    chr = unichr
 del sys
 
 
+import array
 import re
+import sre_constants
+import sre_parse
+
+try:
+    import profiling
+except ImportError:
+    profiling = None # slexer is used without Frescobaldi
 
 
-__all__ = ['Token', 'Parser', 'FallthroughParser', 'State', 'Fridge']
+__all__ = [
+    'Token', 'Parser', 'FallthroughParser', 'State', 'Fridge', 'TokenArray',
+    'enableDispatch', 'Profile', 'enableProfiling', 'disableProfiling',
+    'profile',
+]
 
 
 class State(object):
@@ -156,7 +183,7 @@ class State(object):
             m = parser.parse(text, pos)
             if m:
                 if parser.default and pos < m.start():
-                    token =  parser.default(text[pos:m.start()], pos)
+                    token = parser.default(text[pos:m.start()], pos)
                     token.updateState(self)
                     yield token
                 token = parser.token(m)
@@ -170,6 +197,51 @@ class State(object):
             token.updateState(self)
             yield token
     
+    def _profiledTokens(self, text, pos=0):
+        """(Internal) Implementation of tokens() used by enableProfiling().
+        
+        The Profile is taken when tokens() is called, so the tokens are
+        recorded in it even if profiling is disabled before they are read.
+        
+        """
+        return self._profiledIter(text, pos, _profiler.profile())
+    
+    def _profiledIter(self, text, pos, profile):
+        """(Internal) Yields the tokens, recording the time spent in profile."""
+        timer = profiling.timer
+        while True:
+            parser = self.parser()
+            start = timer()
+            m = parser.parse(text, pos)
+            profile.parsed(parser, m, timer() - start)
+            if m:
+                if parser.default and pos < m.start():
+                    start = timer()
+                    token = parser.default(text[pos:m.start()], pos)
+                    token.updateState(self)
+                    profile.tokenized(token, timer() - start)
+                    yield token
+                start = timer()
+                token = parser.token(m)
+                token.updateState(self)
+                profile.tokenized(token, timer() - start)
+                yield token
+                pos = m.end()
+            elif pos == len(text):
+                break
+            else:
+                start = timer()
+                done = parser.fallthrough(self)
+                profile.fellthrough(parser, timer() - start)
+                if done:
+                    break
+        if parser.default and pos < len(text):
+            start = timer()
+            token = parser.default(text[pos:], pos)
+            token.updateState(self)
+            profile.tokenized(token, timer() - start)
+            yield token
+    
     def enter(self, parser):
         """Enter a new parser."""
         self.state.append(parser)
@@ -275,17 +347,110 @@ class PatternProperty(object):
         return owner.pattern
 
 
+class DispatchProperty(object):
+    """A descriptor that lazily generates a DispatchTable for a Parser class.
+    
+    Also creates a names attribute for the parser class that maps the lastgroup
+    property of a match object to the token class.
+    
+    If a DispatchTable can't be made, because it can't be determined with
+    which characters a token class can start, the dispatchTable attribute is
+    None.
+    
+    When the table is requested for the first time, it is created and also
+    written in the class, overwriting this descriptor.
+    
+    """
+    def __get__(self, instance, owner):
+        try:
+            owner.dispatchTable = self.table
+            owner.names = self.names
+        except AttributeError:
+            owner.pattern # make sure the pattern and index are created
+            clss = [cls for cls in owner.index if cls]
+            owner.names = self.names = dict(
+                ("g_{0}".format(i), cls) for i, cls in enumerate(clss))
+            try:
+                table = DispatchTable(clss, owner.pattern.flags)
+            except ValueError:
+                table = None
+            owner.dispatchTable = self.table = table
+        return owner.dispatchTable
+
+
+class DispatchTable(dict):
+    """Maps a character to a pattern with the token classes that can start with it.
+    
+    The patterns are created on first request. If no token class can start with
+    a character, a pattern is returned that never matches.
+    
+    """
+    never = re.compile('(?!)')
+    
+    def __init__(self, clss, flags=0):
+        """Analyzes the regular expressions of the token classes.
+        
+        Raises ValueError if the first character of the class is not known.
+        
+        """
+        self._clss = clss
+        self._flags = flags
+        self._firsts = [re.compile(firstchar(cls.rx, flags), flags) for cls in clss]
+        self._patterns = {}
+    
+    def __missing__(self, char):
+        key = tuple(i for i, first in enumerate(self._firsts) if first.match(char))
+        try:
+            pattern = self._patterns[key]
+        except KeyError:
+            if key:
+                pattern = re.compile("|".join(
+                    "(?P<g_{0}>{1})".format(i, self._clss[i].rx) for i in key),
+                    self._flags)
+            else:
+                pattern = self.never
+            self._patterns[key] = pattern
+        self[char] = pattern
+        return pattern
+
+
 class ParserMeta(type):
     """Metaclass for Parser subclasses.
     
-    Adds a 'pattern' attribute with a PatternProperty() when the class also
-    defines 'items'.
+    Adds a 'pattern' attribute with a PatternProperty() and a 'dispatchTable'
+    attribute with a DispatchProperty() when the class also defines 'items'.
+    Calls enableDispatch() when the class defines 'dispatch'.
     
     """
     def __new__(cls, name, bases, attrd):
         if attrd.get('items'):
             attrd['pattern'] = PatternProperty()
-        return type.__new__(cls, name, bases, attrd)
+            attrd['dispatchTable'] = DispatchProperty()
+        parser = type.__new__(cls, name, bases, attrd)
+        if 'dispatch' in attrd:
+            enableDispatch(parser, attrd['dispatch'])
+        return parser
+
+
+def enableDispatch(parser, enable=True):
+    """Enables or disables first-character dispatch for the Parser class.
+    
+    When enabled, the Parser looks at the character at the current position
+    and only tries the token classes that can start with that character, as
+    determined from their regular expressions. If there is no match at that
+    position, the full pattern is used to search further. If the token
+    classes can't be analyzed, the full pattern is always used.
+    
+    The setting is inherited by subclasses that don't change it themselves.
+    The tokens yielded are the same in both cases. Parsers that implement
+    parse() or token() themselves should not use dispatch.
+    
+    """
+    kind = '_dispatch' if enable else '_pattern'
+    parser.dispatch = enable
+    for name in ('Parse', 'Token'):
+        method = getattr(parser, kind + name)
+        setattr(parser, name.lower(), getattr(method, '__func__', method))
 
 
 class Parser(object):
@@ -303,6 +468,9 @@ class Parser(object):
     # tuple of Token classes to look for in text
     items = ()
     
+    # if True, first-character dispatch is used, see enableDispatch()
+    dispatch = False
+    
     def parse(self, text, pos):
         """Parses text from position pos and returns a Match Object or None."""
         return self.pattern.search(text, pos)
@@ -316,6 +484,26 @@ class Parser(object):
         tokenClass = self.index[matchObj.lastindex]
         return tokenClass(matchObj.group(), matchObj.start())
     
+    # the implementations used without dispatch, see enableDispatch()
+    _patternParse = parse
+    _patternToken = token
+    
+    def _dispatchParse(self, text, pos):
+        """(Internal) Implementation of parse() used by enableDispatch()."""
+        table = self.dispatchTable
+        if table is None:
+            return self.pattern.search(text, pos)
+        try:
+            m = table[text[pos]].match(text, pos)
+        except IndexError:
+            return self.pattern.search(text, pos)
+        return m or self.pattern.search(text, pos + 1)
+    
+    def _dispatchToken(self, matchObj):
+        """(Internal) Implementation of token() used by enableDispatch()."""
+        tokenClass = self.names[matchObj.lastgroup]
+        return tokenClass(matchObj.group(), matchObj.start())
+    
     def _follow(self, token, state):
         """(Internal) Called by State.follow()."""
         pass
@@ -366,6 +554,18 @@ class FallthroughParser(Parser):
         """Matches text at position pos and returns a Match Object or None."""
         return self.pattern.match(text, pos)
     
+    _patternParse = parse
+    
+    def _dispatchParse(self, text, pos):
+        """(Internal) Implementation of parse() used by enableDispatch()."""
+        table = self.dispatchTable
+        if table is None:
+            return self.pattern.match(text, pos)
+        try:
+            return table[text[pos]].match(text, pos)
+        except IndexError:
+            return self.pattern.match(text, pos)
+    
     def _follow(self, token, state):
         """(Internal) Called by State.follow()."""
         if type(token) not in self.items:
@@ -382,19 +582,33 @@ class FallthroughParser(Parser):
         state.leave()
 
 
+# the default implementation, used by disableProfiling()
+_tokens = State.__dict__['tokens']
+
+
 class Fridge(object):
-    """Stores frozen States under an integer number."""
+    """Stores frozen States under an integer number.
+    
+    The frozen states are kept in a list and indexed by a dictionary, so
+    storing a state costs a single hash lookup, regardless of the number of
+    different states that are stored. Equal frozen states are interned: they
+    are stored only once and always get the same number.
+    
+    The numbers remain valid until compact() is called.
+    
+    """
     def __init__(self, stateClass = State):
         self._stateClass = stateClass
         self._states = []
+        self._index = {}
     
     def freeze(self, state):
         """Stores a state and return an identifying integer."""
         frozen = state.freeze()
         try:
-            return self._states.index(frozen)
-        except ValueError:
-            i = len(self._states)
+            return self._index[frozen]
+        except KeyError:
+            i = self._index[frozen] = len(self._states)
             self._states.append(frozen)
             return i
 
@@ -403,9 +617,271 @@ class Fridge(object):
         if 0 <= num < len(self._states):
             return self._stateClass.thaw(self._states[num])
 
+    def frozen(self, num):
+        """Returns the (interned) frozen state stored under the specified number.
+        
+        Returns None if there is no state stored under that number.
+        
+        """
+        if 0 <= num < len(self._states):
+            return self._states[num]
+
     def count(self):
         """Returns the number of stored frozen states."""
         return len(self._states)
+    
+    def compact(self, nums):
+        """Only keeps the states with the numbers in the nums iterable.
+        
+        The remaining states are renumbered, keeping their relative order.
+        Returns a dictionary mapping the old numbers to the new ones. Numbers
+        that do not refer to a stored state are ignored.
+        
+        """
+        keep = sorted(set(n for n in nums if 0 <= n < len(self._states)))
+        states = [self._states[n] for n in keep]
+        self._states = states
+        self._index = dict((frozen, i) for i, frozen in enumerate(states))
+        return dict((n, i) for i, n in enumerate(keep))
+    
+    def clear(self):
+        """Removes all stored states."""
+        self._states = []
+        self._index = {}
+
+
+class TokenArray(object):
+    """Stores a sequence of tokens compactly.
+    
+    For every token three integers are stored in an array: the index of the
+    token class in a class table (shared by all TokenArray instances), the
+    position and the length. Token instances are only created again by the
+    tokens() method, which needs the text the tokens were parsed from.
+    
+    """
+    __slots__ = ['_data']
+    
+    _classes = []
+    _ids = {}
+    
+    def __init__(self, tokens):
+        """Stores the tokens, which should be an iterable of Token instances."""
+        classes, ids = self._classes, self._ids
+        data = []
+        for t in tokens:
+            cls = type(t)
+            try:
+                i = ids[cls]
+            except KeyError:
+                i = ids[cls] = len(classes)
+                classes.append(cls)
+            data.extend((i, t.pos, t.end - t.pos))
+        self._data = array.array(str('i'), data)
+    
+    def __len__(self):
+        return len(self._data) // 3
+    
+    def __iter__(self):
+        """Yields (tokenclass, pos, end) tuples, without creating the tokens."""
+        classes, data = self._classes, self._data
+        for i in range(0, len(data), 3):
+            pos = data[i+1]
+            yield classes[data[i]], pos, pos + data[i+2]
+    
+    def tokens(self, text):
+        """Returns a tuple with the Token instances, text is the parsed text."""
+        return tuple(cls(text[pos:end], pos) for cls, pos, end in self)
+
+
+class Profile(profiling.Profile if profiling else object):
+    """Collects timing information while parsing, see enableProfiling().
+    
+    The categories of the entries (see profiling.Profile) are:
+    
+    'parse': the calls to the parse() method of a Parser class,
+    'match': the calls to parse() that returned a match (with no time),
+    'token': the Tokens created of a Token class, with the time spent creating
+        them and calling updateState(),
+    'fallthrough': the calls to the fallthrough() method of a Parser class.
+    
+    """
+    # the maximum number of Parser, Token or Fallthrough items in report()
+    reportCount = 20
+    
+    def parsed(self, parser, match, seconds):
+        """Called after the parse() method of a Parser instance was called."""
+        self.record('parse', parser.__class__, seconds)
+        if match:
+            self.record('match', parser.__class__, 0.0)
+    
+    def tokenized(self, token, seconds):
+        """Called after a Token was created and has updated the state."""
+        self.record('token', token.__class__, seconds)
+    
+    def fellthrough(self, parser, seconds):
+        """Called after the fallthrough() method of a Parser instance was called."""
+        self.record('fallthrough', parser.__class__, seconds)
+    
+    def report(self, categories=None):
+        """Returns a text report of the most time consuming items.
+        
+        categories is a list of the categories to report ('parse', 'token'
+        and/or 'fallthrough'), by default all three are reported. At most
+        reportCount items are listed per category.
+        
+        """
+        def name(cls):
+            return cls.__module__ + '.' + cls.__name__
+        def entries(category):
+            entries = self.entries.get(category, {})
+            return [(cls, entries[cls])
+                    for cls in self.names(category)[:self.reportCount]]
+        matches = self.entries.get('match', {})
+        lines = []
+        for category in categories or ('parse', 'token', 'fallthrough'):
+            if lines:
+                lines.append("")
+            if category == 'parse':
+                lines.append("{0:50} {1:>9} {2:>9} {3:>9}".format(
+                    "Parser", "calls", "matches", "seconds"))
+                for cls, (calls, seconds) in entries('parse'):
+                    lines.append("{0:50} {1:9} {2:9} {3:9.3f}".format(
+                        name(cls), calls, matches.get(cls, (0,))[0], seconds))
+            else:
+                if category == 'token':
+                    lines.append("{0:50} {1:>9} {2:>9}".format("Token", "count", "seconds"))
+                else:
+                    lines.append("{0:50} {1:>9} {2:>9}".format("Fallthrough", "calls", "seconds"))
+                for cls, (calls, seconds) in entries(category):
+                    lines.append("{0:50} {1:9} {2:9.3f}".format(name(cls), calls, seconds))
+        return "\n".join(lines) + "\n"
+
+
+_profiler = profiling.Profiler(Profile) if profiling else None
+
+
+def enableProfiling(profile=None):
+    """Lets State.tokens() record timing information in a Profile.
+    
+    If profile is None, a new Profile is created. Returns the Profile that is
+    used. Profiling slows down parsing; use disableProfiling() to stop.
+    
+    Raises RuntimeError if Frescobaldi's profiling module is not available.
+    
+    """
+    if not _profiler:
+        raise RuntimeError("profiling is not available without the profiling module")
+    State.tokens = State.__dict__['_profiledTokens']
+    return _profiler.enable(profile)
+
+
+def disableProfiling():
+    """Stops recording timing information. Returns the Profile that was used.
+    
+    Returns None if profiling was not enabled.
+    
+    """
+    State.tokens = _tokens
+    if _profiler:
+        return _profiler.disable()
+
+
+def profile():
+    """Returns the Profile that is currently used, or None if not profiling."""
+    if _profiler:
+        return _profiler.profile()
+
+
+_sre_chars = (
+    sre_constants.LITERAL, sre_constants.NOT_LITERAL,
+    sre_constants.ANY, sre_constants.IN,
+)
+
+_sre_zero_width = (
+    sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT,
+)
+
+_sre_repeats = (
+    sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+)
+
+_sre_categories = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+
+def firstchar(rx, flags=0):
+    """Returns a regular expression matching the characters rx can start with.
+    
+    The returned expression may match more characters than rx can really
+    start with, but never less. Raises ValueError if rx can match the empty
+    string or if its first character can't be determined.
+    
+    """
+    first, empty = _firstchar(sre_parse.parse(rx, flags))
+    if empty:
+        raise ValueError("expression can match the empty string")
+    return "|".join(sorted(first))
+
+
+def _firstchar(items):
+    """(Internal) Returns a set of single-character expressions and a boolean.
+    
+    The boolean is True if the parsed items can match the empty string.
+    
+    """
+    result = set()
+    for op, av in items:
+        if op in _sre_chars:
+            result.add(_charclass(op, av))
+            return result, False
+        elif op == sre_constants.SUBPATTERN:
+            first, empty = _firstchar(av[-1])
+        elif op == sre_constants.BRANCH:
+            first, empty = set(), False
+            for branch in av[1]:
+                f, e = _firstchar(branch)
+                first |= f
+                empty = empty or e
+        elif op in _sre_repeats:
+            first, empty = _firstchar(av[2])
+            empty = empty or av[0] == 0
+        elif op in _sre_zero_width:
+            continue # may only restrict the first character
+        else:
+            raise ValueError("can't determine first character")
+        result |= first
+        if not empty:
+            return result, False
+    return result, True
+
+
+def _charclass(op, av):
+    """(Internal) Returns an expression matching the character described by op, av."""
+    if op == sre_constants.LITERAL:
+        return re.escape(chr(av))
+    elif op == sre_constants.NOT_LITERAL:
+        return "[^" + re.escape(chr(av)) + "]"
+    elif op == sre_constants.ANY:
+        return r"[\s\S]"
+    negate, parts = "", []
+    for o, a in av:
+        if o == sre_constants.NEGATE:
+            negate = "^"
+        elif o == sre_constants.LITERAL:
+            parts.append(re.escape(chr(a)))
+        elif o == sre_constants.RANGE:
+            parts.append(re.escape(chr(a[0])) + "-" + re.escape(chr(a[1])))
+        elif o == sre_constants.CATEGORY and a in _sre_categories:
+            parts.append(_sre_categories[a])
+        else:
+            raise ValueError("can't determine first character")
+    return "[" + negate + "".join(parts) + "]"
 
 
 def uniq(iterable):
@@ -0,0 +1,236 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+An index of the blocks of a document containing certain tokens.
+
+The index maps keys to the blocks that contain them. A key is either a token
+type from the types tuple, or a text from the keywords set. Use blocks() to
+find the blocks having one or more keys and tokens() to get the tokens of
+those blocks, e.g. to feed them to the functions in ly.parse.
+
+The index is updated every time the highlighter tokenizes a block, so also
+blocks that change because the parsing state of a previous block changed are
+kept up-to-date. A lookup only makes the highlighter tokenize the document up
+to the end of the searched range.
+
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+
+from PyQt4.QtGui import QTextCursor
+
+import ly.lex.lilypond
+import ly.lex.scheme
+import highlighter
+import plugin
+
+
+__all__ = ['blocks', 'tokens', 'index']
+
+
+# token types that are indexed
+types = (
+    ly.lex.lilypond.Name,
+    ly.lex.scheme.Word,
+)
+
+# token texts that are indexed
+keywords = frozenset((
+    '\\include',
+    '\\version',
+    '\\language',
+    '\\score',
+    '\\bookOutputName',
+    '\\bookOutputSuffix',
+    'output-suffix',
+    'set-global-staff-size',
+))
+
+
+def blocks(document, keys, start=None, end=None):
+    """Returns a list of the blocks containing any of the keys.
+    
+    See TokenIndex.blocks().
+    
+    """
+    return index(document).blocks(keys, start, end)
+
+
+def tokens(document, keys):
+    """Yields the tokens of the blocks containing any of the keys.
+    
+    See TokenIndex.tokens().
+    
+    """
+    return index(document).tokens(keys)
+
+
+def index(document):
+    """Returns the TokenIndex for the document."""
+    return TokenIndex.instance(document)
+
+
+def blockKeys(tokens):
+    """Returns a frozenset with the keys that are present in the tokens."""
+    keys = set()
+    for t in tokens:
+        if type(t) in types:
+            keys.add(type(t))
+        if t in keywords:
+            keys.add(t[:])
+    return frozenset(keys)
+
+
+class TokenIndex(plugin.DocumentPlugin):
+    """Maps keys to the blocks of a document that contain them.
+    
+    The keys of every block are stored in the block's userData when the
+    highlighter tokenizes it. A list with the keys of every block is kept in
+    document order, and updated when blocks are inserted or removed, so that an
+    edit only costs the handling of the changed blocks. Blocks that are not yet
+    tokenized have no keys.
+    
+    For every key that is looked up, the sorted list of the numbers of the
+    blocks having it is cached, until the keys of a block or the number of
+    blocks change.
+    
+    The highlighter may tokenize blocks before the contentsChange signal
+    reaches us. If the number of blocks changed, those blocks are remembered
+    and handled after the list has been updated.
+    
+    """
+    def __init__(self, document):
+        self._keys = []
+        self._found = {}
+        self._pending = []
+        h = highlighter.highlighter(document)
+        block = document.firstBlock()
+        while block.isValid() and h.isLexed(block):
+            keys = highlighter.userData(block).index = blockKeys(
+                highlighter.blockTokens(block))
+            self._keys.append(keys)
+            block = block.next()
+        self._keys.extend([frozenset()] * (document.blockCount() - len(self._keys)))
+        h.blockLexed.connect(self.update)
+        document.contentsChange.connect(self._contentsChange)
+    
+    def update(self, block, tokens):
+        """Called when the block is tokenized, updates the index."""
+        highlighter.userData(block).index = blockKeys(tokens)
+        if len(self._keys) == self.document().blockCount():
+            self._update(block)
+        else:
+            self._pending.append(QTextCursor(block))
+    
+    def _update(self, block):
+        """(Internal) Updates the index with the stored keys of the block."""
+        num = block.blockNumber()
+        keys = getattr(block.userData(), 'index', frozenset())
+        old = self._keys[num]
+        if keys != old:
+            self._keys[num] = keys
+            self._forget(keys ^ old)
+    
+    def _forget(self, keys):
+        """(Internal) Drops the cached block numbers of the keys."""
+        for key in keys:
+            self._found.pop(key, None)
+    
+    def _contentsChange(self, position, removed, added):
+        """Called when the document changes, updates the list of blocks."""
+        doc = self.document()
+        first = doc.findBlock(position)
+        last = doc.findBlock(position + added)
+        if not last.isValid():
+            last = doc.lastBlock()
+        count = last.blockNumber() - first.blockNumber() + 1
+        old = count - (doc.blockCount() - len(self._keys))
+        start = first.blockNumber()
+        new = []
+        block = first
+        for i in range(count):
+            new.append(getattr(block.userData(), 'index', frozenset()))
+            block = block.next()
+        if old == count:
+            for keys, oldkeys in zip(new, self._keys[start:start+old]):
+                self._forget(keys ^ oldkeys)
+        else:
+            # the following blocks have other numbers now
+            self._found.clear()
+        self._keys[start:start+old] = new
+        pending, self._pending = self._pending, []
+        for cursor in pending:
+            self._update(cursor.block())
+    
+    def _numbers(self, key):
+        """(Internal) Returns the sorted list of numbers of the blocks with the key."""
+        try:
+            return self._found[key]
+        except KeyError:
+            nums = self._found[key] = [num
+                for num, keys in enumerate(self._keys) if key in keys]
+            return nums
+    
+    def blocks(self, keys, start=None, end=None):
+        """Returns a list of the blocks containing any of the keys.
+        
+        keys can be a single key or a tuple of keys. If start is given, the
+        list begins at that block; if end is a valid block, the list ends
+        before it. The blocks are in document order.
+        
+        The document is tokenized up to the end of the range, if needed.
+        
+        """
+        if not isinstance(keys, tuple):
+            keys = keys,
+        doc = self.document()
+        last = end.previous() if end and end.isValid() else doc.lastBlock()
+        if last.isValid():
+            highlighter.highlighter(doc).ensureLexed(last)
+        startnum = start.blockNumber() if start else 0
+        endnum = end.blockNumber() if end and end.isValid() else len(self._keys)
+        found = set()
+        for key in keys:
+            nums = self._numbers(key)
+            i = bisect.bisect_left(nums, startnum)
+            found.update(nums[i:bisect.bisect_left(nums, endnum, i)])
+        return [doc.findBlockByNumber(num) for num in sorted(found)]
+    
+    def tokens(self, keys):
+        """Yields the tokens of the blocks containing any of the keys.
+        
+        The tokens of the block following every found block are also yielded,
+        so that the arguments of a command can be found if they are on the next
+        line. Every block is yielded only once.
+        
+        """
+        last = -1
+        for block in self.blocks(keys):
+            if block.blockNumber() > last:
+                for t in highlighter.blockTokens(block):
+                    yield t
+            following = block.next()
+            if following.isValid():
+                for t in highlighter.blockTokens(following):
+                    yield t
+                last = following.blockNumber()
+
@@ -41,15 +41,14 @@ import highlighter
 
 
 def tokens(block):
-    """Returns the tokens for the given block as a (possibly empty) tuple."""
-    try:
-        return highlighter.userData(block).tokens
-    except AttributeError:
-        highlighter.highlighter(block.document()).rehighlight()
-    try:
-        return highlighter.userData(block).tokens
-    except AttributeError:
-        return ()
+    """Returns the tokens for the given block as a (possibly empty) tuple.
+    
+    If the highlighter has not yet reached the block, the document is
+    tokenized up to the block first.
+    
+    """
+    highlighter.highlighter(block.document()).ensureLexed(block)
+    return highlighter.blockTokens(block)
 
 
 def state(blockOrCursor):
@@ -62,9 +61,9 @@ def state(blockOrCursor):
         block = cursortools.block(blockOrCursor)
     else:
         block = blockOrCursor
-    if block.userState() == -1:
-        highlighter.highlighter(block.document()).rehighlight()
-    return highlighter.highlighter(block.document()).state(block)
+    h = highlighter.highlighter(block.document())
+    h.ensureLexed(block.previous())
+    return h.state(block)
 
 
 def update(block):